@@ -158,52 +158,77 @@ MOCK_NUTRITION_DATA = {
         "refuse": 10.0,
         "srcCd": "01",
         "srcNm": "농촌진흥청"
+    },
+    "식용유": {
+        "foodCd": "06006001",
+        "foodNm": "콩기름",
+        "enerc": 900.0,
+        "water": 0.0,
+        "prot": 0.0,
+        "fatce": 100.0,
+        "ash": 0.0,
+        "chocdf": 0.0,
+        "sugar": 0.0,
+        "fibtg": 0.0,
+        "ca": 0.0,
+        "fe": 0.0,
+        "p": 0.0,
+        "k": 0.0,
+        "nat": 0.0,
+        "vitaRae": 0.0,
+        "retol": 0.0,
+        "cartb": 0.0,
+        "thia": 0.0,
+        "ribf": 0.0,
+        "nia": 0.0,
+        "vitc": 0.0,
+        "vitd": 0.0,
+        "chole": 0.0,
+        "fasat": 15.2,
+        "fatrn": 0.5,
+        "refuse": 0.0,
+        "srcCd": "01",
+        "srcNm": "농촌진흥청"
     }
 }
 
 
-def get_mock_api_response(food_name: str):
-    """모의 API 응답 생성"""
-    if food_name in MOCK_NUTRITION_DATA:
-        return {
-            "response": {
-                "header": {
-                    "resultCode": "00",
-                    "resultMsg": "NORMAL SERVICE."
-                },
-                "body": {
-                    "totalCount": 1,
-                    "items": [MOCK_NUTRITION_DATA[food_name]]
-                }
-            }
-        }
+def _mock_response(items):
+    """모의 API 응답 형식 생성 (항목이 없으면 NODATA_ERROR)"""
+    if items:
+        header = {"resultCode": "00", "resultMsg": "NORMAL SERVICE."}
     else:
-        return {
-            "response": {
-                "header": {
-                    "resultCode": "03",
-                    "resultMsg": "NODATA_ERROR"
-                },
-                "body": {
-                    "totalCount": 0,
-                    "items": []
-                }
-            }
-        }
-
-
-def get_mock_list_response():
-    """모의 목록 API 응답 생성"""
-    items = list(MOCK_NUTRITION_DATA.values())
+        header = {"resultCode": "03", "resultMsg": "NODATA_ERROR"}
     return {
         "response": {
-            "header": {
-                "resultCode": "00",
-                "resultMsg": "NORMAL SERVICE."
-            },
+            "header": header,
             "body": {
                 "totalCount": len(items),
                 "items": items
             }
         }
-    }
\ No newline at end of file
+    }
+
+
+def get_mock_api_response(food_name: str):
+    """모의 API 응답 생성"""
+    if food_name in MOCK_NUTRITION_DATA:
+        return _mock_response([MOCK_NUTRITION_DATA[food_name]])
+    return _mock_response([])
+
+
+def get_mock_code_response(food_code: str):
+    """모의 식품코드 검색 응답 생성"""
+    items = [item for item in MOCK_NUTRITION_DATA.values() if item["foodCd"] == food_code]
+    return _mock_response(items)
+
+
+def get_mock_list_response(page_no: int = 1, num_rows: int = None):
+    """모의 목록 API 응답 생성 (페이지 단위)"""
+    items = list(MOCK_NUTRITION_DATA.values())
+    total = len(items)
+    if num_rows:
+        items = items[(page_no - 1) * num_rows:page_no * num_rows]
+    response = _mock_response(items)
+    response["response"]["body"]["totalCount"] = total
+    return response
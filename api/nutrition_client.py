@@ -1,15 +1,26 @@
 import os
+import json
 import requests
 import logging
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
-from .mock_data import get_mock_api_response, get_mock_list_response
+from urllib3.util import Timeout
+from .mock_data import get_mock_api_response, get_mock_code_response, get_mock_list_response
+from utils.tracing import tracer
+from utils import deadline
+from utils.deadline import DeadlineExceeded
 
 # 환경변수 로드
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 정상 응답 코드 (03: 조회 결과 없음은 빈 결과로 처리)
+RESULT_CODES_OK = ('00', '03')
+
+# 응답 본문을 읽을 때 요청 기한을 확인하는 단위 (bytes)
+BODY_CHUNK_SIZE = 16 * 1024
+
 
 class NutritionAPIClient:
     """공공데이터포털 통합식품영양성분정보 API 클라이언트"""
@@ -29,6 +40,68 @@ class NutritionAPIClient:
         if not self.use_mock and not self.service_key:
             raise ValueError("SERVICE_KEY 환경변수가 설정되지 않았습니다. 또는 USE_MOCK_DATA=true로 설정하세요.")
     
+    def _get(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """API GET 요청 후 JSON 응답 반환 (요청별 트레이싱 스팬 기록)"""
+        attributes = {'http.method': 'GET', 'http.url': self.base_url}
+        for key in ('foodNm', 'foodCd', 'pageNo', 'numOfRows'):
+            if key in params:
+                attributes[f'api.{key}'] = params[key]
+        
+        with tracer.start_span('NutritionAPIClient.request', attributes) as span:
+            # 요청 기한이 있으면 남은 시간만큼만 대기 (기한이 지났으면 조회하지 않고 DeadlineExceeded)
+            timeout = deadline.bounded_timeout(self.timeout)
+            span.set_attribute('http.timeout', round(timeout, 3))
+            try:
+                # requests의 timeout은 소켓 작업 단위이므로 연결~응답 헤더는 urllib3 total로,
+                # 본문은 청크 단위로 읽으며 기한을 확인해 호출 전체 시간을 제한
+                with requests.get(
+                    self.base_url,
+                    params=params,
+                    timeout=Timeout(total=timeout),
+                    stream=True
+                ) as response:
+                    span.set_attribute('http.status_code', response.status_code)
+                    response.raise_for_status()
+                    data = json.loads(self._read_body(response))
+            except requests.exceptions.Timeout:
+                if deadline.expired():
+                    span.set_attribute('deadline.exceeded', True)
+                    raise DeadlineExceeded("공공데이터 API 응답을 요청 기한 내에 받지 못했습니다.")
+                raise
+            
+            header = self._get_header(data)
+            span.set_attribute('api.result_code', header.get('resultCode'))
+            
+            # API 에러 체크
+            if header and header.get('resultCode') not in RESULT_CODES_OK:
+                error_msg = f"API 에러: {header.get('resultMsg', '알 수 없는 에러')} ({header.get('resultCode')})"
+                span.set_error(error_msg)
+                logger.error(error_msg)
+                raise Exception(error_msg)
+            
+            return data
+    
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytes:
+        """응답 본문을 청크 단위로 읽으며 요청 기한 확인
+        
+        Raises:
+            DeadlineExceeded: 본문 수신 중 기한이 지난 경우
+        """
+        chunks = []
+        for chunk in response.iter_content(chunk_size=BODY_CHUNK_SIZE):
+            chunks.append(chunk)
+            if deadline.expired():
+                raise DeadlineExceeded("공공데이터 API 응답 본문을 요청 기한 내에 받지 못했습니다.")
+        return b''.join(chunks)
+    
+    @staticmethod
+    def _get_header(data: Any) -> Dict[str, Any]:
+        """응답 헤더 추출 (response > header 또는 최상위 header)"""
+        if not isinstance(data, dict):
+            return {}
+        return data.get('response', data).get('header') or {}
+    
     def search_food_by_name(self, food_name: str, num_rows: Optional[int] = None) -> Dict[str, Any]:
         """식품명으로 영양성분 정보 검색
         
@@ -53,25 +126,7 @@ class NutritionAPIClient:
         }
         
         try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            # JSON 응답 파싱
-            data = response.json()
-            
-            # API 에러 체크
-            if 'response' in data and 'header' in data['response']:
-                header = data['response']['header']
-                if header.get('resultCode') != '00':
-                    error_msg = f"API 에러: {header.get('resultMsg', '알 수 없는 에러')}"
-                    logger.error(error_msg)
-                    raise Exception(error_msg)
-            
-            return data
+            return self._get(params)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP 요청 실패: {e}")
@@ -89,6 +144,11 @@ class NutritionAPIClient:
         Returns:
             API 응답 데이터
         """
+        # Mock 모드일 경우 모의 데이터 반환
+        if self.use_mock:
+            logger.info(f"Mock 모드: 식품코드 '{food_code}' 검색")
+            return get_mock_code_response(food_code)
+        
         params = {
             'serviceKey': self.service_key,
             'pageNo': '1',
@@ -98,22 +158,7 @@ class NutritionAPIClient:
         }
         
         try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # API 에러 체크
-            if 'header' in data and data['header'].get('resultCode') != '00':
-                error_msg = f"API 에러: {data['header'].get('resultMsg', '알 수 없는 에러')}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            
-            return data
+            return self._get(params)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP 요청 실패: {e}")
@@ -132,6 +177,11 @@ class NutritionAPIClient:
         Returns:
             API 응답 데이터
         """
+        # Mock 모드일 경우 모의 데이터 반환
+        if self.use_mock:
+            logger.info(f"Mock 모드: 전체 목록 조회 (page {page_no})")
+            return get_mock_list_response(page_no, num_rows)
+        
         params = {
             'serviceKey': self.service_key,
             'pageNo': str(page_no),
@@ -140,22 +190,7 @@ class NutritionAPIClient:
         }
         
         try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # API 에러 체크
-            if 'header' in data and data['header'].get('resultCode') != '00':
-                error_msg = f"API 에러: {data['header'].get('resultMsg', '알 수 없는 에러')}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            
-            return data
+            return self._get(params)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP 요청 실패: {e}")
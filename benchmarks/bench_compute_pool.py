@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+계산 프로세스 풀 벤치마크
+합성 재료 스냅샷에 대한 유사 재료 검색 처리량을 작업 프로세스 수별로 측정하고
+직접 계산(풀 없음) 대비 속도 향상과 병렬 효율을 비교합니다.
+
+사용법:
+    python benchmarks/bench_compute_pool.py [재료 수] [질의 수]
+"""
+
+import sys
+import os
+import time
+import random
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.mock_data import MOCK_NUTRITION_DATA
+from services.ingredient_index import IngredientIndex
+from utils.compute_pool import ComputePool
+
+NUMERIC_FIELDS = [key for key, value in MOCK_NUTRITION_DATA["계란"].items() if isinstance(value, float)]
+
+
+def synthetic_items(count: int, seed: int = 7):
+    """모의 재료 값을 흔들어 만든 합성 재료 목록"""
+    rng = random.Random(seed)
+    templates = list(MOCK_NUTRITION_DATA.values())
+    items = []
+    for i in range(count):
+        item = dict(templates[i % len(templates)])
+        for key in NUMERIC_FIELDS:
+            item[key] = round(item.get(key, 0.0) * rng.uniform(0.5, 1.5), 3)
+        item['foodCd'] = f"S{i:07d}"
+        item['foodNm'] = f"합성 재료 {i}"
+        items.append(item)
+    return items
+
+
+def measure(index: IngredientIndex, queries, pool=None) -> float:
+    """질의 전체 처리 시간(초)"""
+    start = time.perf_counter()
+    for position in queries:
+        index.search(index.raw[position], k=10, exclude=position, pool=pool)
+    return time.perf_counter() - start
+
+
+def main():
+    """벤치마크 실행"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    cpus = os.cpu_count() or 1
+
+    index = IngredientIndex(synthetic_items(count))
+    queries = random.Random(11).sample(range(count), min(query_count, count))
+
+    print("계산 프로세스 풀 벤치마크 (유사 재료 검색)")
+    print(f"재료 {count}개, 질의 {len(queries)}개, CPU {cpus}개")
+    print("=" * 60)
+
+    baseline = measure(index, queries)
+    expected = [index.search(index.raw[position], k=10, exclude=position) for position in queries[:3]]
+    print(f"직접 계산          : {len(queries) / baseline:8.2f} 질의/초")
+
+    worker_counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))) or [1]
+    single = None
+    for workers in worker_counts:
+        pool = ComputePool(workers)
+        pool.start()
+        try:
+            # 공유 메모리 기록과 청크 크기 측정을 위한 준비 질의
+            measure(index, queries[:3], pool)
+            results = [index.search(index.raw[position], k=10, exclude=position, pool=pool) for position in queries[:3]]
+            assert results == expected, "프로세스 풀 검색 결과가 직접 계산과 다릅니다."
+            elapsed = measure(index, queries, pool)
+        finally:
+            pool.shutdown()
+
+        single = single or elapsed
+        speedup = single / elapsed
+        print(
+            f"작업 프로세스 {workers:2d}개 : {len(queries) / elapsed:8.2f} 질의/초, "
+            f"직접 계산 대비 x{baseline / elapsed:.2f}, 1개 대비 x{speedup:.2f} (효율 {speedup / workers * 100:.0f}%)"
+        )
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+재료 영양성분 모델 생성 벤치마크
+NutritionInfo(Pydantic)와 내부 계산용 IngredientNutrients(__slots__)의
+생성 시간 및 메모리 할당량을 비교합니다.
+"""
+
+import sys
+import os
+import timeit
+import tracemalloc
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.mock_data import MOCK_NUTRITION_DATA
+from models.schemas import NutritionInfo
+from models.records import IngredientNutrients
+
+ITEM = MOCK_NUTRITION_DATA["계란"]
+RECORD = IngredientNutrients.from_api_item(ITEM)
+NUMBER = 20000
+ALLOC_COUNT = 10000
+
+
+def build_pydantic():
+    return NutritionInfo(**ITEM)
+
+
+def build_record_from_api():
+    return IngredientNutrients.from_api_item(ITEM)
+
+
+def build_record_trusted():
+    return IngredientNutrients(RECORD.food_code, RECORD.food_name, RECORD.refuse_rate, RECORD.values())
+
+
+def measure_allocation(factory):
+    """객체를 ALLOC_COUNT개 유지했을 때 할당된 메모리와 할당 블록 수"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(ALLOC_COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del objects
+    return size / ALLOC_COUNT, blocks / ALLOC_COUNT
+
+
+def main():
+    """벤치마크 실행"""
+    print("재료 영양성분 모델 생성 벤치마크")
+    print("=" * 60)
+
+    cases = [
+        ("NutritionInfo(**item)", build_pydantic),
+        ("IngredientNutrients.from_api_item", build_record_from_api),
+        ("IngredientNutrients (검증 없음)", build_record_trusted),
+    ]
+
+    baseline = None
+    for name, factory in cases:
+        seconds = min(timeit.repeat(factory, number=NUMBER, repeat=5)) / NUMBER
+        bytes_per_object, blocks_per_object = measure_allocation(factory)
+        if baseline is None:
+            baseline = seconds
+
+        print(f"{name}")
+        print(f"  - 생성 시간: {seconds * 1e6:.2f} µs ({baseline / seconds:.1f}x)")
+        print(f"  - 객체당 메모리: {bytes_per_object:.0f} bytes")
+        print(f"  - 객체당 할당 블록: {blocks_per_object:.1f}")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+응답 페이로드 벤치마크
+응답 압축(gzip/brotli)과 fields / detail=false 축소 옵션별 전송 크기와
+서버 처리 시간(인프로세스 TestClient 기준)을 비교합니다.
+"""
+
+import sys
+import os
+import time
+import statistics
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('USE_MOCK_DATA', 'true')
+
+from fastapi.testclient import TestClient
+
+import main
+from utils.compression import brotli
+
+REPEAT = 200
+
+PATHS = [
+    ("계산 (전체)", "/calculate-nutrition/도시락/300"),
+    ("계산 (detail=false)", "/calculate-nutrition/도시락/300?detail=false"),
+    ("계산 (fields=energy,protein)", "/calculate-nutrition/도시락/300?fields=energy,protein"),
+    ("계산 (fields + detail=false)", "/calculate-nutrition/도시락/300?fields=energy,protein&detail=false"),
+    ("음식 목록 (limit=1000)", "/foods?limit=1000"),
+]
+
+ENCODINGS = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+
+
+def measure(client: TestClient, path: str, encoding: str):
+    """전송 크기(bytes)와 중앙값 응답 시간(ms)"""
+    headers = {"Accept-Encoding": encoding}
+    response = client.get(path, headers=headers)
+    size = int(response.headers.get("content-length", len(response.content)))
+
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        client.get(path, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+    return size, statistics.median(timings)
+
+
+def main_bench():
+    """벤치마크 실행"""
+    client = TestClient(main.app)
+    # 프로필 캐시 준비
+    client.get(PATHS[0][1])
+
+    print("응답 페이로드 벤치마크")
+    print(f"(압축 최소 크기 {os.getenv('COMPRESSION_MIN_SIZE', '500')} bytes, brotli {'사용 가능' if brotli else '미설치'})")
+    print("=" * 72)
+
+    baseline_size, baseline_ms = measure(client, PATHS[0][1], "identity")
+    for name, path in PATHS:
+        print(name)
+        for encoding in ENCODINGS:
+            size, ms = measure(client, path, encoding)
+            saved = (1 - size / baseline_size) * 100 if path.startswith("/calculate") else None
+            saved_text = f", 전체 비압축 대비 {saved:.1f}% 절감" if saved is not None else ""
+            print(f"  - {encoding:8s}: {size:7d} bytes, {ms:6.2f} ms{saved_text}")
+
+    print("=" * 72)
+    print(f"기준 (계산 전체, identity): {baseline_size} bytes, {baseline_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -2,6 +2,7 @@ import { useState, useEffect } from 'react';
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import axios from 'axios';
 import { Search, Calculator, Info, ChevronDown, ChevronUp } from 'lucide-react';
+import { useLiveNutrition } from './hooks/useNutrition';
 
 const queryClient = new QueryClient();
 
@@ -65,12 +66,35 @@ function NutritionCalculator() {
   const [error, setError] = useState<string>('');
   const [showSavedResults, setShowSavedResults] = useState(false);
   const [showIngredientDetails, setShowIngredientDetails] = useState(false);
+  const live = useLiveNutrition();
 
-  // 페이지 로드 시 사용 가능한 음식 목록 가져오기
+  // 계산 결과가 있으면 중량 변경은 실시간 계산 채널로 반영 (바뀐 값만 수신)
+  const changeWeight = (value: number) => {
+    setWeight(value);
+    if (nutritionData && value > 0) {
+      live.send({ food_name: nutritionData.food_name, weight_grams: value });
+    }
+  };
+
+  useEffect(() => {
+    if (live.result) {
+      setNutritionData(live.result as NutritionData);
+    }
+  }, [live.result]);
+
+  // 페이지 로드 시 사용 가능한 음식 목록 가져오기 (X-Next-Cursor로 전체 페이지 조회)
   const fetchAvailableFoods = async () => {
     try {
-      const response = await axios.get('http://localhost:8000/foods');
-      setAvailableFoods(response.data);
+      const foods: string[] = [];
+      let cursor: string | undefined;
+      do {
+        const response = await axios.get('http://localhost:8000/foods', {
+          params: { limit: 1000, cursor },
+        });
+        foods.push(...response.data);
+        cursor = response.headers['x-next-cursor'] || undefined;
+      } while (cursor);
+      setAvailableFoods(foods);
     } catch (error) {
       console.error('음식 목록 가져오기 실패:', error);
     }
@@ -196,7 +220,7 @@ function NutritionCalculator() {
               <input
                 type="number"
                 value={weight}
-                onChange={(e) => setWeight(Number(e.target.value))}
+                onChange={(e) => changeWeight(Number(e.target.value))}
                 min="1"
                 className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-primary-500 focus:border-transparent"
               />
@@ -1,20 +1,26 @@
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { nutritionApi } from '../services/api';
-import type { NutritionCalculationRequest } from '../types';
+import type {
+  CalculatedNutrition,
+  NutritionCalculationRequest,
+  FoodListParams,
+  LiveCalculationUpdate
+} from '../types';
 
 // Query keys
 const QUERY_KEYS = {
-  foods: ['foods'] as const,
+  foods: (params: FoodListParams) => ['foods', 'list', params] as const,
   foodComposition: (name: string) => ['foods', name] as const,
   nutrition: (request: NutritionCalculationRequest) => ['nutrition', request] as const,
   health: ['health'] as const,
 };
 
 // Hook for fetching available foods
-export const useFoods = () => {
+export const useFoods = (params: FoodListParams = {}) => {
   return useQuery({
-    queryKey: QUERY_KEYS.foods,
-    queryFn: nutritionApi.getFoodList,
+    queryKey: QUERY_KEYS.foods(params),
+    queryFn: () => nutritionApi.getFoodList(params),
     staleTime: 5 * 60 * 1000, // 5 minutes
   });
 };
@@ -53,4 +59,53 @@ export const useHealthCheck = () => {
     refetchInterval: 30 * 1000, // 30 seconds
     retry: 1,
   });
-};
\ No newline at end of file
+};
+
+// 변경분(diff)을 이전 결과에 병합 (null은 삭제, 중첩 객체는 재귀 병합)
+const mergeLiveResult = (base: Record<string, any>, diff: Record<string, any>): Record<string, any> => {
+  const merged = { ...base };
+  Object.entries(diff).forEach(([key, value]) => {
+    if (value === null) {
+      delete merged[key];
+    } else if (typeof value === 'object' && !Array.isArray(value) && typeof merged[key] === 'object') {
+      merged[key] = mergeLiveResult(merged[key], value);
+    } else {
+      merged[key] = value;
+    }
+  });
+  return merged;
+};
+
+// Hook for live recalculation over the /ws/calculate channel
+export const useLiveNutrition = () => {
+  const [state, setState] = useState<Record<string, any> | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const channel = useRef<ReturnType<typeof nutritionApi.openLiveCalculation> | null>(null);
+
+  useEffect(() => {
+    channel.current = nutritionApi.openLiveCalculation((message) => {
+      if (message.type === 'error') {
+        setError(message.message);
+        return;
+      }
+      setError(null);
+      setState((previous) => (message.full || !previous ? message.data : mergeLiveResult(previous, message.data)));
+    });
+    return () => channel.current?.close();
+  }, []);
+
+  const send = useCallback((update: LiveCalculationUpdate) => channel.current?.send(update), []);
+
+  // 구성요소별 상세는 재료명 기준 객체로 전송되므로 배열로 복원
+  const result = useMemo<CalculatedNutrition | null>(() => state && {
+    ...(state as CalculatedNutrition),
+    composition_details: state.composition_details
+      ? Object.entries(state.composition_details).map(([ingredient_name, detail]) => ({
+          ingredient_name,
+          ...(detail as Record<string, number>),
+        })) as CalculatedNutrition['composition_details']
+      : undefined,
+  }, [state]);
+
+  return { result, error, send };
+};
@@ -2,7 +2,11 @@ import axios from 'axios';
 import type { 
   NutritionResponse, 
   NutritionCalculationRequest, 
-  ComplexFood 
+  ComplexFood,
+  FoodListParams,
+  FoodListPage,
+  LiveCalculationUpdate,
+  LiveCalculationMessage
 } from '../types';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
@@ -52,10 +56,18 @@ export const nutritionApi = {
     return response.data;
   },
 
-  // 등록된 음식 목록 조회
-  async getFoodList(): Promise<string[]> {
-    const response = await apiClient.get('/foods');
-    return response.data;
+  // 등록된 음식 목록 조회 (커서 페이지)
+  async getFoodList(params: FoodListParams = {}): Promise<FoodListPage> {
+    const response = await apiClient.get('/foods', {
+      params,
+      paramsSerializer: { indexes: null }, // nutrient_range=a&nutrient_range=b
+    });
+    const total = response.headers['x-total-count'];
+    return {
+      items: response.data,
+      nextCursor: response.headers['x-next-cursor'] || undefined,
+      total: total !== undefined ? Number(total) : undefined,
+    };
   },
 
   // 특정 음식의 구성요소 정보 조회
@@ -78,6 +90,27 @@ export const nutritionApi = {
     return response.data;
   },
 
+  // 실시간 계산 채널 연결 (입력 변경을 보내면 바뀐 결과만 수신)
+  openLiveCalculation(onMessage: (message: LiveCalculationMessage) => void) {
+    const socket = new WebSocket(`${API_BASE_URL.replace(/^http/, 'ws')}/ws/calculate`);
+    const pending: string[] = [];
+    socket.onopen = () => pending.splice(0).forEach((message) => socket.send(message));
+    socket.onmessage = (event) => onMessage(JSON.parse(event.data));
+    return {
+      send(update: LiveCalculationUpdate) {
+        const message = JSON.stringify(update);
+        if (socket.readyState === WebSocket.OPEN) {
+          socket.send(message);
+        } else {
+          pending.push(message);
+        }
+      },
+      close() {
+        socket.close();
+      },
+    };
+  },
+
   // 개별 재료의 영양성분 정보 조회
   async getIngredientNutrition(ingredientName: string) {
     const response = await apiClient.get(`/ingredients/${encodeURIComponent(ingredientName)}`);
@@ -37,6 +37,7 @@ export interface FoodComposition {
   percentage: number;
   unit: string;
   preparation?: string;
+  is_dish?: boolean;
 }
 
 export interface ComplexFood {
@@ -92,6 +93,38 @@ export interface NutritionCalculationRequest {
   weight_grams: number;
 }
 
+// 실시간 계산 채널 (/ws/calculate) 입력 — 지정한 값만 세션 상태에 반영
+export interface LiveCalculationUpdate {
+  food_name?: string;
+  weight_grams?: number;
+  quantity?: number;
+  unit?: string;
+  apply_refuse?: boolean;
+  apply_cooking?: boolean;
+  fields?: string[];
+  detail?: boolean;
+  compositions?: Array<Pick<FoodComposition, 'ingredient_name' | 'percentage' | 'preparation' | 'is_dish'>>;
+}
+
+// 실시간 계산 채널 출력 — full이 아니면 data는 직전 결과 대비 바뀐 값만 포함 (null은 삭제)
+export type LiveCalculationMessage =
+  | { type: 'result'; seq: number; full: boolean; data: Record<string, any> }
+  | { type: 'error'; message: string };
+
+export interface FoodListParams {
+  prefix?: string;
+  ingredient?: string;
+  nutrient_range?: string[]; // "energy:100:300" (최소/최대 생략 가능)
+  limit?: number;
+  cursor?: string;
+}
+
+export interface FoodListPage {
+  items: string[];
+  nextCursor?: string;
+  total?: number;
+}
+
 // UI State Types
 export interface FoodSelection {
   id: string;
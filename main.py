@@ -1,17 +1,55 @@
 import os
+import json
+import time
+import asyncio
 import logging
-from typing import List
-from fastapi import FastAPI, HTTPException
+from typing import Any, Dict, List, Optional, Set
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 
 from models.schemas import (
     NutritionCalculationRequest,
     NutritionResponse,
     ErrorResponse,
-    ComplexFood
+    ComplexFood,
+    MealEntry,
+    MealPlanRequest,
+    MealPlanSummary,
+    NutrientQueryRequest,
+    NutrientQueryResponse,
+    RecipeOptimizationRequest,
+    RecipeOptimizationResponse,
+    SimilarIngredientResponse,
+    DishServings,
+    JobRequest,
+    JobStatus,
+    LiveCalculationUpdate,
+    IngredientChangeFeed
 )
-from services.nutrition_service import NutritionCalculationService
+from pydantic import ValidationError
+from services.nutrition_service import NutritionCalculationService, NUTRIENT_KEYS
+from models.records import NUTRIENT_REGISTRY
+from services.meal_plan import MealPlanService
+from services.nutrient_query import NutrientQueryService
+from services.recipe_optimizer import RecipeOptimizer
+from services.ingredient_index import IngredientIndexService
+from services.food_listing import FoodListingService, parse_nutrient_range
+from services.serving_table import ServingTableService
+from services.quantity import QuantityError
+from services.job_runner import JobQueueFull, create_job_runner
+from services.background_jobs import register_jobs
+from services.live_calculation import LiveCalculationSession, LiveCalculationError
+from utils.tracing import tracer
+from utils.profiling import StackSampler, profiling
+from utils.compression import CompressionMiddleware, compression_enabled, compression_settings
+from utils.traffic_recorder import TrafficRecordingMiddleware, create_traffic_recorder
+from utils.admission import AdmissionMiddleware, create_admission_controller
+from utils.compute_pool import create_compute_pool
+from utils import deadline
+from utils.deadline import DeadlineExceeded, request_deadline
 
 # 환경변수 로드
 load_dotenv()
@@ -23,6 +61,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# CPU 집약 계산용 프로세스 풀 (COMPUTE_POOL_WORKERS>0일 때만 사용)
+# fork 방식은 다른 스레드가 생기기 전에 작업 프로세스를 만들도록 가장 먼저 시작
+compute_pool = create_compute_pool()
+if compute_pool is not None:
+    compute_pool.start()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="통합식품영양성분 계산 API",
@@ -32,6 +76,12 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# 요청 수용 제어 미들웨어 (ADMISSION_CONTROL_ENABLED=true일 때만 등록)
+# CORS보다 먼저 등록해 503 응답에도 CORS 헤더가 붙도록 함
+admission_controller = create_admission_controller()
+if admission_controller is not None:
+    app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+
 # CORS 미들웨어 추가
 app.add_middleware(
     CORSMiddleware,
@@ -39,10 +89,97 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "Retry-After", "ETag"],
 )
 
+# 응답 압축 미들웨어 (Accept-Encoding 협상, 최소 크기 이상만 압축)
+if compression_enabled():
+    app.add_middleware(CompressionMiddleware, **compression_settings())
+
+# 트래픽 기록 미들웨어 (TRAFFIC_RECORD_ENABLED=true일 때만 등록)
+traffic_recorder = create_traffic_recorder()
+if traffic_recorder is not None:
+    app.add_middleware(TrafficRecordingMiddleware, recorder=traffic_recorder)
+
+# 트레이싱 미들웨어 (TRACING_ENABLED=true일 때만 등록)
+if tracer.enabled:
+    @app.middleware("http")
+    async def tracing_middleware(request: Request, call_next):
+        """요청 단위 루트 스팬 생성 (핸들러, 응답 직렬화 포함)"""
+        with tracer.start_span(
+            f"{request.method} {request.url.path}",
+            {'http.method': request.method, 'http.target': request.url.path}
+        ) as span:
+            response = await call_next(request)
+            route = request.scope.get('route')
+            if route is not None:
+                span.set_attribute('http.route', route.path)
+            span.set_attribute('http.status_code', response.status_code)
+            return response
+
+
+# 요청 단위 프로파일링 미들웨어 (PROFILING_ENABLED=true일 때만 등록)
+if profiling.enabled:
+    @app.middleware("http")
+    async def profiling_middleware(request: Request, call_next):
+        """X-Profile 헤더가 있는 관리자 요청만 샘플링 프로파일 수집
+
+        X-Profile: store  - 프로파일을 저장하고 X-Profile-Id 헤더로 ID 반환
+        X-Profile: return - 원래 응답 대신 collapsed stack 텍스트 반환
+        """
+        mode = request.headers.get('x-profile')
+        if not mode or not profiling.is_authorized(request.headers.get('x-profile-token')):
+            return await call_next(request)
+        
+        # 계산/조회는 스레드 풀에서 실행되므로 전체 스레드의 프로젝트 코드 스택 수집 (동시 요청 스택이 섞일 수 있음)
+        sampler = StackSampler(project_only=True, interval=profiling.interval)
+        sampler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            sampler.stop()
+        
+        if mode.lower() == 'return':
+            return PlainTextResponse(sampler.collapsed(), headers={'X-Profile-Samples': str(sampler.sample_count)})
+        
+        profile_id = profiling.save(sampler, f"{request.method} {request.url.path}")
+        response.headers['X-Profile-Id'] = profile_id
+        response.headers['X-Profile-Samples'] = str(sampler.sample_count)
+        return response
+
+
 # 영양성분 계산 서비스 초기화
 nutrition_service = NutritionCalculationService()
+meal_plan_service = MealPlanService(nutrition_service)
+nutrient_query_service = NutrientQueryService(nutrition_service)
+recipe_optimizer = RecipeOptimizer(nutrition_service, compute_pool)
+ingredient_index_service = IngredientIndexService(nutrition_service, compute_pool)
+food_listing_service = FoodListingService(nutrition_service, nutrient_query_service)
+serving_table_service = ServingTableService(nutrition_service)
+
+
+def _requests_waiting() -> bool:
+    """요청이 대기 중이거나 계산 슬롯이 모두 사용 중인지 여부 (백그라운드 작업 양보 기준)"""
+    if admission_controller is None:
+        return False
+    compute = admission_controller.limiters.get('compute')
+    if compute is not None and compute.active >= compute.concurrency:
+        return True
+    return any(limiter.waiters for limiter in admission_controller.limiters.values())
+
+
+# 백그라운드 작업 실행기 (재시작 전 대기 중이던 작업은 다시 실행)
+job_runner = create_job_runner(pressure=_requests_waiting)
+register_jobs(job_runner, nutrition_service, nutrient_query_service, serving_table_service, ingredient_index_service)
+job_runner.recover()
+
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    job_runner.shutdown()
+    nutrition_service.ingredient_versions.close()
+    if compute_pool is not None:
+        compute_pool.shutdown()
 
 
 @app.get("/", tags=["기본"])
@@ -56,6 +193,12 @@ async def root():
             "docs": "/docs",
             "foods": "/foods",
             "calculate": "/calculate-nutrition",
+            "live_calculate": "/ws/calculate",
+            "servings": "/servings",
+            "meal_plans": "/meal-plans",
+            "jobs": "/jobs",
+            "ingredient_changes": "/ingredients/changes",
+            "nutrient_query": "/query/nutrient-targets",
             "health": "/health"
         }
     }
@@ -71,15 +214,88 @@ async def health_check():
     }
 
 
+@app.get("/health/admission", tags=["기본"])
+async def admission_metrics():
+    """요청 수용 제어 클래스별 처리/대기/거부 지표"""
+    if admission_controller is None:
+        return {"enabled": False}
+    return {"enabled": True, "classes": admission_controller.metrics()}
+
+
+@app.get("/health/compute", tags=["기본"])
+async def compute_pool_metrics():
+    """계산 프로세스 풀 설정 및 작업 종류별 행당 처리 시간"""
+    if compute_pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **compute_pool.metrics()}
+
+
 @app.get("/foods", response_model=List[str], tags=["음식 정보"])
-async def get_available_foods():
-    """등록된 복합식품 목록 조회"""
+async def get_available_foods(
+    response: Response,
+    prefix: Optional[str] = Query(None, description="음식명 접두어"),
+    ingredient: Optional[str] = Query(None, description="포함 재료 (하위 음식 포함)"),
+    nutrient_range: Optional[List[str]] = Query(None, description="100g당 영양성분 범위 (영양성분:최소:최대, 예: energy::200)"),
+    limit: int = Query(100, gt=0, le=1000, description="최대 반환 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값")
+):
+    """등록된 복합식품 목록 조회 (이름순 커서 페이지)
+    
+    다음 페이지 커서는 X-Next-Cursor 헤더, 필터가 접두어뿐인 경우 전체 개수는 X-Total-Count 헤더로 반환합니다.
+    """
     try:
-        foods = nutrition_service.get_available_foods()
-        return foods
+        ranges = [parse_nutrient_range(expression) for expression in nutrient_range or []]
+        page = await run_in_threadpool(
+            food_listing_service.list_foods,
+            prefix=prefix,
+            ingredient=ingredient,
+            nutrient_ranges=ranges,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"음식 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="음식 목록 조회에 실패했습니다.")
+    
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+    if page.total is not None:
+        response.headers['X-Total-Count'] = str(page.total)
+    return page.items
+
+
+@app.get("/servings", tags=["음식 정보"])
+async def get_serving_table(if_none_match: Optional[str] = Header(None)):
+    """전체 음식의 표준 제공량(100g, 1인분, 150g, 200g) 영양성분 표 일괄 다운로드
+    
+    표가 바뀌지 않았으면 If-None-Match에 대해 304를 반환합니다.
+    """
+    try:
+        version, body = await run_in_threadpool(serving_table_service.get_bulk)
+    except Exception as e:
+        logger.error(f"제공량 표 생성 실패: {e}")
+        raise HTTPException(status_code=500, detail="제공량 표 생성에 실패했습니다.")
+    
+    etag = f'W/"servings-{version}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/servings/{food_name}", response_model=DishServings, tags=["음식 정보"])
+async def get_dish_servings(food_name: str):
+    """특정 음식의 표준 제공량별 영양성분"""
+    try:
+        servings = await run_in_threadpool(serving_table_service.get_servings, food_name)
+    except Exception as e:
+        logger.error(f"제공량 표 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="제공량 표 조회에 실패했습니다.")
+    
+    if not servings:
+        raise HTTPException(status_code=404, detail=f"'{food_name}' 음식 정보를 찾을 수 없습니다.")
+    return servings
 
 
 @app.get("/foods/{food_name}", response_model=ComplexFood, tags=["음식 정보"])
@@ -100,21 +316,85 @@ async def get_food_composition(food_name: str):
         raise HTTPException(status_code=500, detail="음식 구성요소 조회에 실패했습니다.")
 
 
-@app.post("/calculate-nutrition", response_model=NutritionResponse, tags=["영양성분 계산"])
-async def calculate_nutrition(request: NutritionCalculationRequest):
-    """영양성분 계산"""
+@app.post("/foods/{food_name}/optimize", response_model=RecipeOptimizationResponse, tags=["음식 정보"])
+async def optimize_food_composition(food_name: str, request: RecipeOptimizationRequest):
+    """영양성분 목표에 맞춘 구성 비율 최적화"""
     try:
-        logger.info(f"영양성분 계산 요청: {request.food_name} ({request.weight_grams}g)")
-        
-        # 요청 검증
-        if request.weight_grams <= 0:
-            raise HTTPException(
-                status_code=400,
-                detail="중량은 0보다 큰 값이어야 합니다."
-            )
+        result = await run_in_threadpool(recipe_optimizer.optimize, food_name, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"구성 비율 최적화 실패: {e}")
+        raise HTTPException(status_code=500, detail="구성 비율 최적화에 실패했습니다.")
+    
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"'{food_name}' 음식 정보를 찾을 수 없습니다."
+        )
+    return result
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """fields 쿼리(쉼표 구분 영양성분)를 집합으로 변환 (미지정 시 None)"""
+    if fields is None:
+        return None
+    selected = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = selected - set(NUTRIENT_REGISTRY)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 영양성분입니다: {', '.join(sorted(unknown))}"
+        )
+    disabled = selected - set(NUTRIENT_KEYS)
+    if disabled:
+        raise HTTPException(
+            status_code=400,
+            detail=f"계산 대상(NUTRIENTS 설정)에 포함되지 않은 영양성분입니다: {', '.join(sorted(disabled))}"
+        )
+    return selected
+
+
+def _shape_nutrition_response(response: NutritionResponse, fields: Optional[Set[str]], detail: bool):
+    """요청한 영양성분과 구성요소별 상세 포함 여부에 맞춰 응답 축소"""
+    dropped = set(NUTRIENT_REGISTRY) - (fields if fields is not None else set(NUTRIENT_KEYS))
+    if response.data is None or (not dropped and detail):
+        return response
+    
+    data_exclude: Dict[str, Any] = {key: True for key in dropped}
+    if not detail:
+        data_exclude['composition_details'] = True
+    elif dropped:
+        data_exclude['composition_details'] = {'__all__': dropped}
+    
+    return JSONResponse(content=response.model_dump(mode='json', exclude={'data': data_exclude}))
+
+
+def _calculate_nutrition(
+    request: NutritionCalculationRequest,
+    fields: Optional[Set[str]] = None,
+    detail: bool = True
+) -> NutritionResponse:
+    """영양성분 계산 및 응답 생성 (fields/detail로 계산할 영양성분과 상세 포함 여부 지정)
+    
+    재료 조회(공공데이터 API)와 계산이 블로킹되므로 run_in_threadpool로 호출합니다.
+    """
+    try:
+        # 요청 검증 및 수량/단위 환산
+        try:
+            weight_grams = nutrition_service.resolve_weight(request)
+        except QuantityError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        logger.info(f"영양성분 계산 요청: {request.food_name} ({weight_grams}g)")
         
-        # 영양성분 계산
-        result = nutrition_service.calculate_nutrition(request)
+        # 영양성분 계산 (보정 없는 표준 제공량이면 미리 계산된 제공량 표 사용)
+        corrected = request.apply_refuse or request.apply_cooking
+        result = (
+            (None if corrected else serving_table_service.lookup(request.food_name, weight_grams))
+            or nutrition_service.calculate_nutrition(request, fields, detail)
+        )
+        if result and request.quantity is not None and result.quantity is None:
+            result = result.model_copy(update={'quantity': request.quantity, 'unit': request.unit})
         
         if not result:
             return NutritionResponse(
@@ -125,11 +405,21 @@ async def calculate_nutrition(request: NutritionCalculationRequest):
         
         logger.info(f"영양성분 계산 완료: {request.food_name} - {result.energy}kcal")
         
-        return NutritionResponse(
-            success=True,
-            message="영양성분 계산이 성공적으로 완료되었습니다.",
-            data=result
-        )
+        if result.deadline_exceeded:
+            message = f"요청 기한 내에 조회하지 못한 재료를 제외한 부분 결과입니다: {', '.join(result.missing_ingredients)}"
+        elif result.partial:
+            message = f"영양성분을 조회하지 못한 재료를 제외한 부분 결과입니다: {', '.join(result.missing_ingredients)}"
+        elif result.coverage and result.coverage.degraded:
+            message = "일부 재료는 만료된 캐시 또는 로컬 스냅샷 데이터로 계산했습니다."
+        else:
+            message = "영양성분 계산이 성공적으로 완료되었습니다."
+        
+        with tracer.start_span('calculate_nutrition.build_response'):
+            return NutritionResponse(
+                success=True,
+                message=message,
+                data=result
+            )
         
     except HTTPException:
         raise
@@ -141,22 +431,176 @@ async def calculate_nutrition(request: NutritionCalculationRequest):
         )
 
 
-@app.get("/calculate-nutrition/{food_name}/{weight_grams}", response_model=NutritionResponse, tags=["영양성분 계산"])
-async def calculate_nutrition_get(food_name: str, weight_grams: float):
+@app.post("/calculate-nutrition", response_model=NutritionResponse, tags=["영양성분 계산"],
+          dependencies=[Depends(request_deadline())])
+async def calculate_nutrition(
+    request: NutritionCalculationRequest,
+    fields: Optional[str] = Query(None, description="반환할 영양성분 (쉼표 구분, 예: energy,protein)"),
+    detail: bool = Query(True, description="구성요소별 상세(composition_details) 포함 여부")
+):
+    """영양성분 계산"""
+    selected = _parse_fields(fields)
+    result = await run_in_threadpool(_calculate_nutrition, request, selected, detail)
+    return _shape_nutrition_response(result, selected, detail)
+
+
+@app.get("/calculate-nutrition/{food_name}/{weight_grams}", response_model=NutritionResponse, tags=["영양성분 계산"],
+         dependencies=[Depends(request_deadline())])
+async def calculate_nutrition_get(
+    food_name: str,
+    weight_grams: float,
+    unit: Optional[str] = Query(None, description="지정 시 경로의 값을 해당 단위 수량으로 해석 (예: ml, serving, 개)"),
+    apply_refuse: bool = Query(False, description="재료 폐기율 적용 (가식부 기준)"),
+    apply_cooking: bool = Query(False, description="조리 상태별 중량 변화율/영양성분 잔존율 적용"),
+    fields: Optional[str] = Query(None, description="반환할 영양성분 (쉼표 구분, 예: energy,protein)"),
+    detail: bool = Query(True, description="구성요소별 상세(composition_details) 포함 여부")
+):
     """GET 방식 영양성분 계산 (간편 사용)"""
-    request = NutritionCalculationRequest(
-        food_name=food_name,
-        weight_grams=weight_grams
-    )
-    return await calculate_nutrition(request)
+    if weight_grams <= 0:
+        raise HTTPException(status_code=400, detail="중량은 0보다 큰 값이어야 합니다.")
+    corrections = {'apply_refuse': apply_refuse, 'apply_cooking': apply_cooking}
+    if unit:
+        request = NutritionCalculationRequest(food_name=food_name, quantity=weight_grams, unit=unit, **corrections)
+    else:
+        request = NutritionCalculationRequest(food_name=food_name, weight_grams=weight_grams, **corrections)
+    selected = _parse_fields(fields)
+    result = await run_in_threadpool(_calculate_nutrition, request, selected, detail)
+    return _shape_nutrition_response(result, selected, detail)
 
 
-@app.get("/ingredients/{ingredient_name}", tags=["재료 정보"])
+# 실시간 계산 채널 설정
+LIVE_DEBOUNCE_MS = float(os.getenv('LIVE_DEBOUNCE_MS', '50'))
+LIVE_MAX_SESSIONS = int(os.getenv('LIVE_MAX_SESSIONS', '200'))
+_live_sessions = 0
+
+
+async def _collect_live_updates(queue: asyncio.Queue, not_before: float) -> List[Optional[str]]:
+    """다음 계산에 반영할 메시지 모음 (연결 종료는 None)
+    
+    직전 계산 후 LIVE_DEBOUNCE_MS가 지났으면 이미 도착한 메시지만 모아 바로 처리하고,
+    아니면 그 시각(not_before)까지 도착하는 메시지를 모아 한 번만 계산합니다.
+    """
+    batch = [await queue.get()]
+    while batch[-1] is not None:
+        remaining = not_before - time.monotonic()
+        if remaining <= 0:
+            if queue.empty():
+                break
+            batch.append(queue.get_nowait())
+            continue
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _run_live_session(websocket: WebSocket):
+    """연결된 실시간 계산 채널의 입력 수신/계산 루프 (연결 종료 시 반환)"""
+    session = LiveCalculationSession(nutrition_service)
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def receive_messages():
+        try:
+            while True:
+                queue.put_nowait(await websocket.receive_text())
+        except WebSocketDisconnect:
+            queue.put_nowait(None)
+    
+    receiver = asyncio.create_task(receive_messages())
+    calculated_at = 0.0
+    try:
+        while True:
+            batch = await _collect_live_updates(queue, calculated_at + LIVE_DEBOUNCE_MS / 1000.0)
+            messages = [message for message in batch if message is not None]
+            
+            errors = []
+            for message in messages:
+                try:
+                    session.apply(LiveCalculationUpdate.model_validate(json.loads(message)))
+                except (ValueError, ValidationError) as e:
+                    # ValidationError / JSONDecodeError / LiveCalculationError
+                    errors.append(str(e))
+            for error in errors:
+                await websocket.send_json({'type': 'error', 'message': error})
+            
+            if len(errors) < len(messages):
+                try:
+                    if session.needs_profile():
+                        await run_in_threadpool(session.load_profile)
+                    await websocket.send_json(session.calculate())
+                    calculated_at = time.monotonic()
+                except LiveCalculationError as e:
+                    await websocket.send_json({'type': 'error', 'message': str(e)})
+            
+            if len(messages) < len(batch):
+                break
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"실시간 계산 채널 오류: {e}")
+        await websocket.close(code=1011)
+    finally:
+        receiver.cancel()
+
+
+@app.websocket("/ws/calculate")
+async def live_calculation(websocket: WebSocket):
+    """실시간 영양성분 계산 채널
+    
+    클라이언트가 음식/중량/옵션/구성요소 변경을 JSON으로 보내면 연속된 입력을 모아
+    한 번만 계산하고, 직전 결과 대비 바뀐 값만 보냅니다.
+    """
+    global _live_sessions
+    if _live_sessions >= LIVE_MAX_SESSIONS:
+        # 1013: Try Again Later
+        await websocket.close(code=1013)
+        return
+    
+    # accept()가 실패해도(핸드셰이크 중 연결 종료 등) 연결 수가 줄어들도록 증가 직후부터 finally로 감쌈
+    _live_sessions += 1
+    try:
+        await websocket.accept()
+        await _run_live_session(websocket)
+    finally:
+        _live_sessions -= 1
+
+
+@app.post("/query/nutrient-targets", response_model=NutrientQueryResponse, tags=["영양성분 계산"])
+async def query_nutrient_targets(request: NutrientQueryRequest):
+    """영양성분 목표를 만족하는 음식/재료와 중량 범위 조회"""
+    try:
+        return await run_in_threadpool(nutrient_query_service.query, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"영양성분 목표 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="영양성분 목표 조회에 실패했습니다.")
+
+
+@app.get("/ingredients/changes", response_model=IngredientChangeFeed, tags=["재료 정보"])
+async def get_ingredient_changes(
+    since: int = Query(0, ge=0, description="이 순번 이후의 변경만 조회"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 결과 수")
+):
+    """재료 데이터 변경 피드 (바뀐 식품코드별 이전/새 값과 영향받는 음식)"""
+    versions = nutrition_service.ingredient_versions
+    changes = versions.changes(since, limit)
+    return {
+        "changes": [change._asdict() for change in changes],
+        "next_since": changes[-1].seq if changes else since,
+        "last_seq": versions.last_seq()
+    }
+
+
+@app.get("/ingredients/{ingredient_name}", tags=["재료 정보"], dependencies=[Depends(request_deadline())])
 async def get_ingredient_nutrition(ingredient_name: str):
     """개별 재료의 영양성분 정보 조회"""
     try:
-        nutrition = nutrition_service.get_ingredient_nutrition(ingredient_name)
+        nutrition = await run_in_threadpool(nutrition_service.get_ingredient_nutrition, ingredient_name)
         
+        if not nutrition and deadline.expired():
+            raise DeadlineExceeded(f"'{ingredient_name}' 재료를 요청 기한 내에 조회하지 못했습니다.")
         if not nutrition:
             raise HTTPException(
                 status_code=404,
@@ -171,6 +615,8 @@ async def get_ingredient_nutrition(ingredient_name: str):
         
     except HTTPException:
         raise
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"재료 영양성분 조회 실패: {e}")
         raise HTTPException(
@@ -179,6 +625,172 @@ async def get_ingredient_nutrition(ingredient_name: str):
         )
 
 
+@app.post("/meal-plans", response_model=MealPlanSummary, tags=["식단"], dependencies=[Depends(request_deadline())])
+async def create_meal_plan(request: MealPlanRequest):
+    """식단 생성 (항목별 영양성분, 끼니별 소계, 1일 기준치 대비 비교)"""
+    try:
+        return await run_in_threadpool(meal_plan_service.create_plan, request.entries)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"식단 생성 실패: {e}")
+        raise HTTPException(status_code=500, detail="식단 생성에 실패했습니다.")
+
+
+@app.get("/meal-plans/{plan_id}", response_model=MealPlanSummary, tags=["식단"])
+async def get_meal_plan(plan_id: str):
+    """식단 조회"""
+    summary = meal_plan_service.get_plan(plan_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail=f"'{plan_id}' 식단을 찾을 수 없습니다.")
+    return summary
+
+
+@app.post("/meal-plans/{plan_id}/entries", response_model=MealPlanSummary, tags=["식단"],
+          dependencies=[Depends(request_deadline())])
+async def add_meal_plan_entry(plan_id: str, entry: MealEntry):
+    """식단 항목 추가 (추가된 항목만 합계에 반영)"""
+    try:
+        summary = await run_in_threadpool(meal_plan_service.add_entry, plan_id, entry)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"식단 항목 추가 실패: {e}")
+        raise HTTPException(status_code=500, detail="식단 항목 추가에 실패했습니다.")
+    
+    if not summary:
+        raise HTTPException(status_code=404, detail=f"'{plan_id}' 식단을 찾을 수 없습니다.")
+    return summary
+
+
+@app.delete("/meal-plans/{plan_id}/entries/{entry_id}", response_model=MealPlanSummary, tags=["식단"])
+async def remove_meal_plan_entry(plan_id: str, entry_id: str):
+    """식단 항목 삭제 (삭제된 항목만 합계에서 차감)"""
+    summary = meal_plan_service.remove_entry(plan_id, entry_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail=f"'{plan_id}' 식단 또는 '{entry_id}' 항목을 찾을 수 없습니다.")
+    return summary
+
+
+@app.delete("/meal-plans/{plan_id}", tags=["식단"])
+async def delete_meal_plan(plan_id: str):
+    """식단 삭제"""
+    if not meal_plan_service.delete_plan(plan_id):
+        raise HTTPException(status_code=404, detail=f"'{plan_id}' 식단을 찾을 수 없습니다.")
+    return {"success": True, "message": f"'{plan_id}' 식단이 삭제되었습니다."}
+
+
+@app.get("/ingredients/{ingredient_name}/similar", response_model=SimilarIngredientResponse, tags=["재료 정보"])
+async def get_similar_ingredients(
+    ingredient_name: str,
+    k: int = Query(5, ge=1, le=100, description="반환할 결과 수"),
+    metric: str = Query("euclidean", description="거리 척도 (euclidean, manhattan, cosine)"),
+    nutrients: Optional[List[str]] = Query(None, description="거리 계산에 사용할 영양성분"),
+    lower: Optional[List[str]] = Query(None, description="질의 재료보다 낮아야 하는 영양성분"),
+    higher: Optional[List[str]] = Query(None, description="질의 재료보다 높아야 하는 영양성분")
+):
+    """영양성분이 유사한 재료 검색 (대체 재료 찾기)"""
+    try:
+        result = await run_in_threadpool(
+            ingredient_index_service.find_similar, ingredient_name, k, metric, nutrients, lower, higher
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"유사 재료 검색 실패: {e}")
+        raise HTTPException(status_code=500, detail="유사 재료 검색에 실패했습니다.")
+    
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"'{ingredient_name}' 재료의 영양성분 정보를 찾을 수 없습니다."
+        )
+    return result
+
+
+def _require_admin_token(x_profile_token: Optional[str] = Header(None)):
+    """작업 API 관리자 토큰 확인 (PROFILING_TOKEN과 일치하지 않거나 미설정 시 403)"""
+    if not profiling.is_admin(x_profile_token):
+        raise HTTPException(status_code=403, detail="작업 API 권한이 없습니다.")
+
+
+@app.post("/jobs", response_model=JobStatus, status_code=202, tags=["작업"],
+          dependencies=[Depends(_require_admin_token)])
+async def submit_job(request: JobRequest):
+    """백그라운드 작업 등록 (재료 재조회, 프로필 재계산, 재료 데이터셋 동기화)"""
+    try:
+        return job_runner.submit(request.kind, request.params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+
+
+@app.get("/jobs", response_model=List[JobStatus], tags=["작업"], dependencies=[Depends(_require_admin_token)])
+async def list_jobs(
+    status: Optional[str] = Query(None, description="상태 필터 (queued, running, succeeded, failed, cancelled)"),
+    limit: int = Query(50, ge=1, le=500, description="최대 결과 수")
+):
+    """최근 등록된 작업 목록"""
+    return job_runner.list(status, limit)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus, tags=["작업"], dependencies=[Depends(_require_admin_token)])
+async def get_job(job_id: str):
+    """작업 상태 및 진행률 조회"""
+    job = job_runner.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"'{job_id}' 작업을 찾을 수 없습니다.")
+    return job
+
+
+@app.post("/jobs/{job_id}/cancel", response_model=JobStatus, tags=["작업"],
+          dependencies=[Depends(_require_admin_token)])
+async def cancel_job(job_id: str):
+    """작업 취소 (실행 중인 작업은 다음 진행률 보고 시점에 중단)"""
+    job = job_runner.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"'{job_id}' 작업을 찾을 수 없습니다.")
+    return job
+
+
+def _require_profiling_token(token: Optional[str]):
+    """프로파일링 비활성화 시 404, 관리자 토큰 불일치 시 403"""
+    if not profiling.enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not profiling.is_authorized(token):
+        raise HTTPException(status_code=403, detail="프로파일링 권한이 없습니다.")
+
+
+@app.get("/debug/profile", response_class=PlainTextResponse, include_in_schema=False)
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0, description="수집 시간(초)"),
+    x_profile_token: Optional[str] = Header(None)
+):
+    """워커 전체 스레드의 wall-clock 프로파일 수집 (collapsed stack 형식)"""
+    _require_profiling_token(x_profile_token)
+    if seconds > profiling.max_seconds:
+        raise HTTPException(
+            status_code=400,
+            detail=f"수집 시간은 최대 {profiling.max_seconds:g}초입니다."
+        )
+    
+    sampler = StackSampler(interval=profiling.interval)
+    await run_in_threadpool(sampler.run_for, seconds)
+    logger.info(f"워커 프로파일 수집 완료: {sampler.duration:.1f}초, {sampler.sample_count}회 샘플링")
+    return PlainTextResponse(sampler.collapsed(), headers={'X-Profile-Samples': str(sampler.sample_count)})
+
+
+@app.get("/debug/profiles/{profile_id}", response_class=PlainTextResponse, include_in_schema=False)
+async def get_stored_profile(profile_id: str, x_profile_token: Optional[str] = Header(None)):
+    """저장된 요청 프로파일 조회"""
+    _require_profiling_token(x_profile_token)
+    content = profiling.load(profile_id)
+    if content is None:
+        raise HTTPException(status_code=404, detail=f"'{profile_id}' 프로파일을 찾을 수 없습니다.")
+    return PlainTextResponse(content)
+
+
 # 예외 처리 핸들러
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
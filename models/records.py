@@ -0,0 +1,126 @@
+import os
+import logging
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NutrientSpec(NamedTuple):
+    """계산 가능한 영양성분 (key: NutritionInfo 필드명, alias: API 응답 필드명)"""
+    key: str
+    alias: str
+    unit: str
+    label: str
+
+
+# 계산 가능한 전체 영양성분 (NutritionInfo의 100g당 함량 필드)
+NUTRIENT_REGISTRY: Dict[str, NutrientSpec] = {spec.key: spec for spec in (
+    NutrientSpec('energy', 'enerc', 'kcal', '에너지'),
+    NutrientSpec('protein', 'prot', 'g', '단백질'),
+    NutrientSpec('fat', 'fatce', 'g', '지방'),
+    NutrientSpec('carbohydrate', 'chocdf', 'g', '탄수화물'),
+    NutrientSpec('sugar', 'sugar', 'g', '당류'),
+    NutrientSpec('dietary_fiber', 'fibtg', 'g', '식이섬유'),
+    NutrientSpec('calcium', 'ca', 'mg', '칼슘'),
+    NutrientSpec('iron', 'fe', 'mg', '철'),
+    NutrientSpec('sodium', 'nat', 'mg', '나트륨'),
+    NutrientSpec('potassium', 'k', 'mg', '칼륨'),
+    NutrientSpec('vitamin_a', 'vitaRae', 'μg RAE', '비타민 A'),
+    NutrientSpec('vitamin_c', 'vitc', 'mg', '비타민 C'),
+    NutrientSpec('water', 'water', 'g', '수분'),
+    NutrientSpec('ash', 'ash', 'g', '회분'),
+    NutrientSpec('phosphorus', 'p', 'mg', '인'),
+    NutrientSpec('retinol', 'retol', 'μg', '레티놀'),
+    NutrientSpec('beta_carotene', 'cartb', 'μg', '베타카로틴'),
+    NutrientSpec('thiamine', 'thia', 'mg', '티아민'),
+    NutrientSpec('riboflavin', 'ribf', 'mg', '리보플라빈'),
+    NutrientSpec('niacin', 'nia', 'mg', '니아신'),
+    NutrientSpec('vitamin_d', 'vitd', 'μg', '비타민 D'),
+    NutrientSpec('cholesterol', 'chole', 'mg', '콜레스테롤'),
+    NutrientSpec('saturated_fat', 'fasat', 'g', '포화지방산'),
+    NutrientSpec('trans_fat', 'fatrn', 'g', '트랜스지방산'),
+)}
+
+
+# 기본 계산 영양성분 (나머지 등록 영양성분은 NUTRIENTS로 지정해야 계산)
+DEFAULT_NUTRIENTS: Tuple[str, ...] = (
+    'energy', 'protein', 'fat', 'carbohydrate', 'sugar', 'dietary_fiber',
+    'calcium', 'iron', 'sodium', 'potassium', 'vitamin_a', 'vitamin_c'
+)
+
+
+def _enabled_nutrients() -> Tuple[str, ...]:
+    """NUTRIENTS 환경변수(쉼표 구분, all이면 등록된 전체)로 계산할 영양성분 선택
+
+    미지정 시 DEFAULT_NUTRIENTS를 사용하며, 결과는 등록 순서를 유지합니다.
+    """
+    configured = os.getenv('NUTRIENTS', '').strip()
+    if not configured:
+        return DEFAULT_NUTRIENTS
+    if configured.lower() == 'all':
+        return tuple(NUTRIENT_REGISTRY)
+    selected = {key.strip() for key in configured.split(',') if key.strip()}
+    unknown = selected - set(NUTRIENT_REGISTRY)
+    if unknown:
+        logger.warning(f"등록되지 않은 영양성분은 무시합니다: {', '.join(sorted(unknown))}")
+    return tuple(key for key in NUTRIENT_REGISTRY if key in selected)
+
+
+# 계산에 사용하는 영양성분 (NutritionInfo 필드명, 프로필/벡터의 열 순서)
+NUTRIENT_KEYS = _enabled_nutrients()
+
+# 계산용 필드명 → API 응답 필드명 (NutritionInfo alias와 동일)
+NUTRIENT_ALIASES = {key: spec.alias for key, spec in NUTRIENT_REGISTRY.items()}
+
+
+def _to_float(value: Any) -> float:
+    """API 응답 값을 실수로 변환 (누락/빈 값은 0)"""
+    if value is None or value == '':
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class IngredientNutrients:
+    """내부 계산용 재료 영양성분 레코드 (100g 기준)
+
+    NutritionInfo의 35개 필드 중 계산에 사용하는 영양성분(NUTRIENT_KEYS)만 고정 슬롯으로 보관합니다.
+    Pydantic 모델은 `/ingredients/{name}` 응답을 만들 때만 생성합니다.
+    """
+
+    __slots__ = ('food_code', 'food_name', 'refuse_rate') + NUTRIENT_KEYS
+
+    def __init__(self, food_code: Optional[str], food_name: Optional[str], refuse_rate: float, values: Tuple[float, ...]):
+        """검증 없이 생성 (캐시 등 신뢰할 수 있는 데이터 전용)
+
+        Args:
+            values: NUTRIENT_KEYS 순서의 100g당 영양성분
+        """
+        self.food_code = food_code
+        self.food_name = food_name
+        self.refuse_rate = refuse_rate
+        for key, value in zip(NUTRIENT_KEYS, values):
+            setattr(self, key, value)
+
+    @classmethod
+    def from_api_item(cls, item: Dict[str, Any]) -> 'IngredientNutrients':
+        """API 응답 항목에서 생성 (값을 실수로 변환)"""
+        return cls(
+            item.get('foodCd'),
+            item.get('foodNm'),
+            _to_float(item.get('refuse')),
+            tuple(_to_float(item.get(NUTRIENT_ALIASES[key])) for key in NUTRIENT_KEYS)
+        )
+
+    def values(self) -> Tuple[float, ...]:
+        """NUTRIENT_KEYS 순서의 영양성분 튜플"""
+        return tuple(getattr(self, key) for key in NUTRIENT_KEYS)
+
+    def as_dict(self) -> Dict[str, float]:
+        """{영양성분: 100g당 값}"""
+        return {key: getattr(self, key) for key in NUTRIENT_KEYS}
+
+    def __repr__(self) -> str:
+        return f"IngredientNutrients(food_code={self.food_code!r}, food_name={self.food_name!r})"
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, Optional, List, Dict, Any
 from decimal import Decimal
 
 
@@ -66,13 +66,16 @@ class FoodComposition(BaseModel):
     ingredient_name: str = Field(description="재료명")
     percentage: float = Field(description="구성 비율 (0-100%)")
     unit: str = Field(default="g", description="단위")
+    is_dish: bool = Field(default=False, description="다른 복합식품 참조 여부")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "ingredient_name": "감자",
                 "percentage": 60.0,
-                "unit": "g"
+                "unit": "g",
+                "is_dish": False
             }
         }
 
@@ -83,8 +86,10 @@ class ComplexFood(BaseModel):
     food_name: str = Field(description="음식명")
     compositions: List[FoodComposition] = Field(description="구성요소 리스트")
     total_weight: float = Field(default=100.0, description="총 중량(g)")
+    serving_weight: Optional[float] = Field(default=None, description="1인분 중량(g)")
     
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "food_name": "감자샐러드",
@@ -102,7 +107,13 @@ class NutritionCalculationRequest(BaseModel):
     """영양성분 계산 요청 모델"""
     
     food_name: str = Field(description="음식명")
-    weight_grams: float = Field(gt=0, description="중량(g)")
+    weight_grams: Optional[float] = Field(default=None, gt=0, description="중량(g)")
+    quantity: Optional[float] = Field(
+        default=None, gt=0, description="수량 (weight_grams 대신 unit 단위로 지정, 예: 1 serving, 200 ml)"
+    )
+    unit: str = Field(default="g", description="quantity 단위 (g, kg, ml, cup, tbsp, piece/개, serving/인분 등)")
+    apply_refuse: bool = Field(default=False, description="재료 폐기율 적용 (가식부 기준)")
+    apply_cooking: bool = Field(default=False, description="조리 상태별 중량 변화율/영양성분 잔존율 적용")
     
     class Config:
         json_schema_extra = {
@@ -113,11 +124,32 @@ class NutritionCalculationRequest(BaseModel):
         }
 
 
+class IngredientCoverage(BaseModel):
+    """재료별 데이터 출처 모델"""
+    
+    ingredient_name: str = Field(description="재료명")
+    weight_percent: float = Field(description="음식 중량 대비 비중(%)")
+    source: Optional[str] = Field(
+        default=None,
+        description="영양성분 출처 (fresh: API 조회, cache: 캐시, stale: 만료된 캐시, snapshot: 로컬 스냅샷, 없으면 누락)"
+    )
+
+
+class NutritionCoverage(BaseModel):
+    """계산 결과의 데이터 완전성 모델"""
+    
+    covered_weight_percent: float = Field(description="영양성분이 반영된 재료의 중량 비중(%)")
+    degraded: bool = Field(default=False, description="만료된 캐시 또는 스냅샷 데이터 사용 여부")
+    ingredients: List[IngredientCoverage] = Field(default_factory=list, description="재료별 출처")
+
+
 class CalculatedNutrition(BaseModel):
     """계산된 영양성분 모델"""
     
     food_name: str = Field(description="음식명")
     weight_grams: float = Field(description="중량(g)")
+    quantity: Optional[float] = Field(default=None, description="요청 수량 (단위 지정 시)")
+    unit: Optional[str] = Field(default=None, description="요청 수량 단위 (단위 지정 시)")
     
     # 주요 영양성분
     energy: Optional[float] = Field(default=None, description="에너지(kcal)")
@@ -137,9 +169,29 @@ class CalculatedNutrition(BaseModel):
     vitamin_a: Optional[float] = Field(default=None, description="비타민 A(μg RAE)")
     vitamin_c: Optional[float] = Field(default=None, description="비타민 C(mg)")
     
+    # 추가 영양성분 (NUTRIENTS 설정 또는 fields 요청에 포함된 경우)
+    water: Optional[float] = Field(default=None, description="수분(g)")
+    ash: Optional[float] = Field(default=None, description="회분(g)")
+    phosphorus: Optional[float] = Field(default=None, description="인(mg)")
+    retinol: Optional[float] = Field(default=None, description="레티놀(μg)")
+    beta_carotene: Optional[float] = Field(default=None, description="베타카로틴(μg)")
+    thiamine: Optional[float] = Field(default=None, description="티아민(mg)")
+    riboflavin: Optional[float] = Field(default=None, description="리보플라빈(mg)")
+    niacin: Optional[float] = Field(default=None, description="니아신(mg)")
+    vitamin_d: Optional[float] = Field(default=None, description="비타민 D(μg)")
+    cholesterol: Optional[float] = Field(default=None, description="콜레스테롤(mg)")
+    saturated_fat: Optional[float] = Field(default=None, description="포화지방산(g)")
+    trans_fat: Optional[float] = Field(default=None, description="트랜스지방산(g)")
+    
     # 구성요소별 상세 정보
     composition_details: Optional[List[Dict[str, Any]]] = Field(default=None, description="구성요소별 영양성분")
     
+    # 부분 결과 표시
+    partial: bool = Field(default=False, description="일부 재료가 누락된 부분 결과 여부")
+    missing_ingredients: List[str] = Field(default_factory=list, description="영양성분을 조회하지 못한 재료")
+    deadline_exceeded: bool = Field(default=False, description="요청 기한 초과로 조회를 중단했는지 여부")
+    coverage: Optional[NutritionCoverage] = Field(default=None, description="재료별 데이터 출처 및 반영 비중")
+    
     class Config:
         json_encoders = {
             float: lambda v: round(v, 2) if v is not None else None
@@ -195,4 +247,344 @@ class ErrorResponse(BaseModel):
                 "message": "해당 음식을 찾을 수 없습니다.",
                 "details": "데이터베이스에 '감자샐러드' 정보가 없습니다."
             }
-        }
\ No newline at end of file
+        }
+
+class MealEntry(BaseModel):
+    """식단 항목 모델"""
+    
+    food_name: str = Field(description="음식명")
+    weight_grams: Optional[float] = Field(default=None, gt=0, description="중량(g)")
+    quantity: Optional[float] = Field(default=None, gt=0, description="수량 (weight_grams 대신 unit 단위로 지정)")
+    unit: str = Field(default="g", description="quantity 단위 (g, ml, piece/개, serving/인분 등)")
+    apply_refuse: bool = Field(default=False, description="재료 폐기율 적용 (가식부 기준)")
+    apply_cooking: bool = Field(default=False, description="조리 상태별 중량 변화율/영양성분 잔존율 적용")
+    meal: str = Field(default="기타", description="끼니 (아침, 점심, 저녁, 간식 등)")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "food_name": "감자샐러드",
+                "weight_grams": 150.0,
+                "meal": "점심"
+            }
+        }
+
+
+class MealPlanRequest(BaseModel):
+    """식단 생성 요청 모델"""
+    
+    entries: List[MealEntry] = Field(default_factory=list, description="식단 항목 리스트")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "entries": [
+                    {"food_name": "오믈렛", "weight_grams": 120.0, "meal": "아침"},
+                    {"food_name": "감자샐러드", "weight_grams": 150.0, "meal": "점심"}
+                ]
+            }
+        }
+
+
+class MealPlanEntry(BaseModel):
+    """식단 항목별 영양성분 모델"""
+    
+    entry_id: str = Field(description="항목 ID")
+    food_name: str = Field(description="음식명")
+    weight_grams: float = Field(description="중량(g)")
+    meal: str = Field(description="끼니")
+    nutrients: Dict[str, float] = Field(description="항목 영양성분")
+    missing_ingredients: List[str] = Field(default_factory=list, description="영양성분을 조회하지 못한 재료")
+
+
+class NutrientIntake(BaseModel):
+    """1일 영양성분 기준치 대비 섭취량 모델"""
+    
+    nutrient: str = Field(description="영양성분")
+    amount: float = Field(description="섭취량")
+    reference: float = Field(description="1일 기준치")
+    percentage: float = Field(description="기준치 대비 비율(%)")
+
+
+class MealPlanSummary(BaseModel):
+    """식단 합계 모델"""
+    
+    plan_id: str = Field(description="식단 ID")
+    entries: List[MealPlanEntry] = Field(description="식단 항목 리스트")
+    totals: Dict[str, float] = Field(description="1일 합계 영양성분")
+    meals: Dict[str, Dict[str, float]] = Field(description="끼니별 소계")
+    intake_comparison: List[NutrientIntake] = Field(description="1일 영양성분 기준치 대비 비교")
+
+
+class NutrientConstraint(BaseModel):
+    """영양성분 목표 조건 모델 (1회 섭취량 기준)"""
+    
+    nutrient: str = Field(description="영양성분 (예: protein, energy)")
+    min: Optional[float] = Field(default=None, ge=0, description="최소 섭취량")
+    max: Optional[float] = Field(default=None, ge=0, description="최대 섭취량")
+
+
+class NutrientQueryRequest(BaseModel):
+    """영양성분 목표 역조회 요청 모델"""
+    
+    constraints: List[NutrientConstraint] = Field(min_length=1, description="영양성분 조건 리스트")
+    scope: str = Field(default="dishes", pattern="^(dishes|ingredients|all)$", description="조회 대상 (dishes, ingredients, all)")
+    min_weight: float = Field(default=1.0, gt=0, description="최소 중량(g)")
+    max_weight: float = Field(default=1000.0, gt=0, description="최대 중량(g)")
+    sort_by: str = Field(default="min_weight", description="정렬 기준 (min_weight, max_weight 또는 100g당 영양성분)")
+    descending: bool = Field(default=False, description="내림차순 정렬 여부")
+    limit: int = Field(default=20, ge=1, le=500, description="최대 결과 수")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "constraints": [
+                    {"nutrient": "protein", "min": 20.0},
+                    {"nutrient": "energy", "max": 400.0}
+                ],
+                "scope": "dishes",
+                "max_weight": 500.0
+            }
+        }
+
+
+class NutrientQueryMatch(BaseModel):
+    """영양성분 목표를 만족하는 음식/재료 모델"""
+    
+    name: str = Field(description="음식명 또는 재료명")
+    kind: str = Field(description="구분 (dish, ingredient)")
+    min_weight: float = Field(description="조건을 만족하는 최소 중량(g)")
+    max_weight: float = Field(description="조건을 만족하는 최대 중량(g)")
+    nutrients_at_min_weight: Dict[str, float] = Field(description="최소 중량 기준 조건 영양성분")
+
+
+class NutrientQueryResponse(BaseModel):
+    """영양성분 목표 역조회 응답 모델"""
+    
+    total_candidates: int = Field(description="검사한 후보 수")
+    total_matches: int = Field(description="조건을 만족하는 후보 수")
+    matches: List[NutrientQueryMatch] = Field(description="정렬된 결과 리스트")
+
+
+class RecipeOptimizationRequest(BaseModel):
+    """레시피 구성 비율 최적화 요청 모델 (영양성분 목표는 100g 기준)"""
+    
+    targets: Dict[str, float] = Field(default_factory=dict, description="100g당 목표 영양성분")
+    keep: List[str] = Field(default_factory=list, description="현재 값을 유지할 영양성분")
+    weights: Dict[str, Annotated[float, Field(gt=0)]] = Field(
+        default_factory=dict, description="영양성분별 가중치 (0보다 큼, 기본 1.0)"
+    )
+    additional_ingredients: List[str] = Field(default_factory=list, description="추가 후보 재료")
+    min_percentage: Dict[str, Annotated[float, Field(ge=0, le=100)]] = Field(
+        default_factory=dict, description="재료별 최소 비율(%, 0-100)"
+    )
+    max_percentage: Dict[str, Annotated[float, Field(ge=0, le=100)]] = Field(
+        default_factory=dict, description="재료별 최대 비율(%, 0-100)"
+    )
+    max_change: Optional[float] = Field(default=None, ge=0, description="재료별 최대 비율 변화량(%p)")
+    regularization: float = Field(default=0.01, ge=0, description="기존 구성 비율 유지 가중치")
+    weight_grams: float = Field(default=100.0, gt=0, description="결과 영양성분 계산 중량(g)")
+    
+    @model_validator(mode='after')
+    def check_percentage_bounds(self):
+        """재료별 최소 비율이 최대 비율을 넘지 않는지 확인"""
+        for name, lower in self.min_percentage.items():
+            upper = self.max_percentage.get(name, 100.0)
+            if lower > upper:
+                raise ValueError(f"'{name}' 최소 비율({lower:g}%)이 최대 비율({upper:g}%)보다 큽니다.")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "targets": {"sodium": 100.0},
+                "keep": ["energy"],
+                "max_change": 20.0
+            }
+        }
+
+
+class RecipeOptimizationResponse(BaseModel):
+    """레시피 구성 비율 최적화 응답 모델"""
+    
+    food_name: str = Field(description="음식명")
+    compositions: List[FoodComposition] = Field(description="최적 구성요소 리스트")
+    nutrition: CalculatedNutrition = Field(description="최적 구성 기준 영양성분")
+    targets: Dict[str, float] = Field(description="100g당 목표 영양성분")
+    achieved: Dict[str, float] = Field(description="100g당 달성 영양성분")
+    iterations: int = Field(description="반복 횟수")
+    converged: bool = Field(description="수렴 여부")
+
+
+class SimilarIngredient(BaseModel):
+    """유사 재료 모델"""
+    
+    food_code: Optional[str] = Field(default=None, description="식품코드")
+    food_name: Optional[str] = Field(default=None, description="식품명")
+    distance: float = Field(description="정규화 영양성분 벡터 거리")
+    nutrients: Dict[str, float] = Field(description="100g당 영양성분")
+
+
+class ServingEntry(BaseModel):
+    """표준 제공량별 영양성분 모델"""
+    
+    label: str = Field(description="제공량 구분 (100g, serving, 150g, 200g)")
+    weight_grams: float = Field(description="중량(g)")
+    nutrients: Dict[str, float] = Field(description="영양성분")
+
+
+class DishServings(BaseModel):
+    """음식별 표준 제공량 영양성분 표 모델"""
+    
+    food_name: str = Field(description="음식명")
+    serving_weight_grams: float = Field(description="1인분 중량(g)")
+    complete: bool = Field(description="모든 재료의 영양성분이 반영되었는지 여부")
+    covered_weight_percent: float = Field(description="영양성분이 반영된 재료의 중량 비중(%)")
+    servings: List[ServingEntry] = Field(description="제공량별 영양성분")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "food_name": "감자샐러드",
+                "serving_weight_grams": 150.0,
+                "complete": True,
+                "covered_weight_percent": 100.0,
+                "servings": [
+                    {"label": "100g", "weight_grams": 100.0, "nutrients": {"energy": 120.3, "protein": 2.1}},
+                    {"label": "serving", "weight_grams": 150.0, "nutrients": {"energy": 180.5, "protein": 3.2}}
+                ]
+            }
+        }
+
+
+class SimilarIngredientResponse(BaseModel):
+    """유사 재료 검색 응답 모델"""
+    
+    query: str = Field(description="질의 재료명")
+    food_code: Optional[str] = Field(default=None, description="질의 재료 식품코드")
+    food_name: Optional[str] = Field(default=None, description="질의 재료 식품명")
+    metric: str = Field(description="거리 척도")
+    indexed_count: int = Field(description="인덱스에 포함된 재료 수")
+    results: List[SimilarIngredient] = Field(description="유사 재료 리스트 (가까운 순)")
+
+
+class JobRequest(BaseModel):
+    """백그라운드 작업 등록 요청 모델"""
+    
+    kind: str = Field(description="작업 종류 (refresh_ingredients, rebuild_profiles, sync_dataset)")
+    params: Dict[str, Any] = Field(default_factory=dict, description="작업 매개변수")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "kind": "rebuild_profiles",
+                "params": {"foods": ["감자샐러드", "오믈렛"]}
+            }
+        }
+
+
+class EmptyJobParams(BaseModel):
+    """매개변수가 없는 작업 (refresh_ingredients, sync_dataset)"""
+    
+    class Config:
+        extra = 'forbid'
+
+
+class RebuildProfilesParams(BaseModel):
+    """rebuild_profiles 작업 매개변수 (둘 다 없으면 전체 음식)"""
+    
+    foods: Optional[List[str]] = Field(default=None, description="재계산할 음식명 목록")
+    since: Optional[int] = Field(default=None, ge=0, description="이 변경 피드 순번 이후 영향받은 음식만 재계산")
+    
+    class Config:
+        extra = 'forbid'
+
+
+class JobStatus(BaseModel):
+    """백그라운드 작업 상태 모델"""
+    
+    job_id: str = Field(description="작업 ID")
+    kind: str = Field(description="작업 종류")
+    params: Dict[str, Any] = Field(description="작업 매개변수")
+    status: str = Field(description="상태 (queued, running, succeeded, failed, cancelled)")
+    progress: float = Field(description="진행률 (0~1)")
+    message: Optional[str] = Field(default=None, description="최근 진행 메시지")
+    result: Optional[Any] = Field(default=None, description="작업 결과")
+    error: Optional[str] = Field(default=None, description="실패 사유")
+    created_at: float = Field(description="등록 시각 (Unix time)")
+    started_at: Optional[float] = Field(default=None, description="시작 시각 (Unix time)")
+    finished_at: Optional[float] = Field(default=None, description="종료 시각 (Unix time)")
+
+
+class IngredientChangeEntry(BaseModel):
+    """재료 데이터 변경 피드 항목 모델"""
+    
+    seq: int = Field(description="피드 순번")
+    ingredient_name: str = Field(description="재료명")
+    food_code: Optional[str] = Field(default=None, description="식품코드")
+    old_version: int = Field(description="이전 버전")
+    new_version: int = Field(description="새 버전")
+    old_hash: str = Field(description="이전 내용 해시")
+    new_hash: str = Field(description="새 내용 해시")
+    changes: Dict[str, Dict[str, Any]] = Field(description="바뀐 필드별 이전/새 값 ({필드: {old, new}})")
+    affected_dishes: List[str] = Field(description="해당 재료를 사용하는 음식")
+    recorded_at: float = Field(description="기록 시각 (Unix time)")
+
+
+class IngredientChangeFeed(BaseModel):
+    """재료 데이터 변경 피드 응답 모델"""
+    
+    changes: List[IngredientChangeEntry] = Field(description="변경 항목 (순번 오름차순)")
+    next_since: int = Field(description="다음 조회에 사용할 since 값")
+    last_seq: int = Field(description="피드의 마지막 순번")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "changes": [
+                    {
+                        "seq": 12,
+                        "ingredient_name": "감자",
+                        "food_code": "D000001",
+                        "old_version": 1,
+                        "new_version": 2,
+                        "old_hash": "3f1c...",
+                        "new_hash": "9a0b...",
+                        "changes": {"enerc": {"old": "66", "new": "70"}},
+                        "affected_dishes": ["감자샐러드"],
+                        "recorded_at": 1700000000.0
+                    }
+                ],
+                "next_since": 12,
+                "last_seq": 12
+            }
+        }
+
+
+class LiveCalculationUpdate(BaseModel):
+    """실시간 계산 채널(/ws/calculate) 입력 메시지 (지정한 값만 세션 상태에 반영)"""
+    
+    food_name: Optional[str] = Field(default=None, description="음식명 (변경 시 전체 결과 재전송)")
+    weight_grams: Optional[float] = Field(default=None, gt=0, description="중량(g) (지정 시 quantity 해제)")
+    quantity: Optional[float] = Field(default=None, gt=0, description="수량 (지정 시 weight_grams 해제)")
+    unit: Optional[str] = Field(default=None, description="quantity 단위")
+    apply_refuse: Optional[bool] = Field(default=None, description="재료 폐기율 적용")
+    apply_cooking: Optional[bool] = Field(default=None, description="조리 보정 적용")
+    fields: Optional[List[str]] = Field(default=None, description="계산할 영양성분 (빈 리스트면 전체)")
+    detail: Optional[bool] = Field(default=None, description="구성요소별 상세 포함 여부")
+    compositions: Optional[List[Dict[str, Any]]] = Field(
+        default=None, description="편집 중인 구성요소 (빈 리스트면 등록된 구성으로 복원)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "food_name": "감자샐러드",
+                "weight_grams": 180.0,
+                "compositions": [
+                    {"ingredient_name": "감자", "percentage": 70.0},
+                    {"ingredient_name": "마요네즈", "percentage": 15.0},
+                    {"ingredient_name": "계란", "percentage": 15.0}
+                ]
+            }
+        }
@@ -0,0 +1,110 @@
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from models.schemas import RebuildProfilesParams
+from services.job_runner import JobContext, JobRunner
+from services.nutrition_service import NutritionCalculationService
+from services.nutrient_query import NutrientQueryService
+from services.serving_table import ServingTableService
+from services.ingredient_index import IngredientIndexService, fetch_ingredient_list
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_FILE = Path(__file__).parent.parent / "data" / "ingredient_snapshot.json"
+
+
+def register_jobs(
+    runner: JobRunner,
+    nutrition_service: NutritionCalculationService,
+    nutrient_query_service: NutrientQueryService,
+    serving_table_service: ServingTableService,
+    ingredient_index_service: IngredientIndexService
+):
+    """백그라운드 작업 종류 등록
+
+    refresh_ingredients - 전체 재료를 다시 조회하고 값이 바뀐 재료를 사용하는 음식만 무효화 (변경 피드 기록)
+    rebuild_profiles    - 음식 프로필을 다시 계산하고 제공량 표/영양성분 벡터 갱신
+                          (foods 또는 변경 피드 순번 since 이후 영향받은 음식만, 둘 다 없으면 전체)
+    sync_dataset        - 전체 목록 API로 로컬 재료 스냅샷 파일을 다시 만들고 유사 재료 인덱스 재생성
+                          (현재 스냅샷 파일, 없으면 data/ingredient_snapshot.json — 경로는 요청으로 바꿀 수 없음)
+    """
+
+    def refresh_ingredients(context: JobContext) -> Dict[str, Any]:
+        ingredient_names = list(nutrition_service.iter_ingredient_names())
+        first_seq = nutrition_service.ingredient_versions.last_seq()
+        changed, failed = [], []
+        affected = set()
+        for i, ingredient_name in enumerate(ingredient_names):
+            dishes = nutrition_service.refresh_ingredient(ingredient_name)
+            if dishes is None:
+                failed.append(ingredient_name)
+            elif dishes:
+                changed.append(ingredient_name)
+                affected |= dishes
+            context.report(i + 1, len(ingredient_names), f"{ingredient_name} 조회 완료")
+        return {
+            'ingredients': len(ingredient_names),
+            'changed': changed,
+            'failed': failed,
+            'invalidated_foods': sorted(affected),
+            'change_feed': {'since': first_seq, 'last_seq': nutrition_service.ingredient_versions.last_seq()}
+        }
+
+    def rebuild_profiles(context: JobContext, foods: List[str] = None, since: int = None) -> Dict[str, Any]:
+        if foods:
+            food_names = foods
+        elif since is not None:
+            # 변경 피드에서 since 이후 바뀐 재료를 사용하는 음식 (삭제된 음식 제외)
+            affected, _ = nutrition_service.ingredient_versions.affected_since(since)
+            food_names = sorted(name for name in affected if nutrition_service.dish_graph.has_dish(name))
+        else:
+            food_names = list(nutrition_service.iter_available_foods())
+        unknown = [food_name for food_name in food_names if not nutrition_service.dish_graph.has_dish(food_name)]
+        if unknown:
+            raise ValueError(f"등록되지 않은 음식입니다: {', '.join(unknown)}")
+
+        nutrition_service.invalidate_dishes(food_names)
+        incomplete = []
+        for i, food_name in enumerate(food_names):
+            profile = nutrition_service.get_dish_profile(food_name)
+            if profile is None or profile.missing_ingredients:
+                incomplete.append(food_name)
+            context.report(i + 1, len(food_names) + 1, f"{food_name} 계산 완료")
+
+        rebuilt_rows = serving_table_service.refresh()
+        nutrient_query_service.get_vectors()
+        return {'foods': len(food_names), 'incomplete': incomplete, 'serving_rows_rebuilt': rebuilt_rows}
+
+    def sync_dataset(context: JobContext) -> Dict[str, Any]:
+        snapshot_file = Path(
+            nutrition_service.snapshot_file
+            or os.getenv('INGREDIENT_SNAPSHOT_FILE')
+            or DEFAULT_SNAPSHOT_FILE
+        )
+        items = fetch_ingredient_list(
+            nutrition_service.api_client,
+            progress=lambda done, total: context.report(done, total + 1, f"{done}/{total}개 조회")
+        )
+        if not items:
+            raise RuntimeError("재료 목록을 가져오지 못했습니다.")
+
+        # 임시 파일에 기록 후 교체해 조회 중인 프로세스가 불완전한 파일을 읽지 않도록 함
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = snapshot_file.with_suffix(snapshot_file.suffix + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=False)
+        os.replace(temp_file, snapshot_file)
+
+        # 계산 서비스와 유사 재료 인덱스가 이후 새 스냅샷 파일을 사용하도록 경로를 직접 전달
+        # (환경변수를 바꾸지 않음)
+        nutrition_service.reload_snapshot(str(snapshot_file))
+        indexed = ingredient_index_service.rebuild()
+        logger.info(f"재료 스냅샷 동기화: {snapshot_file} ({len(items)}개)")
+        return {'items': len(items), 'snapshot_file': str(snapshot_file), 'indexed': indexed}
+
+    runner.register('refresh_ingredients', refresh_ingredients)
+    runner.register('rebuild_profiles', rebuild_profiles, RebuildProfilesParams)
+    runner.register('sync_dataset', sync_dataset)
@@ -0,0 +1,139 @@
+import logging
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+
+from models.schemas import ComplexFood, FoodComposition
+
+logger = logging.getLogger(__name__)
+
+# 구성 비율 합계 허용 오차(%p)
+PERCENTAGE_TOLERANCE = 0.01
+
+
+class CompositionValidationError(ValueError):
+    """음식 구성요소 데이터 검증 에러"""
+
+
+class CompositionRecord(NamedTuple):
+    """검증된 구성요소 (불변)"""
+    ingredient_name: str
+    percentage: float
+    unit: str
+    preparation: Optional[str]
+    is_dish: bool
+
+
+class DishRecord(NamedTuple):
+    """검증된 음식 구성 정보 (불변)
+
+    API 응답용 ComplexFood도 로드 시 한 번만 생성해 요청 간 재사용합니다.
+    """
+    food_name: str
+    description: Optional[str]
+    base_weight: float
+    compositions: Tuple[CompositionRecord, ...]
+    complex_food: ComplexFood
+    serving_weight: Optional[float] = None
+
+
+def compile_dish_record(food_name: str, data: Dict[str, Any]) -> DishRecord:
+    """원본 구성요소 데이터를 검증하고 불변 레코드로 변환
+
+    Raises:
+        CompositionValidationError: 필수 값 누락, 잘못된 비율 또는 비율 합계가 100%가 아닌 경우
+    """
+    if not isinstance(data, dict) or not data.get('compositions'):
+        raise CompositionValidationError(f"'{food_name}' 구성요소가 없습니다.")
+
+    base_weight = data.get('base_weight', 100.0)
+    if not isinstance(base_weight, (int, float)) or base_weight <= 0:
+        raise CompositionValidationError(f"'{food_name}' 기준 중량이 올바르지 않습니다: {base_weight}")
+
+    serving_weight = data.get('serving_weight')
+    if serving_weight is not None and (not isinstance(serving_weight, (int, float)) or serving_weight <= 0):
+        raise CompositionValidationError(f"'{food_name}' 1인분 중량이 올바르지 않습니다: {serving_weight}")
+
+    compositions = []
+    for comp in data['compositions']:
+        ingredient_name = comp.get('ingredient_name')
+        percentage = comp.get('percentage')
+        if not ingredient_name:
+            raise CompositionValidationError(f"'{food_name}' 구성요소에 재료명이 없습니다.")
+        if not isinstance(percentage, (int, float)) or not 0 < percentage <= 100:
+            raise CompositionValidationError(
+                f"'{food_name}'의 '{ingredient_name}' 구성 비율이 올바르지 않습니다: {percentage}"
+            )
+        compositions.append(CompositionRecord(
+            ingredient_name=ingredient_name,
+            percentage=float(percentage),
+            unit=comp.get('unit', 'g'),
+            preparation=comp.get('preparation'),
+            is_dish=bool(comp.get('is_dish', False))
+        ))
+
+    total = sum(comp.percentage for comp in compositions)
+    if abs(total - 100.0) > PERCENTAGE_TOLERANCE:
+        raise CompositionValidationError(f"'{food_name}' 구성 비율 합계가 100%가 아닙니다: {total:g}%")
+
+    complex_food = ComplexFood(
+        food_name=food_name,
+        compositions=[
+            FoodComposition(
+                ingredient_name=comp.ingredient_name,
+                percentage=comp.percentage,
+                unit=comp.unit,
+                is_dish=comp.is_dish
+            )
+            for comp in compositions
+        ],
+        total_weight=float(base_weight),
+        serving_weight=float(serving_weight) if serving_weight is not None else None
+    )
+
+    return DishRecord(
+        food_name=food_name,
+        description=data.get('description'),
+        base_weight=float(base_weight),
+        compositions=tuple(compositions),
+        complex_food=complex_food,
+        serving_weight=float(serving_weight) if serving_weight is not None else None
+    )
+
+
+def compile_dish_records(food_compositions: Dict[str, Any]) -> Tuple[Dict[str, DishRecord], Dict[str, str]]:
+    """전체 구성요소 데이터 검증 및 변환
+
+    Returns:
+        ({음식명: 레코드}, {검증 실패 음식명: 에러 메시지})
+    """
+    records = {}
+    errors = {}
+    for food_name, data in food_compositions.items():
+        try:
+            records[food_name] = compile_dish_record(food_name, data)
+        except CompositionValidationError as e:
+            errors[food_name] = str(e)
+    return records, errors
+
+
+def dish_record_to_dict(record: DishRecord) -> Dict[str, Any]:
+    """레코드를 구성요소 파일과 같은 형식의 원본 데이터로 변환"""
+    data: Dict[str, Any] = {}
+    if record.description is not None:
+        data['description'] = record.description
+    data['base_weight'] = record.base_weight
+    if record.serving_weight is not None:
+        data['serving_weight'] = record.serving_weight
+    compositions = []
+    for comp in record.compositions:
+        item: Dict[str, Any] = {
+            'ingredient_name': comp.ingredient_name,
+            'percentage': comp.percentage,
+            'unit': comp.unit
+        }
+        if comp.preparation is not None:
+            item['preparation'] = comp.preparation
+        if comp.is_dish:
+            item['is_dish'] = True
+        compositions.append(item)
+    data['compositions'] = compositions
+    return data
@@ -0,0 +1,424 @@
+import os
+import abc
+import json
+import time
+import bisect
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+from services.composition_catalog import (
+    DishRecord,
+    CompositionValidationError,
+    compile_dish_record,
+    compile_dish_records,
+    dish_record_to_dict
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPOSITIONS_FILE = Path(__file__).parent.parent / "data" / "food_compositions.json"
+DEFAULT_COMPOSITIONS_DB = Path(__file__).parent.parent / "data" / "food_compositions.db"
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """접두어로 시작하는 문자열의 상한 (정렬 순서 기준 범위 검색용)"""
+    return prefix + '\U0010ffff'
+
+
+class CompositionStore(abc.ABC):
+    """음식 구성요소 저장소 인터페이스
+
+    음식명 순으로 정렬된 목록 조회와 역참조(하위 음식/재료 → 이를 직접 사용하는 음식)
+    조회를 제공하며, DishGraph는 이 인터페이스만 사용합니다.
+    """
+
+    # True면 전체 음식이 메모리에 로드되어 시작 시 전체 검증이 가능
+    preloaded = False
+
+    @abc.abstractmethod
+    def get(self, food_name: str) -> Optional[DishRecord]:
+        ...
+
+    @abc.abstractmethod
+    def contains(self, food_name: str) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def names(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None
+    ) -> List[str]:
+        """음식명 목록 (이름순, after가 있으면 해당 이름 다음부터)"""
+        ...
+
+    @abc.abstractmethod
+    def count(self, prefix: Optional[str] = None) -> int:
+        ...
+
+    @abc.abstractmethod
+    def dish_dependents(self, food_name: str) -> Set[str]:
+        """해당 음식을 하위 음식으로 직접 사용하는 음식"""
+        ...
+
+    @abc.abstractmethod
+    def ingredient_dependents(self, ingredient_name: str) -> Set[str]:
+        """해당 재료를 직접 사용하는 음식"""
+        ...
+
+    @abc.abstractmethod
+    def put(self, record: DishRecord):
+        ...
+
+    @abc.abstractmethod
+    def remove(self, food_name: str):
+        ...
+
+    @abc.abstractmethod
+    def pending_changes(self) -> Dict[str, Optional[DishRecord]]:
+        """마지막 확인 이후 외부에서 변경된 음식 ({음식명: 최신 레코드, 삭제 시 None})"""
+        ...
+
+    def iter_names(self, batch_size: int = 1000) -> Iterator[str]:
+        """전체 음식명 순회 (이름 기준 배치 단위 조회)"""
+        after = None
+        while True:
+            batch = self.names(limit=batch_size, after=after)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = batch[-1]
+
+
+class InMemoryCompositionStore(CompositionStore):
+    """메모리 저장소 (전체 레코드와 역참조 인덱스를 메모리에 유지)"""
+
+    preloaded = True
+
+    def __init__(self, records: Optional[Dict[str, DishRecord]] = None):
+        self._records: Dict[str, DishRecord] = {}
+        self._sorted_names: Optional[List[str]] = None
+        # 역참조 인덱스: 하위 음식/재료 → 이를 직접 사용하는 음식
+        self._dish_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._ingredient_dependents: Dict[str, Set[str]] = defaultdict(set)
+
+        for record in (records or {}).values():
+            self.put(record)
+
+    def _link(self, record: DishRecord):
+        for comp in record.compositions:
+            index = self._dish_dependents if comp.is_dish else self._ingredient_dependents
+            index[comp.ingredient_name].add(record.food_name)
+
+    def _unlink(self, record: DishRecord):
+        for comp in record.compositions:
+            index = self._dish_dependents if comp.is_dish else self._ingredient_dependents
+            index[comp.ingredient_name].discard(record.food_name)
+
+    def get(self, food_name: str) -> Optional[DishRecord]:
+        return self._records.get(food_name)
+
+    def contains(self, food_name: str) -> bool:
+        return food_name in self._records
+
+    def _names_in_range(self, prefix: Optional[str]) -> Tuple[List[str], int, int]:
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._records)
+        names = self._sorted_names
+        if not prefix:
+            return names, 0, len(names)
+        return (
+            names,
+            bisect.bisect_left(names, prefix),
+            bisect.bisect_left(names, _prefix_upper_bound(prefix))
+        )
+
+    def names(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None
+    ) -> List[str]:
+        names, start, end = self._names_in_range(prefix)
+        if after is not None:
+            start = max(start, bisect.bisect_right(names, after))
+        start += offset
+        if limit is not None:
+            end = min(end, start + limit)
+        return names[start:end]
+
+    def count(self, prefix: Optional[str] = None) -> int:
+        _, start, end = self._names_in_range(prefix)
+        return end - start
+
+    def dish_dependents(self, food_name: str) -> Set[str]:
+        return set(self._dish_dependents.get(food_name, ()))
+
+    def ingredient_dependents(self, ingredient_name: str) -> Set[str]:
+        return set(self._ingredient_dependents.get(ingredient_name, ()))
+
+    def put(self, record: DishRecord):
+        previous = self._records.get(record.food_name)
+        if previous is not None:
+            self._unlink(previous)
+        else:
+            self._sorted_names = None
+        self._records[record.food_name] = record
+        self._link(record)
+
+    def remove(self, food_name: str):
+        record = self._records.pop(food_name, None)
+        if record is not None:
+            self._unlink(record)
+            self._sorted_names = None
+
+    def pending_changes(self) -> Dict[str, Optional[DishRecord]]:
+        return {}
+
+
+class JsonCompositionStore(InMemoryCompositionStore):
+    """단일 JSON 파일 기반 저장소 (전체 메모리 로드)"""
+
+    def __init__(self, compositions_file: Path = DEFAULT_COMPOSITIONS_FILE):
+        self.compositions_file = Path(compositions_file)
+        records, errors = compile_dish_records(self._load())
+        for food_name, error in errors.items():
+            logger.error(f"'{food_name}' 구성요소 검증 실패로 제외합니다: {error}")
+        super().__init__(records)
+
+    def _load(self) -> Dict[str, Any]:
+        """음식 구성요소 데이터 로드"""
+        try:
+            with open(self.compositions_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.error(f"구성요소 데이터 파일을 찾을 수 없습니다: {self.compositions_file}")
+            return {}
+        except json.JSONDecodeError as e:
+            logger.error(f"구성요소 데이터 파싱 실패: {e}")
+            return {}
+
+    def pending_changes(self) -> Dict[str, Optional[DishRecord]]:
+        """구성요소 파일을 다시 읽어 현재 상태와 비교"""
+        latest, errors = compile_dish_records(self._load())
+        for food_name, error in errors.items():
+            logger.error(f"'{food_name}' 구성요소 변경을 반영하지 않습니다: {error}")
+
+        changes: Dict[str, Optional[DishRecord]] = {}
+        for food_name in set(self._records) - set(latest) - set(errors):
+            changes[food_name] = None
+        for food_name, record in latest.items():
+            if self._records.get(food_name) != record:
+                changes[food_name] = record
+        return changes
+
+
+class SqliteCompositionStore(CompositionStore):
+    """SQLite 기반 저장소 (음식명 단위 지연 로드)
+
+    음식 원본 데이터는 음식명 기본키로, 역참조는 별도 인덱스 테이블로 보관합니다.
+    조회한 음식은 검증된 레코드로 변환해 LRU 캐시에 유지하고, 변경 이력 테이블로
+    다른 프로세스(가져오기 도구 등)의 변경을 감지합니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS dishes (
+            food_name TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS dish_references (
+            food_name TEXT NOT NULL,
+            ref_name TEXT NOT NULL,
+            is_dish INTEGER NOT NULL,
+            PRIMARY KEY (food_name, ref_name, is_dish)
+        );
+        CREATE INDEX IF NOT EXISTS idx_dish_references_ref ON dish_references (ref_name, is_dish);
+        CREATE TABLE IF NOT EXISTS dish_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            food_name TEXT NOT NULL,
+            changed_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_COMPOSITIONS_DB, cache_size: int = 1024):
+        self.db_path = Path(db_path)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, DishRecord]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        self._last_seq = self._max_seq()
+        # 이 프로세스에서 기록한 변경 (pending_changes에서 제외)
+        self._own_seqs: Set[int] = set()
+
+    def _max_seq(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM dish_changes").fetchone()
+        return row[0]
+
+    def _load(self, food_name: str) -> Optional[DishRecord]:
+        """DB에서 음식 조회 후 검증 (검증 실패 시 None)"""
+        row = self._conn.execute("SELECT data FROM dishes WHERE food_name = ?", (food_name,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return compile_dish_record(food_name, json.loads(row[0]))
+        except (CompositionValidationError, json.JSONDecodeError) as e:
+            logger.error(f"'{food_name}' 구성요소 검증 실패로 제외합니다: {e}")
+            return None
+
+    def get(self, food_name: str) -> Optional[DishRecord]:
+        with self._lock:
+            record = self._cache.get(food_name)
+            if record is not None:
+                self._cache.move_to_end(food_name)
+                return record
+
+            record = self._load(food_name)
+            if record is not None:
+                self._cache[food_name] = record
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return record
+
+    def contains(self, food_name: str) -> bool:
+        with self._lock:
+            if food_name in self._cache:
+                return True
+            row = self._conn.execute("SELECT 1 FROM dishes WHERE food_name = ?", (food_name,)).fetchone()
+            return row is not None
+
+    def names(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None
+    ) -> List[str]:
+        sql = "SELECT food_name FROM dishes"
+        conditions = []
+        params: List[Any] = []
+        if prefix:
+            conditions.append("food_name >= ? AND food_name < ?")
+            params += [prefix, _prefix_upper_bound(prefix)]
+        if after is not None:
+            conditions.append("food_name > ?")
+            params.append(after)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY food_name LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def count(self, prefix: Optional[str] = None) -> int:
+        sql = "SELECT COUNT(*) FROM dishes"
+        params: List[Any] = []
+        if prefix:
+            sql += " WHERE food_name >= ? AND food_name < ?"
+            params += [prefix, _prefix_upper_bound(prefix)]
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def _dependents(self, ref_name: str, is_dish: bool) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT food_name FROM dish_references WHERE ref_name = ? AND is_dish = ?",
+                (ref_name, int(is_dish))
+            )
+            return {row[0] for row in rows}
+
+    def dish_dependents(self, food_name: str) -> Set[str]:
+        return self._dependents(food_name, True)
+
+    def ingredient_dependents(self, ingredient_name: str) -> Set[str]:
+        return self._dependents(ingredient_name, False)
+
+    def _record_change(self, food_name: str):
+        cursor = self._conn.execute(
+            "INSERT INTO dish_changes (food_name, changed_at) VALUES (?, ?)", (food_name, time.time())
+        )
+        self._own_seqs.add(cursor.lastrowid)
+
+    def put(self, record: DishRecord):
+        data = json.dumps(dish_record_to_dict(record), ensure_ascii=False, sort_keys=True)
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM dishes WHERE food_name = ?", (record.food_name,)).fetchone()
+            if row is None or row[0] != data:
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO dishes (food_name, data, updated_at) VALUES (?, ?, ?)",
+                        (record.food_name, data, time.time())
+                    )
+                    self._conn.execute("DELETE FROM dish_references WHERE food_name = ?", (record.food_name,))
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO dish_references (food_name, ref_name, is_dish) VALUES (?, ?, ?)",
+                        [(record.food_name, comp.ingredient_name, int(comp.is_dish)) for comp in record.compositions]
+                    )
+                    self._record_change(record.food_name)
+            self._cache[record.food_name] = record
+            self._cache.move_to_end(record.food_name)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def remove(self, food_name: str):
+        with self._lock:
+            self._cache.pop(food_name, None)
+            with self._conn:
+                self._conn.execute("BEGIN")
+                deleted = self._conn.execute("DELETE FROM dishes WHERE food_name = ?", (food_name,)).rowcount
+                self._conn.execute("DELETE FROM dish_references WHERE food_name = ?", (food_name,))
+                if deleted:
+                    self._record_change(food_name)
+
+    def pending_changes(self) -> Dict[str, Optional[DishRecord]]:
+        """변경 이력 테이블에서 다른 프로세스의 변경 조회 (캐시된 레코드는 제거 후 다시 로드)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, food_name FROM dish_changes WHERE seq > ? ORDER BY seq", (self._last_seq,)
+            ).fetchall()
+            changed = []
+            for seq, food_name in rows:
+                self._last_seq = seq
+                if seq in self._own_seqs:
+                    self._own_seqs.discard(seq)
+                    continue
+                if food_name not in changed:
+                    changed.append(food_name)
+
+            changes: Dict[str, Optional[DishRecord]] = {}
+            for food_name in changed:
+                self._cache.pop(food_name, None)
+                changes[food_name] = self._load(food_name)
+            return changes
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_composition_store() -> CompositionStore:
+    """환경변수 설정에 따른 구성요소 저장소 생성
+
+    COMPOSITION_STORE: json(기본) 또는 sqlite
+    COMPOSITIONS_FILE: json 저장소 파일 경로
+    COMPOSITIONS_DB: sqlite 저장소 파일 경로
+    COMPOSITION_CACHE_SIZE: sqlite 저장소의 레코드 LRU 캐시 크기 (기본 1024, DishGraph 평탄화 캐시도 같은 크기)
+    """
+    backend = os.getenv('COMPOSITION_STORE', 'json').lower()
+    if backend == 'sqlite':
+        db_path = os.getenv('COMPOSITIONS_DB', str(DEFAULT_COMPOSITIONS_DB))
+        cache_size = int(os.getenv('COMPOSITION_CACHE_SIZE', '1024'))
+        logger.info(f"SQLite 구성요소 저장소 사용: {db_path} (캐시 {cache_size}개)")
+        return SqliteCompositionStore(db_path, cache_size)
+
+    return JsonCompositionStore(os.getenv('COMPOSITIONS_FILE', str(DEFAULT_COMPOSITIONS_FILE)))
@@ -0,0 +1,82 @@
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from models.records import NUTRIENT_KEYS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COOKING_FACTORS_FILE = Path(__file__).parent.parent / "data" / "cooking_factors.json"
+
+
+class CookingFactor(NamedTuple):
+    """조리 방법별 중량 변화율과 영양성분 잔존율
+
+    yield_factor: 조리 후 중량 / 조리 전 가식부 중량
+    retention: NUTRIENT_KEYS 순서의 잔존율 (조리 전 영양성분 대비)
+    """
+    method: str
+    yield_factor: float
+    retention: Tuple[float, ...]
+
+
+RAW = CookingFactor('raw', 1.0, (1.0,) * len(NUTRIENT_KEYS))
+
+
+class CookingFactorTable:
+    """구성요소 조리 상태(preparation)를 조리 방법과 계수로 변환
+
+    preparation 문자열("삶은 감자", "생것" 등)에 포함된 키워드로 조리 방법을 찾고,
+    재료별 계수가 있으면 방법 기본값 대신 사용합니다. 일치하는 방법이 없으면 생것으로 봅니다.
+    (재료, preparation) 조합별 결과는 한 번만 계산합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or os.getenv('COOKING_FACTORS_FILE', str(DEFAULT_COOKING_FACTORS_FILE)))
+        data = self._load()
+        self.methods: Dict[str, Dict] = data.get('methods', {})
+        self.ingredient_overrides: Dict[str, Dict[str, Dict]] = data.get('ingredients', {})
+        # 긴 키워드부터 비교 ("구워낸 전"이 "구워"보다 먼저 일치)
+        self._keywords = sorted(
+            ((keyword, method) for method, spec in self.methods.items() for keyword in spec.get('keywords', [])),
+            key=lambda entry: -len(entry[0])
+        )
+        self._factors: Dict[Tuple[str, Optional[str]], CookingFactor] = {}
+
+    def _load(self) -> Dict:
+        if not self.path.exists():
+            logger.warning(f"조리 계수 파일이 없어 조리 보정을 적용하지 않습니다: {self.path}")
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def method_of(self, preparation: Optional[str]) -> str:
+        """preparation 문자열의 조리 방법 (알 수 없으면 raw)"""
+        if preparation:
+            for keyword, method in self._keywords:
+                if keyword in preparation:
+                    return method
+        return 'raw'
+
+    def factor(self, ingredient_name: str, preparation: Optional[str]) -> CookingFactor:
+        key = (ingredient_name, preparation)
+        factor = self._factors.get(key)
+        if factor is None:
+            factor = self._build(ingredient_name, preparation)
+            self._factors[key] = factor
+        return factor
+
+    def _build(self, ingredient_name: str, preparation: Optional[str]) -> CookingFactor:
+        method = self.method_of(preparation)
+        spec = self.methods.get(method)
+        if spec is None:
+            return RAW
+        override = self.ingredient_overrides.get(ingredient_name, {}).get(method, {})
+        retention = {**spec.get('retention', {}), **override.get('retention', {})}
+        return CookingFactor(
+            method,
+            float(override.get('yield', spec.get('yield', 1.0))),
+            tuple(float(retention.get(key, 1.0)) for key in NUTRIENT_KEYS)
+        )
@@ -0,0 +1,232 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Set, Optional, Tuple
+
+from services.composition_catalog import CompositionRecord, DishRecord
+from services.composition_store import CompositionStore
+
+logger = logging.getLogger(__name__)
+
+
+class CompositionGraphError(ValueError):
+    """복합식품 참조 구조 에러"""
+
+
+class CompositionCycleError(CompositionGraphError):
+    """복합식품 간 순환 참조 에러"""
+
+
+def _by_ingredient(comp: CompositionRecord) -> str:
+    return comp.ingredient_name
+
+
+def _by_preparation(comp: CompositionRecord) -> Tuple[str, Optional[str]]:
+    return comp.ingredient_name, comp.preparation
+
+
+class DishGraph:
+    """복합식품 간 참조 관계(DAG) 관리
+
+    구성요소가 다른 복합식품(`is_dish`)을 가리킬 수 있으며, 각 음식은
+    최종 원재료별 중량 비율로 평탄화되어 메모이제이션됩니다(음식 수 기준 LRU, cache_size개).
+    저장소의 역참조 인덱스를 사용하여 하위 레시피 변경 시 이를 사용하는 음식만 무효화합니다.
+    """
+
+    def __init__(self, store: CompositionStore, cache_size: int = 1024):
+        self._store = store
+        self.cache_size = cache_size
+        self._flattened: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._prepared: "OrderedDict[str, Dict[Tuple[str, Optional[str]], float]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def has_dish(self, food_name: str) -> bool:
+        return self._store.get(food_name) is not None
+
+    def get_dish(self, food_name: str) -> Optional[DishRecord]:
+        return self._store.get(food_name)
+
+    def dish_names(self) -> List[str]:
+        return list(self._store.iter_names())
+
+    def flatten(self, food_name: str) -> Dict[str, float]:
+        """음식을 원재료별 중량 비율(0-1)로 평탄화
+
+        Args:
+            food_name: 음식명
+
+        Returns:
+            {재료명: 음식 전체 중량 대비 비율}
+
+        Raises:
+            CompositionCycleError: 순환 참조가 있는 경우
+            CompositionGraphError: 등록되지 않은 음식을 참조하는 경우
+        """
+        return self._flatten(food_name, [], self._flattened, _by_ingredient)
+
+    def flatten_preparations(self, food_name: str) -> Dict[Tuple[str, Optional[str]], float]:
+        """음식을 (원재료명, 조리 상태)별 중량 비율(0-1)로 평탄화
+
+        같은 재료라도 하위 음식마다 조리 상태(preparation)가 다르면 따로 집계합니다.
+
+        Raises:
+            CompositionCycleError: 순환 참조가 있는 경우
+            CompositionGraphError: 등록되지 않은 음식을 참조하는 경우
+        """
+        return self._flatten(food_name, [], self._prepared, _by_preparation)
+
+    def flatten_record(
+        self, record: DishRecord
+    ) -> Tuple[Dict[str, float], Dict[Tuple[str, Optional[str]], float]]:
+        """등록되지 않은(편집 중인) 음식 레코드를 평탄화 (결과는 메모이제이션하지 않음)
+
+        Returns:
+            (재료별 비율, (재료명, 조리 상태)별 비율) — 하위 음식은 등록된 구성 기준
+
+        Raises:
+            CompositionCycleError: 하위 음식에 순환 참조가 있는 경우
+            CompositionGraphError: 등록되지 않은 음식을 참조하는 경우
+        """
+        path = [record.food_name]
+        return (
+            self._combine(record.compositions, path, self._flattened, _by_ingredient),
+            self._combine(record.compositions, path, self._prepared, _by_preparation)
+        )
+
+    def _flatten(
+        self,
+        food_name: str,
+        path: List[str],
+        memo: "OrderedDict[str, Dict]",
+        key: Callable[[CompositionRecord], Hashable]
+    ) -> Dict:
+        with self._memo_lock:
+            shares = memo.get(food_name)
+            if shares is not None:
+                memo.move_to_end(food_name)
+                return shares
+
+        if food_name in path:
+            cycle = ' → '.join(path[path.index(food_name):] + [food_name])
+            raise CompositionCycleError(f"순환 참조가 발견되었습니다: {cycle}")
+
+        data = self._store.get(food_name)
+        if data is None:
+            referrer = f"'{path[-1]}'에서 참조한 " if path else ""
+            raise CompositionGraphError(f"{referrer}'{food_name}' 음식 정보를 찾을 수 없습니다.")
+
+        path.append(food_name)
+        shares = self._combine(data.compositions, path, memo, key)
+        path.pop()
+
+        with self._memo_lock:
+            memo[food_name] = shares
+            memo.move_to_end(food_name)
+            while len(memo) > self.cache_size:
+                memo.popitem(last=False)
+        return shares
+
+    def _combine(
+        self,
+        compositions: Tuple[CompositionRecord, ...],
+        path: List[str],
+        memo: "OrderedDict[str, Dict]",
+        key: Callable[[CompositionRecord], Hashable]
+    ) -> Dict:
+        shares: Dict = {}
+        for comp in compositions:
+            fraction = comp.percentage / 100.0
+            if comp.is_dish:
+                for share_key, sub_fraction in self._flatten(comp.ingredient_name, path, memo, key).items():
+                    shares[share_key] = shares.get(share_key, 0.0) + fraction * sub_fraction
+            else:
+                share_key = key(comp)
+                shares[share_key] = shares.get(share_key, 0.0) + fraction
+        return shares
+
+    def validate(self) -> Dict[str, str]:
+        """전체 음식의 참조 구조 검증
+
+        Returns:
+            {잘못된 음식명: 에러 메시지}
+        """
+        errors = {}
+        for food_name in self._store.iter_names():
+            try:
+                self.flatten(food_name)
+            except CompositionGraphError as e:
+                errors[food_name] = str(e)
+        return errors
+
+    def dependents_of_dish(self, food_name: str) -> Set[str]:
+        """해당 음식을 직·간접적으로 사용하는 음식 집합 (자기 자신 제외)"""
+        affected: Set[str] = set()
+        stack = list(self._store.dish_dependents(food_name))
+        while stack:
+            parent = stack.pop()
+            if parent in affected:
+                continue
+            affected.add(parent)
+            stack.extend(self._store.dish_dependents(parent))
+        return affected
+
+    def dishes_using_ingredient(self, ingredient_name: str) -> Set[str]:
+        """해당 재료를 직·간접적으로 사용하는 음식 집합"""
+        affected: Set[str] = set()
+        for food_name in self._store.ingredient_dependents(ingredient_name):
+            affected.add(food_name)
+            affected |= self.dependents_of_dish(food_name)
+        return affected
+
+    def invalidate(self, food_name: str) -> Set[str]:
+        """음식과 이를 사용하는 상위 음식의 평탄화 결과 무효화
+
+        Returns:
+            무효화된 음식 집합
+        """
+        affected = {food_name} | self.dependents_of_dish(food_name)
+        with self._memo_lock:
+            for name in affected:
+                self._flattened.pop(name, None)
+                self._prepared.pop(name, None)
+        return affected
+
+    def update_dish(self, food_name: str, data: DishRecord) -> Set[str]:
+        """음식 구성요소 추가/변경
+
+        변경으로 순환 참조가 생기면 이전 상태로 되돌리고 예외를 발생시킵니다.
+
+        Returns:
+            무효화된 음식 집합
+
+        Raises:
+            CompositionGraphError: 변경된 구성요소가 잘못된 참조를 포함하는 경우
+        """
+        previous = self._store.get(food_name)
+        self._store.put(data)
+        affected = self.invalidate(food_name)
+
+        try:
+            self.flatten(food_name)
+        except CompositionGraphError:
+            if previous is None:
+                self._store.remove(food_name)
+            else:
+                self._store.put(previous)
+            self.invalidate(food_name)
+            raise
+
+        return affected
+
+    def remove_dish(self, food_name: str) -> Set[str]:
+        """음식 삭제
+
+        Returns:
+            무효화된 음식 집합
+        """
+        if not self._store.contains(food_name):
+            return set()
+
+        affected = self.invalidate(food_name)
+        self._store.remove(food_name)
+        return affected
@@ -0,0 +1,164 @@
+import json
+import base64
+import hashlib
+import logging
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from models.schemas import NutrientConstraint
+from services.nutrition_service import NutritionCalculationService, NUTRIENT_KEYS
+from services.nutrient_query import NutrientQueryService
+
+logger = logging.getLogger(__name__)
+
+
+class FoodListPage(NamedTuple):
+    """음식 목록 한 페이지"""
+    items: List[str]
+    next_cursor: Optional[str]
+    total: Optional[int]
+
+
+def parse_nutrient_range(expression: str) -> NutrientConstraint:
+    """`영양성분:최소:최대` 형식의 100g당 범위 조건 해석 (최소/최대는 생략 가능)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    parts = expression.split(':')
+    if len(parts) != 3:
+        raise ValueError(f"영양성분 범위는 '영양성분:최소:최대' 형식이어야 합니다: {expression}")
+    nutrient, lower, upper = parts
+    try:
+        return NutrientConstraint(
+            nutrient=nutrient,
+            min=float(lower) if lower else None,
+            max=float(upper) if upper else None
+        )
+    except ValueError:
+        raise ValueError(f"영양성분 범위 값이 올바르지 않습니다: {expression}")
+
+
+class FoodListingService:
+    """이름순 키셋 페이지 기반 음식 목록 조회 서비스
+
+    커서는 마지막으로 반환한 음식명과 필터 지문을 담은 불투명 문자열이며,
+    페이지 크기와 무관하게 다음 페이지를 인덱스 위치부터 이어서 조회합니다.
+    필터는 음식명 접두어, 재료 포함 여부(하위 음식 포함), 100g당 영양성분 범위를 지원하며
+    영양성분 범위는 미리 계산된 음식 프로필 벡터로 판정합니다.
+    """
+
+    def __init__(self, nutrition_service: NutritionCalculationService, nutrient_query_service: NutrientQueryService):
+        self.nutrition_service = nutrition_service
+        self.nutrient_query_service = nutrient_query_service
+
+    @staticmethod
+    def _fingerprint(prefix: Optional[str], ingredient: Optional[str], ranges: List[NutrientConstraint]) -> str:
+        key = json.dumps(
+            [prefix, ingredient, [[r.nutrient, r.min, r.max] for r in ranges]],
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+
+    @staticmethod
+    def encode_cursor(after: str, fingerprint: str) -> str:
+        payload = json.dumps({'after': after, 'filter': fingerprint}, ensure_ascii=False)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str, fingerprint: str) -> str:
+        """커서에서 마지막 음식명 추출
+
+        Raises:
+            ValueError: 잘못된 커서 또는 다른 필터 조건으로 발급된 커서
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+            after = payload['after']
+            issued_for = payload['filter']
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("잘못된 커서입니다.")
+        if issued_for != fingerprint:
+            raise ValueError("커서가 현재 필터 조건과 일치하지 않습니다.")
+        return after
+
+    def _iter_by_ingredient(self, ingredient: str, prefix: Optional[str], after: Optional[str]) -> Iterator[str]:
+        """재료를 직·간접적으로 사용하는 음식 (역참조 인덱스)"""
+        for food_name in sorted(self.nutrition_service.dish_graph.dishes_using_ingredient(ingredient)):
+            if after is not None and food_name <= after:
+                continue
+            if prefix and not food_name.startswith(prefix):
+                continue
+            yield food_name
+
+    def _iter_by_nutrients(
+        self,
+        bounds: List[Tuple[int, Optional[float], Optional[float]]],
+        prefix: Optional[str],
+        after: Optional[str]
+    ) -> Iterator[str]:
+        """100g당 영양성분 범위를 만족하는 음식 (미리 계산된 프로필 벡터)"""
+        if prefix and (after is None or after < prefix):
+            vectors = self.nutrient_query_service.iter_dish_vectors(prefix, inclusive=True)
+        else:
+            vectors = self.nutrient_query_service.iter_dish_vectors(after, inclusive=False)
+        for vector in vectors:
+            if prefix and not vector.name.startswith(prefix):
+                return
+            if self.nutrient_query_service.matches_bounds(vector.values, bounds):
+                yield vector.name
+
+    def _profile_matches(self, food_name: str, bounds: List[Tuple[int, Optional[float], Optional[float]]]) -> bool:
+        profile = self.nutrition_service.get_dish_profile(food_name)
+        if not profile:
+            return False
+        values = tuple(profile.per_100g[key] for key in NUTRIENT_KEYS)
+        return self.nutrient_query_service.matches_bounds(values, bounds)
+
+    def list_foods(
+        self,
+        prefix: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        nutrient_ranges: Optional[List[NutrientConstraint]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> FoodListPage:
+        """음식 목록 페이지 조회
+
+        Raises:
+            ValueError: 잘못된 커서 또는 필터 조건
+        """
+        ranges = nutrient_ranges or []
+        bounds = self.nutrient_query_service.parse_constraints(ranges)
+        fingerprint = self._fingerprint(prefix, ingredient, ranges)
+        after = self.decode_cursor(cursor, fingerprint) if cursor else None
+
+        if ingredient:
+            candidates = self._iter_by_ingredient(ingredient, prefix, after)
+            if bounds:
+                candidates = (
+                    food_name for food_name in candidates
+                    if self._profile_matches(food_name, bounds)
+                )
+        elif bounds:
+            candidates = self._iter_by_nutrients(bounds, prefix, after)
+        else:
+            candidates = iter(self.nutrition_service.get_available_foods(prefix=prefix, limit=limit + 1, after=after))
+
+        items = []
+        for food_name in candidates:
+            items.append(food_name)
+            if len(items) > limit:
+                break
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = self.encode_cursor(items[-1], fingerprint)
+
+        # 접두어 외 필터가 없는 조회만 전체 개수 제공 (그 외에는 전체 스캔이 필요하므로 생략)
+        total = None
+        if not ingredient and not bounds:
+            total = self.nutrition_service.count_available_foods(prefix=prefix)
+
+        return FoodListPage(items, next_cursor, total)
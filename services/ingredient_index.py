@@ -0,0 +1,301 @@
+import os
+import json
+import heapq
+import logging
+import threading
+import weakref
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from api.nutrition_client import NutritionAPIClient
+from models.records import IngredientNutrients, NUTRIENT_KEYS
+from utils.compute_pool import ComputePool, Handle, SharedArray, iter_rows
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('euclidean', 'manhattan', 'cosine')
+
+
+def read_snapshot_file(
+    api_client: NutritionAPIClient,
+    snapshot_file: Optional[str] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """스냅샷 파일(항목 리스트 또는 API 응답 형식) 로드, 파일이 없으면 None
+
+    Args:
+        snapshot_file: 스냅샷 파일 경로 (미지정 시 INGREDIENT_SNAPSHOT_FILE)
+    """
+    snapshot_file = snapshot_file or os.getenv('INGREDIENT_SNAPSHOT_FILE')
+    if not snapshot_file or not Path(snapshot_file).exists():
+        return None
+    with open(snapshot_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = data if isinstance(data, list) else api_client.extract_nutrition_data(data)
+    logger.info(f"재료 스냅샷 파일 로드: {snapshot_file} ({len(items)}개)")
+    return items
+
+
+def load_ingredient_snapshot(api_client: NutritionAPIClient, snapshot_file: Optional[str] = None) -> List[Dict[str, Any]]:
+    """로컬 재료 스냅샷 로드
+
+    스냅샷 파일(미지정 시 INGREDIENT_SNAPSHOT_FILE)이 있으면 파일에서,
+    없으면 전체 목록 API를 페이지 단위로 조회해 구성합니다.
+    """
+    items = read_snapshot_file(api_client, snapshot_file)
+    if items is not None:
+        return items
+    return fetch_ingredient_list(api_client)
+
+
+def fetch_ingredient_list(
+    api_client: NutritionAPIClient,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> List[Dict[str, Any]]:
+    """전체 목록 API를 페이지 단위로 조회해 재료 목록 구성
+
+    Args:
+        progress: 페이지마다 (조회한 항목 수, 전체 항목 수)로 호출 (예외를 던지면 중단)
+    """
+    num_rows = int(os.getenv('SNAPSHOT_PAGE_SIZE', '1000'))
+    max_pages = int(os.getenv('SNAPSHOT_MAX_PAGES', '50'))
+    items: Dict[str, Dict[str, Any]] = {}
+
+    for page_no in range(1, max_pages + 1):
+        response = api_client.get_food_list(page_no=page_no, num_rows=num_rows)
+        page_items = api_client.extract_nutrition_data(response)
+        new_items = 0
+        for item in page_items:
+            code = item.get('foodCd') or item.get('foodNm')
+            if code not in items:
+                items[code] = item
+                new_items += 1
+
+        total_count = int(response.get('response', {}).get('body', {}).get('totalCount', 0) or 0)
+        if progress is not None:
+            progress(len(items), max(total_count, len(items)))
+        if not new_items or len(items) >= total_count:
+            break
+
+    logger.info(f"재료 스냅샷 구성: {len(items)}개")
+    return list(items.values())
+
+
+def scan_candidates(
+    rows: Iterable[Sequence[float]],
+    offset: int,
+    query: List[float],
+    dims: Optional[List[int]],
+    metric: str,
+    lower_filters: List[Tuple[int, float]],
+    higher_filters: List[Tuple[int, float]],
+    exclude: Optional[int],
+    k: int
+) -> List[Tuple[float, int]]:
+    """행 구간(offset부터)의 거리 계산 후 상위 k개 (거리, 인덱스 위치) 반환
+
+    각 행은 [정규화 값 | 원본 값] 순서로 영양성분 수의 두 배 길이입니다.
+    """
+    width = len(NUTRIENT_KEYS)
+    query_norm = sum(q * q for q in query) ** 0.5
+
+    candidates = []
+    for position, row in enumerate(rows, offset):
+        if position == exclude:
+            continue
+        if any(row[width + d] >= limit for d, limit in lower_filters):
+            continue
+        if any(row[width + d] <= limit for d, limit in higher_filters):
+            continue
+
+        # zip은 질의 길이에서 멈추므로 전체 영양성분 사용 시 행을 자르지 않음
+        point = [row[d] for d in dims] if dims else row
+        if metric == 'euclidean':
+            distance = sum((p - q) ** 2 for p, q in zip(point, query)) ** 0.5
+        elif metric == 'manhattan':
+            distance = sum(abs(p - q) for p, q in zip(point, query))
+        else:
+            norm = sum(p * p for p in (point if dims else row[:width])) ** 0.5
+            dot = sum(p * q for p, q in zip(point, query))
+            distance = 1.0 - dot / (norm * query_norm) if norm and query_norm else 1.0
+        candidates.append((distance, position))
+
+    return heapq.nsmallest(k, candidates)
+
+
+def scan_shared(start: int, stop: int, handle: Handle, *args) -> List[Tuple[float, int]]:
+    """작업 프로세스용: 공유 메모리에 기록된 행 구간 검색"""
+    return scan_candidates(iter_rows(handle, start, stop), start, *args)
+
+
+class IngredientIndex:
+    """정규화된 영양성분 벡터 기반 유사 재료 검색 인덱스
+
+    영양성분별로 표준화(z-score)한 벡터를 미리 계산해 두고,
+    질의마다 전체 벡터와의 거리를 계산해 상위 k개를 반환합니다.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self.items = items
+        self.raw: List[Tuple[float, ...]] = [IngredientNutrients.from_api_item(item).values() for item in items]
+
+        count = max(len(self.raw), 1)
+        self.means = [sum(column) / count for column in zip(*self.raw)] or [0.0] * len(NUTRIENT_KEYS)
+        self.scales = []
+        for i, column in enumerate(zip(*self.raw)):
+            variance = sum((value - self.means[i]) ** 2 for value in column) / count
+            self.scales.append(variance ** 0.5 or 1.0)
+
+        # 검색용 행: [정규화 값 | 원본 값] (원본 값은 lower/higher 조건 비교에 사용)
+        self.rows = [self.normalize(values) + values for values in self.raw]
+        self._by_name = {item.get('foodNm'): i for i, item in enumerate(items)}
+        self._by_code = {item.get('foodCd'): i for i, item in enumerate(items) if item.get('foodCd')}
+        self._shared: Optional[SharedArray] = None
+        self._shared_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def shared(self) -> Handle:
+        """프로세스 풀 검색용 공유 메모리 핸들 (최초 호출 시 기록, 인덱스가 해제되면 함께 해제)"""
+        with self._shared_lock:
+            if self._shared is None:
+                self._shared = SharedArray(self.rows, len(NUTRIENT_KEYS) * 2)
+                weakref.finalize(self, self._shared.close)
+            return self._shared.handle
+
+    def normalize(self, values: Tuple[float, ...]) -> Tuple[float, ...]:
+        return tuple((value - mean) / scale for value, mean, scale in zip(values, self.means, self.scales))
+
+    def find(self, food_name: str = None, food_code: str = None) -> Optional[int]:
+        """식품명 또는 식품코드로 인덱스 위치 조회"""
+        if food_code and food_code in self._by_code:
+            return self._by_code[food_code]
+        return self._by_name.get(food_name)
+
+    def search(
+        self,
+        values: Tuple[float, ...],
+        k: int = 5,
+        metric: str = 'euclidean',
+        nutrients: Optional[List[str]] = None,
+        lower: Optional[List[str]] = None,
+        higher: Optional[List[str]] = None,
+        exclude: Optional[int] = None,
+        pool: Optional[ComputePool] = None
+    ) -> List[Tuple[float, int]]:
+        """유사 재료 검색
+
+        Args:
+            values: 질의 재료의 100g당 영양성분 (NUTRIENT_KEYS 순서)
+            k: 반환할 결과 수
+            metric: 거리 척도 (euclidean, manhattan, cosine)
+            nutrients: 거리 계산에 사용할 영양성분 (기본: 전체)
+            lower: 질의 재료보다 낮아야 하는 영양성분
+            higher: 질의 재료보다 높아야 하는 영양성분
+            exclude: 결과에서 제외할 인덱스 위치 (질의 재료 자신)
+            pool: 지정 시 행 구간을 나눠 작업 프로세스에서 검색
+
+        Returns:
+            (거리, 인덱스 위치) 리스트
+        """
+        if metric not in METRICS:
+            raise ValueError(f"지원하지 않는 거리 척도입니다: {metric}")
+        for key in (nutrients or []) + (lower or []) + (higher or []):
+            if key not in NUTRIENT_KEYS:
+                raise ValueError(f"지원하지 않는 영양성분입니다: {key}")
+
+        dims = [NUTRIENT_KEYS.index(key) for key in nutrients] if nutrients else None
+        query = self.normalize(values)
+        if dims:
+            query = [query[d] for d in dims]
+        lower_filters = [(NUTRIENT_KEYS.index(key), values[NUTRIENT_KEYS.index(key)]) for key in lower or []]
+        higher_filters = [(NUTRIENT_KEYS.index(key), values[NUTRIENT_KEYS.index(key)]) for key in higher or []]
+        args = (query, dims, metric, lower_filters, higher_filters, exclude, k)
+
+        if pool is None or not self.raw:
+            return scan_candidates(self.rows, 0, *args)
+
+        chunks = pool.map_chunks(
+            'ingredient_search', len(self.raw), scan_shared, (self.shared(),) + args,
+            inline=lambda start, stop: scan_candidates(self.rows[start:stop], start, *args)
+        )
+        return heapq.nsmallest(k, (candidate for chunk in chunks for candidate in chunk))
+
+
+class IngredientIndexService:
+    """로컬 재료 스냅샷 기반 유사 재료 검색 서비스"""
+
+    def __init__(self, nutrition_service, compute_pool: Optional[ComputePool] = None):
+        self.nutrition_service = nutrition_service
+        self.compute_pool = compute_pool
+        self._index: Optional[IngredientIndex] = None
+        self._lock = threading.Lock()
+
+    def _load_items(self) -> List[Dict[str, Any]]:
+        # 계산 서비스와 같은 스냅샷 파일 사용 (sync_dataset 작업이 지정한 경로 포함)
+        return load_ingredient_snapshot(self.nutrition_service.api_client, self.nutrition_service.snapshot_file)
+
+    def get_index(self) -> IngredientIndex:
+        """스냅샷 인덱스 반환 (최초 요청 시 생성)"""
+        with self._lock:
+            if self._index is None:
+                self._index = IngredientIndex(self._load_items())
+            return self._index
+
+    def rebuild(self) -> int:
+        """스냅샷을 다시 로드하고 인덱스 재생성
+
+        Returns:
+            인덱스에 포함된 재료 수
+        """
+        index = IngredientIndex(self._load_items())
+        with self._lock:
+            self._index = index
+        return len(index)
+
+    def find_similar(
+        self,
+        ingredient_name: str,
+        k: int = 5,
+        metric: str = 'euclidean',
+        nutrients: Optional[List[str]] = None,
+        lower: Optional[List[str]] = None,
+        higher: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """재료명 기준 유사 재료 검색 (재료를 찾을 수 없으면 None)
+
+        Raises:
+            ValueError: 지원하지 않는 거리 척도 또는 영양성분
+        """
+        index = self.get_index()
+
+        # 스냅샷에서 식품명으로 찾고, 없으면 재료 조회 결과의 식품코드로 찾음
+        position = index.find(food_name=ingredient_name)
+        if position is not None:
+            item = index.items[position]
+            food_code, food_name, values = item.get('foodCd'), item.get('foodNm'), index.raw[position]
+        else:
+            record = self.nutrition_service.get_ingredient_record(ingredient_name)
+            if not record:
+                return None
+            position = index.find(food_name=record.food_name, food_code=record.food_code)
+            food_code, food_name, values = record.food_code, record.food_name, record.values()
+
+        neighbours = index.search(values, k, metric, nutrients, lower, higher, exclude=position, pool=self.compute_pool)
+
+        return {
+            'query': ingredient_name,
+            'food_code': food_code,
+            'food_name': food_name,
+            'metric': metric,
+            'indexed_count': len(index),
+            'results': [
+                {
+                    'food_code': index.items[i].get('foodCd'),
+                    'food_name': index.items[i].get('foodNm'),
+                    'distance': round(distance, 4),
+                    'nutrients': dict(zip(NUTRIENT_KEYS, index.raw[i]))
+                }
+                for distance, i in neighbours
+            ]
+        }
@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSIONS_DB = Path(__file__).parent.parent / "data" / "ingredient_versions.db"
+
+
+def content_hash(item: Dict[str, Any]) -> str:
+    """API 응답 항목의 내용 해시 (키 순서와 무관한 정규화 JSON의 SHA-256)"""
+    canonical = json.dumps(item, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class IngredientVersion(NamedTuple):
+    """재료의 현재 데이터 버전 (내용이 바뀔 때마다 version 증가)"""
+    ingredient_name: str
+    food_code: Optional[str]
+    version: int
+    content_hash: str
+    updated_at: float
+
+
+class IngredientChange(NamedTuple):
+    """변경 피드 항목 (seq: 피드 전체에서 증가하는 순번)
+
+    changes: {API 필드명: {'old': 이전 값, 'new': 새 값}}
+    affected_dishes: 변경 시점에 해당 재료를 직·간접적으로 사용하던 음식
+    """
+    seq: int
+    ingredient_name: str
+    food_code: Optional[str]
+    old_version: int
+    new_version: int
+    old_hash: str
+    new_hash: str
+    changes: Dict[str, Dict[str, Any]]
+    affected_dishes: Tuple[str, ...]
+    recorded_at: float
+
+
+class IngredientVersionStore:
+    """API에서 조회한 재료 데이터의 버전과 변경 피드 (SQLite)
+
+    조회 경로에서 새로 받은 항목의 내용 해시를 현재 버전과 비교해, 다를 때만 새 버전과
+    변경 피드 항목(필드별 이전/새 값, 영향받는 음식)을 기록합니다. 처음 조회한 재료는 기준
+    버전으로만 기록합니다. 현재 버전 해시는 메모리에 두어 내용이 같은 경우 DB를 쓰지 않으며,
+    서버를 다시 시작해도 마지막으로 본 버전과 비교합니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS ingredient_versions (
+            ingredient_name TEXT PRIMARY KEY,
+            food_code TEXT,
+            version INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            item TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS ingredient_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            ingredient_name TEXT NOT NULL,
+            food_code TEXT,
+            old_version INTEGER NOT NULL,
+            new_version INTEGER NOT NULL,
+            old_hash TEXT NOT NULL,
+            new_hash TEXT NOT NULL,
+            changes TEXT NOT NULL,
+            affected_dishes TEXT NOT NULL,
+            recorded_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_VERSIONS_DB, feed_size: int = 10000):
+        self.db_path = Path(db_path)
+        self.feed_size = feed_size
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        self._versions: Dict[str, IngredientVersion] = {
+            row[0]: IngredientVersion(*row)
+            for row in self._conn.execute(
+                "SELECT ingredient_name, food_code, version, content_hash, updated_at FROM ingredient_versions"
+            )
+        }
+
+    def current(self, ingredient_name: str) -> Optional[IngredientVersion]:
+        return self._versions.get(ingredient_name)
+
+    def record(
+        self,
+        ingredient_name: str,
+        item: Dict[str, Any],
+        affected_dishes: Callable[[str], Iterable[str]]
+    ) -> Optional[IngredientChange]:
+        """조회한 항목을 기록하고 내용이 바뀌었으면 변경 피드 항목 반환
+
+        Args:
+            affected_dishes: 재료명 → 사용하는 음식 (내용이 바뀐 경우에만 호출)
+
+        Returns:
+            변경 피드 항목 (처음 조회했거나 내용이 같으면 None)
+        """
+        new_hash = content_hash(item)
+        current = self._versions.get(ingredient_name)
+        if current is not None and current.content_hash == new_hash:
+            return None
+
+        now = time.time()
+        food_code = item.get('foodCd')
+        with self._lock:
+            current = self._versions.get(ingredient_name)
+            if current is not None and current.content_hash == new_hash:
+                return None
+
+            version = IngredientVersion(ingredient_name, food_code, (current.version + 1) if current else 1, new_hash, now)
+            change = None
+            self._conn.execute("BEGIN")
+            try:
+                if current is not None:
+                    row = self._conn.execute(
+                        "SELECT item FROM ingredient_versions WHERE ingredient_name = ?", (ingredient_name,)
+                    ).fetchone()
+                    change = self._insert_change(
+                        current, version, json.loads(row[0]) if row else {}, item,
+                        tuple(sorted(affected_dishes(ingredient_name))), now
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ingredient_versions VALUES (?, ?, ?, ?, ?, ?)",
+                    (ingredient_name, food_code, version.version, new_hash, json.dumps(item, ensure_ascii=False), now)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._versions[ingredient_name] = version
+
+        if change is not None:
+            logger.info(
+                f"재료 데이터 변경: {ingredient_name} ({food_code}) v{change.old_version} → v{change.new_version}, "
+                f"필드 {len(change.changes)}개, 영향 음식 {len(change.affected_dishes)}개"
+            )
+        return change
+
+    def _insert_change(
+        self,
+        current: IngredientVersion,
+        version: IngredientVersion,
+        old_item: Dict[str, Any],
+        new_item: Dict[str, Any],
+        affected: Tuple[str, ...],
+        now: float
+    ) -> IngredientChange:
+        changes = {
+            key: {'old': old_item.get(key), 'new': new_item.get(key)}
+            for key in sorted(old_item.keys() | new_item.keys())
+            if old_item.get(key) != new_item.get(key)
+        }
+        cursor = self._conn.execute(
+            "INSERT INTO ingredient_changes (ingredient_name, food_code, old_version, new_version, old_hash, "
+            "new_hash, changes, affected_dishes, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                version.ingredient_name, version.food_code, current.version, version.version,
+                current.content_hash, version.content_hash,
+                json.dumps(changes, ensure_ascii=False), json.dumps(affected, ensure_ascii=False), now
+            )
+        )
+        seq = cursor.lastrowid
+        # 오래된 피드 항목 정리 (최근 feed_size개 유지)
+        self._conn.execute("DELETE FROM ingredient_changes WHERE seq <= ?", (seq - self.feed_size,))
+        return IngredientChange(
+            seq, version.ingredient_name, version.food_code, current.version, version.version,
+            current.content_hash, version.content_hash, changes, affected, now
+        )
+
+    def changes(self, since: int = 0, limit: int = 100) -> List[IngredientChange]:
+        """since 이후의 변경 피드 (순번 오름차순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM ingredient_changes WHERE seq > ? ORDER BY seq LIMIT ?", (since, limit)
+            ).fetchall()
+        return [
+            IngredientChange(*row[:7], json.loads(row[7]), tuple(json.loads(row[8])), row[9])
+            for row in rows
+        ]
+
+    def affected_since(self, since: int = 0) -> Tuple[Set[str], int]:
+        """since 이후 변경으로 영향받은 음식과 마지막 순번"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, affected_dishes FROM ingredient_changes WHERE seq > ? ORDER BY seq", (since,)
+            ).fetchall()
+        affected: Set[str] = set()
+        for _, dishes in rows:
+            affected.update(json.loads(dishes))
+        return affected, rows[-1][0] if rows else since
+
+    def last_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM ingredient_changes").fetchone()
+        return row[0] or 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_ingredient_version_store() -> IngredientVersionStore:
+    """환경변수 설정에 따른 재료 버전 저장소 생성"""
+    return IngredientVersionStore(
+        Path(os.getenv('INGREDIENT_VERSIONS_DB', str(DEFAULT_VERSIONS_DB))),
+        feed_size=int(os.getenv('INGREDIENT_CHANGE_FEED_SIZE', '10000'))
+    )
@@ -0,0 +1,263 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from models.schemas import EmptyJobParams
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS_DB = Path(__file__).parent.parent / "data" / "jobs.db"
+
+# 작업 상태
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = 'queued', 'running', 'succeeded', 'failed', 'cancelled'
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 중단"""
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업 수 초과"""
+
+
+class JobContext:
+    """실행 중인 작업이 진행률 보고와 취소 확인에 사용하는 객체
+
+    report()는 요청 처리 부하가 있으면(pressure) 잠시 대기해 요청 경로에 CPU를 양보합니다.
+    """
+
+    def __init__(self, runner: 'JobRunner', job_id: str):
+        self.runner = runner
+        self.job_id = job_id
+        self._last_saved = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.job_id in self.runner._cancel_requested
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, done: int, total: int, message: Optional[str] = None):
+        """진행률 보고 (DB 기록은 최소 간격 단위) 후 취소 확인 및 부하 시 양보"""
+        now = time.time()
+        if done >= total or now - self._last_saved >= self.runner.progress_interval:
+            self.runner._update(self.job_id, progress=round(done / total, 4) if total else 1.0, message=message)
+            self._last_saved = now
+        self.check_cancelled()
+        self.runner.yield_to_requests()
+
+
+class JobRunner:
+    """SQLite 작업 테이블 기반 프로세스 내 작업 실행기
+
+    등록된 작업 종류만 실행하며, 요청 처리와 분리된 소수의 작업 스레드(JOB_WORKERS)에서
+    하나씩 실행합니다. 서버가 재시작되면 대기 중이던 작업은 다시 대기열에 넣고,
+    실행 중이던 작업은 실패로 기록합니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            progress REAL NOT NULL DEFAULT 0,
+            message TEXT,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at);
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_JOBS_DB,
+        workers: int = 1,
+        max_pending: int = 20,
+        pressure: Optional[Callable[[], bool]] = None
+    ):
+        self.db_path = Path(db_path)
+        self.max_pending = max_pending
+        self.pressure = pressure
+        # 요청 처리 부하가 있을 때 진행률 보고마다 대기하는 시간(초)
+        self.backoff = float(os.getenv('JOB_BACKOFF_MS', '50')) / 1000
+        self.progress_interval = 0.5
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._params: Dict[str, Type[BaseModel]] = {}
+        self._cancel_requested: set = set()
+        self._lock = threading.RLock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='job-worker')
+        self._recovered = False
+
+    def register(self, kind: str, handler: Callable[..., Any], params_model: Optional[Type[BaseModel]] = None):
+        """작업 종류 등록 (handler(context, **params) -> JSON 직렬화 가능한 결과)
+
+        Args:
+            params_model: 작업 매개변수 모델 (등록 시 검증, 미지정 시 매개변수 없음)
+        """
+        self._handlers[kind] = handler
+        self._params[kind] = params_model or EmptyJobParams
+
+    @property
+    def kinds(self) -> List[str]:
+        return sorted(self._handlers)
+
+    def recover(self):
+        """이전 프로세스에서 남은 작업 정리 (등록 완료 후 한 번 호출)"""
+        with self._lock:
+            if self._recovered:
+                return
+            self._recovered = True
+            now = time.time()
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                (FAILED, "서버 재시작으로 중단되었습니다.", now, RUNNING)
+            )
+            queued = [row[0] for row in self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            )]
+        for job_id in queued:
+            self._executor.submit(self._run, job_id)
+        if queued:
+            logger.info(f"대기 중이던 작업 {len(queued)}개를 다시 실행합니다.")
+
+    def submit(self, kind: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """작업 등록
+
+        Raises:
+            ValueError: 등록되지 않은 작업 종류 또는 잘못된 매개변수 (알 수 없는 키, 잘못된 타입)
+            JobQueueFull: 대기/실행 중인 작업이 max_pending개 이상
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"지원하지 않는 작업입니다: {kind} (지원: {', '.join(self.kinds)})")
+        try:
+            params = self._params[kind].model_validate(params or {}).model_dump(exclude_none=True)
+        except ValidationError as e:
+            errors = '; '.join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'params'}: {error['msg']}" for error in e.errors()
+            )
+            raise ValueError(f"'{kind}' 작업 매개변수가 올바르지 않습니다: {errors}")
+        job_id = uuid.uuid4().hex[:12]
+
+        with self._lock:
+            pending = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 ({pending}개).")
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, params, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(params, ensure_ascii=False), QUEUED, time.time())
+            )
+        self._executor.submit(self._run, job_id)
+        logger.info(f"작업 등록: {kind} ({job_id})")
+        return self.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 취소 (대기 중이면 즉시, 실행 중이면 다음 진행률 보고 시 중단)"""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job['status'] in FINISHED_STATUSES:
+                return job
+            if job['status'] == QUEUED:
+                self._update(job_id, status=CANCELLED, finished_at=time.time())
+            else:
+                self._cancel_requested.add(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+            row = cursor.fetchone()
+        return self._to_dict([column[0] for column in cursor.description], row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM jobs"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            cursor = self._conn.execute(query, args + (limit,))
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        return [self._to_dict(columns, row) for row in rows]
+
+    @staticmethod
+    def _to_dict(columns: List[str], row: tuple) -> Dict[str, Any]:
+        job = dict(zip(columns, row))
+        job['params'] = json.loads(job['params'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+
+    def _update(self, job_id: str, **values):
+        if 'result' in values:
+            values['result'] = json.dumps(values['result'], ensure_ascii=False)
+        if 'message' in values and values['message'] is None:
+            del values['message']
+        assignments = ', '.join(f"{key} = ?" for key in values)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*values.values(), job_id))
+
+    def yield_to_requests(self):
+        """요청 처리 부하가 있는 동안 작업 스레드 대기"""
+        if self.pressure is None:
+            return
+        waited = 0.0
+        while self.pressure() and waited < 5.0:
+            time.sleep(self.backoff)
+            waited += self.backoff
+
+    def _run(self, job_id: str):
+        with self._lock:
+            job = self.get(job_id)
+            if job is None or job['status'] != QUEUED:
+                return
+            self._update(job_id, status=RUNNING, started_at=time.time())
+
+        context = JobContext(self, job_id)
+        try:
+            result = self._handlers[job['kind']](context, **job['params'])
+            self._update(job_id, status=SUCCEEDED, progress=1.0, result=result, finished_at=time.time())
+            logger.info(f"작업 완료: {job['kind']} ({job_id})")
+        except JobCancelled:
+            self._update(job_id, status=CANCELLED, finished_at=time.time())
+            logger.info(f"작업 취소: {job['kind']} ({job_id})")
+        except Exception as e:
+            self._update(job_id, status=FAILED, error=str(e), finished_at=time.time())
+            logger.error(f"작업 실패: {job['kind']} ({job_id}): {e}")
+        finally:
+            self._cancel_requested.discard(job_id)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_job_runner(pressure: Optional[Callable[[], bool]] = None) -> JobRunner:
+    """환경변수 설정에 따른 작업 실행기 생성"""
+    return JobRunner(
+        Path(os.getenv('JOBS_DB', str(DEFAULT_JOBS_DB))),
+        workers=int(os.getenv('JOB_WORKERS', '1')),
+        max_pending=int(os.getenv('JOB_MAX_PENDING', '20')),
+        pressure=pressure
+    )
@@ -0,0 +1,191 @@
+import os
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.schemas import LiveCalculationUpdate
+from services.nutrition_service import NutritionCalculationService, DishProfile, NUTRIENT_KEYS
+from services.composition_catalog import DishRecord, compile_dish_record
+from services.dish_graph import CompositionGraphError
+from services.quantity import DishUnits, QuantityError
+
+logger = logging.getLogger(__name__)
+
+# 상세 값 비교/전송 시 반올림 자릿수 (응답 합계와 동일)
+ROUND_DIGITS = 2
+
+
+class LiveCalculationError(ValueError):
+    """실시간 계산 채널에서 처리할 수 없는 입력"""
+
+
+def diff_payload(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """이전 결과 대비 바뀐 값만 추출 (중첩 dict는 재귀 비교, 사라진 키는 None)"""
+    changed: Dict[str, Any] = {}
+    for key, value in current.items():
+        if key not in previous:
+            changed[key] = value
+            continue
+        old = previous[key]
+        if old == value:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            changed[key] = diff_payload(old, value)
+        else:
+            changed[key] = value
+    for key in previous.keys() - current.keys():
+        changed[key] = None
+    return changed
+
+
+class LiveCalculationSession:
+    """실시간 계산 채널 한 개의 상태
+
+    연결 동안 음식 프로필(편집 중인 구성요소면 그 구성으로 만든 프로필)을 보관해 두고,
+    중량/옵션만 바뀐 입력은 프로필 조회 없이 바로 다시 계산합니다. 프로필은 음식이나
+    구성요소가 바뀌었거나 재료 데이터 변경으로 프로필이 무효화된 경우에만 다시 만듭니다.
+    누락된 재료가 있는 프로필은 LIVE_MISSING_RETRY_SECONDS가 지난 뒤에만 다시 조회합니다.
+    결과는 직전에 보낸 값과 비교해 바뀐 항목만 반환합니다.
+    """
+
+    def __init__(self, nutrition_service: NutritionCalculationService):
+        self.nutrition_service = nutrition_service
+        self.food_name: Optional[str] = None
+        self.weight_grams: Optional[float] = None
+        self.quantity: Optional[float] = None
+        self.unit = 'g'
+        self.apply_refuse = False
+        self.apply_cooking = False
+        self.fields: Optional[Tuple[str, ...]] = None
+        self.detail = True
+        self.record: Optional[DishRecord] = None  # 편집 중인 구성요소 (없으면 등록된 구성)
+        self.seq = 0
+        self._profile: Optional[DishProfile] = None
+        self._profile_key: Optional[Tuple] = None
+        self._loaded_at = 0.0
+        # 편집 중인 구성요소의 단위 환산 계수 (등록된 구성이면 None)
+        self._units: Optional[DishUnits] = None
+        self._sent: Optional[Dict[str, Any]] = None
+        # 누락 재료가 있는 프로필의 재조회 최소 간격(초)
+        self.retry_interval = float(os.getenv('LIVE_MISSING_RETRY_SECONDS', '10'))
+
+    def apply(self, update: LiveCalculationUpdate):
+        """입력 메시지를 세션 상태에 반영
+
+        Raises:
+            LiveCalculationError: 지원하지 않는 영양성분 또는 잘못된 구성요소
+        """
+        if update.food_name is not None and update.food_name != self.food_name:
+            self.food_name = update.food_name
+            self.record = None
+            self._sent = None
+        if update.weight_grams is not None:
+            self.weight_grams, self.quantity = update.weight_grams, None
+        if update.quantity is not None:
+            self.quantity, self.weight_grams = update.quantity, None
+        if update.unit is not None:
+            self.unit = update.unit
+        if update.apply_refuse is not None:
+            self.apply_refuse = update.apply_refuse
+        if update.apply_cooking is not None:
+            self.apply_cooking = update.apply_cooking
+        if update.detail is not None:
+            self.detail = update.detail
+        if update.fields is not None:
+            unknown = set(update.fields) - set(NUTRIENT_KEYS)
+            if unknown:
+                raise LiveCalculationError(f"지원하지 않는 영양성분입니다: {', '.join(sorted(unknown))}")
+            self.fields = tuple(update.fields) or None
+        if update.compositions is not None:
+            if self.food_name is None:
+                raise LiveCalculationError("구성요소를 편집하려면 food_name이 필요합니다.")
+            if not update.compositions:
+                self.record = None
+            else:
+                try:
+                    self.record = compile_dish_record(self.food_name, {'compositions': update.compositions})
+                except ValueError as e:
+                    raise LiveCalculationError(str(e))
+
+    def _current_key(self) -> Tuple:
+        return (self.food_name, self.record, self.nutrition_service.profile_version)
+
+    def needs_profile(self) -> bool:
+        """프로필을 (다시) 만들어야 하는지 여부 (재료 조회가 필요할 수 있어 별도 스레드에서 load_profile 호출)"""
+        if self.food_name is None:
+            return False
+        if self._profile_key != self._current_key():
+            return True
+        return bool(self._profile.missing_ingredients) and time.time() - self._loaded_at >= self.retry_interval
+
+    def load_profile(self):
+        """현재 음식/구성요소의 프로필 생성
+
+        Raises:
+            LiveCalculationError: 등록되지 않은 음식 또는 하위 음식 참조 오류
+        """
+        key = self._current_key()
+        units = None
+        if self.record is None:
+            profile = self.nutrition_service.get_dish_profile(self.food_name)
+            if profile is None:
+                raise LiveCalculationError(f"'{self.food_name}' 음식 정보를 찾을 수 없습니다.")
+        else:
+            try:
+                shares, prepared = self.nutrition_service.dish_graph.flatten_record(self.record)
+            except CompositionGraphError as e:
+                raise LiveCalculationError(str(e))
+            profile = self.nutrition_service.compile_profile(self.food_name, shares, prepared)
+            # 부피/개수 환산도 등록된 구성이 아닌 편집 중인 구성 기준
+            units = self.nutrition_service.quantities.record_units(self.record, shares)
+        self._profile, self._profile_key, self._units = profile, key, units
+        self._loaded_at = time.time()
+
+    def _resolve_weight(self) -> float:
+        if self.quantity is not None:
+            try:
+                return self.nutrition_service.quantities.to_grams(
+                    self.food_name, self.quantity, self.unit, self._units
+                )
+            except QuantityError as e:
+                raise LiveCalculationError(str(e))
+        if self.weight_grams is None:
+            raise LiveCalculationError("weight_grams 또는 quantity가 필요합니다.")
+        return self.weight_grams
+
+    def calculate(self) -> Dict[str, Any]:
+        """현재 상태로 계산해 직전 결과 대비 변경분 메시지 생성 (load_profile 이후 호출)
+
+        Raises:
+            LiveCalculationError: 음식/중량이 지정되지 않았거나 환산할 수 없는 수량
+        """
+        if self._profile is None or self.food_name is None:
+            raise LiveCalculationError("food_name이 필요합니다.")
+        weight = self._resolve_weight()
+        result = self.nutrition_service.build_profile_result(
+            self._profile, weight, self.apply_refuse, self.apply_cooking, self.fields, self.detail
+        )
+        payload = self._to_payload(result.model_dump(exclude_none=True))
+        if self.quantity is not None:
+            payload['quantity'], payload['unit'] = self.quantity, self.unit
+        payload['edited'] = self.record is not None
+
+        full = self._sent is None
+        changed = payload if full else diff_payload(self._sent, payload)
+        self._sent = payload
+        self.seq += 1
+        return {'type': 'result', 'seq': self.seq, 'full': full, 'data': changed}
+
+    @staticmethod
+    def _to_payload(result: Dict[str, Any]) -> Dict[str, Any]:
+        """구성요소별 상세를 재료명 기준 dict로 바꾸고 반올림 (재료 단위 변경분 비교용)"""
+        details: List[Dict[str, Any]] = result.pop('composition_details', None) or []
+        if details:
+            result['composition_details'] = {
+                detail['ingredient_name']: {
+                    key: round(value, ROUND_DIGITS) if isinstance(value, float) else value
+                    for key, value in detail.items() if key != 'ingredient_name'
+                }
+                for detail in details
+            }
+        return result
@@ -0,0 +1,217 @@
+import os
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from models.schemas import (
+    MealEntry,
+    MealPlanEntry,
+    MealPlanSummary,
+    NutrientIntake
+)
+from services.nutrition_service import NutritionCalculationService, NUTRIENT_KEYS
+from services.quantity import QuantityError
+
+logger = logging.getLogger(__name__)
+
+# 1일 영양성분 기준치 (식품 등의 표시기준, 성인 기준)
+DAILY_REFERENCE_VALUES = {
+    'energy': 2000.0,
+    'protein': 55.0,
+    'fat': 54.0,
+    'carbohydrate': 324.0,
+    'sugar': 100.0,
+    'dietary_fiber': 25.0,
+    'calcium': 700.0,
+    'iron': 12.0,
+    'sodium': 2000.0,
+    'potassium': 3500.0,
+    'vitamin_a': 700.0,
+    'vitamin_c': 100.0,
+    'phosphorus': 700.0,
+    'thiamine': 1.2,
+    'riboflavin': 1.4,
+    'niacin': 15.0,
+    'vitamin_d': 10.0,
+    'cholesterol': 300.0,
+    'saturated_fat': 15.0
+}
+
+
+class MealPlan:
+    """식단 상태 (합계와 끼니별 소계를 항목 추가/삭제 시 증분 갱신)"""
+
+    def __init__(self, plan_id: str):
+        self.plan_id = plan_id
+        self.entries: Dict[str, MealPlanEntry] = {}
+        self.totals = {key: 0.0 for key in NUTRIENT_KEYS}
+        self.meal_totals: Dict[str, Dict[str, float]] = {}
+        self.meal_counts: Dict[str, int] = {}
+
+    def add(self, entry: MealPlanEntry):
+        """항목 추가 (해당 항목 영양성분만 합산)"""
+        self.entries[entry.entry_id] = entry
+        meal_total = self.meal_totals.setdefault(entry.meal, {key: 0.0 for key in NUTRIENT_KEYS})
+        self.meal_counts[entry.meal] = self.meal_counts.get(entry.meal, 0) + 1
+
+        for key, value in entry.nutrients.items():
+            self.totals[key] += value
+            meal_total[key] += value
+
+    def remove(self, entry_id: str) -> bool:
+        """항목 삭제 (해당 항목 영양성분만 차감)"""
+        entry = self.entries.pop(entry_id, None)
+        if entry is None:
+            return False
+
+        self.meal_counts[entry.meal] -= 1
+        if self.meal_counts[entry.meal] == 0:
+            # 빈 끼니는 누적 오차 없이 제거
+            del self.meal_counts[entry.meal]
+            del self.meal_totals[entry.meal]
+        else:
+            meal_total = self.meal_totals[entry.meal]
+            for key, value in entry.nutrients.items():
+                meal_total[key] -= value
+
+        if not self.entries:
+            self.totals = {key: 0.0 for key in NUTRIENT_KEYS}
+        else:
+            for key, value in entry.nutrients.items():
+                self.totals[key] -= value
+        return True
+
+    def summary(self) -> MealPlanSummary:
+        """식단 합계 및 기준치 비교 결과 생성"""
+        totals = {key: round(value, 2) for key, value in self.totals.items()}
+
+        intake_comparison = []
+        for key, reference in DAILY_REFERENCE_VALUES.items():
+            if key not in totals:
+                continue
+            amount = totals[key]
+            intake_comparison.append(NutrientIntake(
+                nutrient=key,
+                amount=amount,
+                reference=reference,
+                percentage=round(amount / reference * 100.0, 1)
+            ))
+
+        return MealPlanSummary(
+            plan_id=self.plan_id,
+            entries=list(self.entries.values()),
+            totals=totals,
+            meals={
+                meal: {key: round(value, 2) for key, value in meal_total.items()}
+                for meal, meal_total in self.meal_totals.items()
+            },
+            intake_comparison=intake_comparison
+        )
+
+
+class MealPlanService:
+    """식단(하루 단위) 영양성분 집계 서비스"""
+
+    def __init__(self, nutrition_service: NutritionCalculationService):
+        self.nutrition_service = nutrition_service
+        self.max_plans = int(os.getenv('MEAL_PLAN_MAX_PLANS', '1000'))
+        self._plans: "OrderedDict[str, MealPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _resolve_weights(self, entries: List[MealEntry]) -> List[float]:
+        """항목별 중량(g) 일괄 결정 (수량/단위로 지정된 항목은 한 번에 환산)
+
+        Raises:
+            QuantityError: 중량/수량이 없거나 환산할 수 없는 항목
+        """
+        weights: List[Optional[float]] = []
+        pending = []
+        for i, entry in enumerate(entries):
+            if entry.quantity is None:
+                if entry.weight_grams is None:
+                    raise QuantityError(f"'{entry.food_name}' 항목에 weight_grams 또는 quantity가 필요합니다.")
+                weights.append(entry.weight_grams)
+            elif entry.weight_grams is not None:
+                raise QuantityError(f"'{entry.food_name}' 항목에 weight_grams와 quantity를 함께 지정할 수 없습니다.")
+            else:
+                weights.append(None)
+                pending.append(i)
+
+        resolved = self.nutrition_service.quantities.resolve_many(
+            (entries[i].food_name, entries[i].quantity, entries[i].unit) for i in pending
+        )
+        for i, weight in zip(pending, resolved):
+            weights[i] = weight
+        return weights
+
+    def _build_entry(self, entry: MealEntry, weight_grams: float) -> MealPlanEntry:
+        """음식 프로필로 항목 영양성분 계산
+
+        Raises:
+            ValueError: 등록되지 않았거나 계산할 수 없는 음식
+        """
+        profile = self.nutrition_service.get_dish_profile(entry.food_name)
+        if not profile:
+            raise ValueError(f"'{entry.food_name}' 영양성분 계산에 실패했습니다.")
+
+        _, per_100g = self.nutrition_service.select_variant(profile, entry.apply_refuse, entry.apply_cooking)
+        weight_ratio = weight_grams / 100.0
+        return MealPlanEntry(
+            entry_id=uuid.uuid4().hex[:12],
+            food_name=entry.food_name,
+            weight_grams=weight_grams,
+            meal=entry.meal,
+            nutrients={key: value * weight_ratio for key, value in per_100g.items()},
+            missing_ingredients=list(profile.missing_ingredients)
+        )
+
+    def _get_plan(self, plan_id: str) -> Optional[MealPlan]:
+        plan = self._plans.get(plan_id)
+        if plan is not None:
+            self._plans.move_to_end(plan_id)
+        return plan
+
+    def create_plan(self, entries: List[MealEntry]) -> MealPlanSummary:
+        """식단 생성"""
+        built = [self._build_entry(entry, weight) for entry, weight in zip(entries, self._resolve_weights(entries))]
+        plan = MealPlan(uuid.uuid4().hex)
+        for entry in built:
+            plan.add(entry)
+
+        with self._lock:
+            self._plans[plan.plan_id] = plan
+            while len(self._plans) > self.max_plans:
+                evicted_id, _ = self._plans.popitem(last=False)
+                logger.info(f"식단 보관 한도 초과로 제거: {evicted_id}")
+            return plan.summary()
+
+    def get_plan(self, plan_id: str) -> Optional[MealPlanSummary]:
+        """식단 조회"""
+        with self._lock:
+            plan = self._get_plan(plan_id)
+            return plan.summary() if plan else None
+
+    def add_entry(self, plan_id: str, entry: MealEntry) -> Optional[MealPlanSummary]:
+        """식단 항목 추가"""
+        built = self._build_entry(entry, self._resolve_weights([entry])[0])
+        with self._lock:
+            plan = self._get_plan(plan_id)
+            if plan is None:
+                return None
+            plan.add(built)
+            return plan.summary()
+
+    def remove_entry(self, plan_id: str, entry_id: str) -> Optional[MealPlanSummary]:
+        """식단 항목 삭제 (식단 또는 항목이 없으면 None)"""
+        with self._lock:
+            plan = self._get_plan(plan_id)
+            if plan is None or not plan.remove(entry_id):
+                return None
+            return plan.summary()
+
+    def delete_plan(self, plan_id: str) -> bool:
+        """식단 삭제"""
+        with self._lock:
+            return self._plans.pop(plan_id, None) is not None
@@ -0,0 +1,247 @@
+import os
+import time
+import bisect
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from models.schemas import (
+    NutrientConstraint,
+    NutrientQueryRequest,
+    NutrientQueryMatch,
+    NutrientQueryResponse
+)
+from services.nutrition_service import NutritionCalculationService, NUTRIENT_KEYS
+
+logger = logging.getLogger(__name__)
+
+NUTRIENT_INDEX = {key: i for i, key in enumerate(NUTRIENT_KEYS)}
+
+
+class NutrientVector(NamedTuple):
+    """100g당 영양성분 벡터 (NUTRIENT_KEYS 순서)"""
+    name: str
+    kind: str
+    values: Tuple[float, ...]
+
+
+class NutrientQueryService:
+    """영양성분 목표를 만족하는 음식/재료와 중량 범위 역조회 서비스
+
+    음식 프로필과 재료별 100g당 영양성분을 벡터로 미리 계산해 두고,
+    조건별 중량 범위를 해석적으로 구해 교집합으로 후보를 거릅니다.
+    누락 재료가 있는 음식은 100g당 값이 실제보다 작게 계산되므로 재조회에 성공할 때까지
+    후보에서 제외합니다.
+    """
+
+    def __init__(self, nutrition_service: NutritionCalculationService):
+        self.nutrition_service = nutrition_service
+        self._vectors: List[NutrientVector] = []
+        self._dishes: Dict[str, NutrientVector] = {}
+        self._ingredients: Dict[str, NutrientVector] = {}
+        # 음식별로 벡터를 만든 재료 (어느 음식도 사용하지 않는 재료 벡터 정리용)
+        self._dish_ingredients: Dict[str, Tuple[str, ...]] = {}
+        # 음식 벡터만 이름순으로 정렬한 목록 (음식 목록 필터의 키셋 페이지 조회용)
+        self._dish_vectors: List[NutrientVector] = []
+        self._dish_names: List[str] = []
+        self._built_version: Optional[int] = None
+        # 누락 재료가 있거나 프로필을 만들지 못한 음식 (재시도 간격마다 해당 음식만 다시 계산)
+        self._incomplete: Set[str] = set()
+        self._retried_at = 0.0
+        self.retry_interval = float(os.getenv('NUTRIENT_VECTOR_RETRY_SECONDS', '60'))
+        self._lock = threading.Lock()
+
+    def _build_vectors(
+        self,
+        food_names: Iterable[str],
+        dishes: Dict[str, NutrientVector],
+        ingredients: Dict[str, NutrientVector],
+        dish_ingredients: Dict[str, Tuple[str, ...]]
+    ) -> Set[str]:
+        """음식/재료 벡터를 생성해 dishes/ingredients에 반영
+
+        누락 재료가 있는 음식은 음식 벡터를 만들지 않고(후보 제외), 조회된 재료 벡터만 반영합니다.
+
+        Returns:
+            누락 재료가 있거나 프로필을 만들지 못한 음식
+        """
+        incomplete: Set[str] = set()
+        for food_name in food_names:
+            dishes.pop(food_name, None)
+            dish_ingredients.pop(food_name, None)
+            if not self.nutrition_service.dish_graph.has_dish(food_name):
+                # 삭제된 음식
+                continue
+            profile = self.nutrition_service.get_dish_profile(food_name)
+            if not profile:
+                incomplete.add(food_name)
+                continue
+
+            for share in profile.ingredients:
+                ingredients[share.ingredient_name] = NutrientVector(
+                    share.ingredient_name, 'ingredient', tuple(share.nutrients[key] for key in NUTRIENT_KEYS)
+                )
+            dish_ingredients[food_name] = tuple(share.ingredient_name for share in profile.ingredients)
+            if profile.missing_ingredients:
+                incomplete.add(food_name)
+                continue
+            dishes[food_name] = NutrientVector(
+                food_name, 'dish', tuple(profile.per_100g[key] for key in NUTRIENT_KEYS)
+            )
+        return incomplete
+
+    def get_vectors(self) -> List[NutrientVector]:
+        """미리 계산된 벡터 반환
+
+        프로필이 무효화된 음식만 다시 계산하며, 무효화 기록이 남아 있지 않으면 전체를 다시
+        생성합니다. 누락 재료가 있던 음식은 재시도 간격(NUTRIENT_VECTOR_RETRY_SECONDS)이
+        지난 경우에만 해당 음식만 다시 계산합니다. 남은 음식이 사용하지 않는 재료 벡터는 제거합니다.
+        """
+        with self._lock:
+            version = self.nutrition_service.profile_version
+            retry = bool(self._incomplete) and time.time() - self._retried_at >= self.retry_interval
+            if self._built_version == version and not retry:
+                return self._vectors
+
+            changed = None
+            if self._built_version is not None:
+                changed = self.nutrition_service.profiles_changed_since(self._built_version)
+            if changed is None:
+                dishes, ingredients, dish_ingredients = {}, {}, {}
+                incomplete = self._build_vectors(
+                    self.nutrition_service.iter_available_foods(), dishes, ingredients, dish_ingredients
+                )
+                self._retried_at = time.time()
+            else:
+                targets = changed | self._incomplete if retry else changed
+                dishes, ingredients = dict(self._dishes), dict(self._ingredients)
+                dish_ingredients = dict(self._dish_ingredients)
+                incomplete = (self._incomplete - targets) | self._build_vectors(
+                    sorted(targets), dishes, ingredients, dish_ingredients
+                )
+                if retry:
+                    self._retried_at = time.time()
+                used = {name for names in dish_ingredients.values() for name in names}
+                ingredients = {name: vector for name, vector in ingredients.items() if name in used}
+
+            self._dishes, self._ingredients, self._incomplete = dishes, ingredients, incomplete
+            self._dish_ingredients = dish_ingredients
+            self._vectors = list(dishes.values()) + list(ingredients.values())
+            self._dish_vectors = sorted(dishes.values(), key=lambda vector: vector.name)
+            self._dish_names = [vector.name for vector in self._dish_vectors]
+            self._built_version = version
+            if changed is None:
+                logger.info(f"영양성분 벡터 생성: {len(self._vectors)}개 (누락 재료 음식 {len(incomplete)}개)")
+            else:
+                logger.info(f"영양성분 벡터 갱신: 음식 {len(targets)}개 재계산 (전체 {len(self._vectors)}개)")
+            return self._vectors
+
+    def iter_dish_vectors(self, start: Optional[str] = None, inclusive: bool = True) -> Iterator[NutrientVector]:
+        """이름순 음식 벡터 순회 (start 이후부터)"""
+        self.get_vectors()
+        with self._lock:
+            dish_vectors, dish_names = self._dish_vectors, self._dish_names
+        if start is None:
+            index = 0
+        elif inclusive:
+            index = bisect.bisect_left(dish_names, start)
+        else:
+            index = bisect.bisect_right(dish_names, start)
+        return iter(dish_vectors[index:])
+
+    @staticmethod
+    def matches_bounds(values: Tuple[float, ...], bounds: List[Tuple[int, Optional[float], Optional[float]]]) -> bool:
+        """100g당 영양성분이 모든 범위 조건을 만족하는지 여부"""
+        for index, lower, upper in bounds:
+            value = values[index]
+            if (lower is not None and value < lower) or (upper is not None and value > upper):
+                return False
+        return True
+
+    @staticmethod
+    def _weight_range(
+        values: Tuple[float, ...],
+        bounds: List[Tuple[int, Optional[float], Optional[float]]],
+        min_weight: float,
+        max_weight: float
+    ) -> Optional[Tuple[float, float]]:
+        """조건을 모두 만족하는 중량 범위 계산 (만족할 수 없으면 None)"""
+        low, high = min_weight, max_weight
+        for index, lower, upper in bounds:
+            per_gram = values[index] / 100.0
+            if per_gram <= 0:
+                if lower is not None and lower > 0:
+                    return None
+                continue
+            if lower is not None:
+                low = max(low, lower / per_gram)
+            if upper is not None:
+                high = min(high, upper / per_gram)
+            if low > high:
+                return None
+        return low, high
+
+    def query(self, request: NutrientQueryRequest) -> NutrientQueryResponse:
+        """영양성분 목표 역조회
+
+        Raises:
+            ValueError: 지원하지 않는 영양성분 또는 잘못된 조건
+        """
+        bounds = self.parse_constraints(request.constraints)
+        if request.min_weight > request.max_weight:
+            raise ValueError("최소 중량은 최대 중량보다 클 수 없습니다.")
+
+        sort_index = None
+        if request.sort_by not in ('min_weight', 'max_weight'):
+            if request.sort_by not in NUTRIENT_INDEX:
+                raise ValueError(f"지원하지 않는 정렬 기준입니다: {request.sort_by}")
+            sort_index = NUTRIENT_INDEX[request.sort_by]
+
+        kinds = {'dishes': ('dish',), 'ingredients': ('ingredient',), 'all': ('dish', 'ingredient')}[request.scope]
+        candidates = [vector for vector in self.get_vectors() if vector.kind in kinds]
+
+        feasible = []
+        for vector in candidates:
+            weight_range = self._weight_range(vector.values, bounds, request.min_weight, request.max_weight)
+            if weight_range is not None:
+                feasible.append((vector, weight_range))
+
+        if sort_index is not None:
+            sort_key = lambda item: item[0].values[sort_index]
+        elif request.sort_by == 'max_weight':
+            sort_key = lambda item: item[1][1]
+        else:
+            sort_key = lambda item: item[1][0]
+        feasible.sort(key=sort_key, reverse=request.descending)
+
+        matches = []
+        for vector, (low, high) in feasible[:request.limit]:
+            matches.append(NutrientQueryMatch(
+                name=vector.name,
+                kind=vector.kind,
+                min_weight=round(low, 2),
+                max_weight=round(high, 2),
+                nutrients_at_min_weight={
+                    constraint.nutrient: round(vector.values[NUTRIENT_INDEX[constraint.nutrient]] * low / 100.0, 2)
+                    for constraint in request.constraints
+                }
+            ))
+
+        return NutrientQueryResponse(
+            total_candidates=len(candidates),
+            total_matches=len(feasible),
+            matches=matches
+        )
+
+    @staticmethod
+    def parse_constraints(constraints: List[NutrientConstraint]) -> List[Tuple[int, Optional[float], Optional[float]]]:
+        bounds = []
+        for constraint in constraints:
+            if constraint.nutrient not in NUTRIENT_INDEX:
+                raise ValueError(f"지원하지 않는 영양성분입니다: {constraint.nutrient}")
+            if constraint.min is None and constraint.max is None:
+                raise ValueError(f"'{constraint.nutrient}' 조건에 min 또는 max가 필요합니다.")
+            if constraint.min is not None and constraint.max is not None and constraint.min > constraint.max:
+                raise ValueError(f"'{constraint.nutrient}' 조건의 min이 max보다 큽니다.")
+            bounds.append((NUTRIENT_INDEX[constraint.nutrient], constraint.min, constraint.max))
+        return bounds
@@ -1,180 +1,675 @@
-import json
+import os
+import time
 import logging
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+import threading
+from collections import OrderedDict, deque
+from typing import Collection, Dict, Any, Iterable, Iterator, List, Optional, Set, NamedTuple, Tuple
 
 from api.nutrition_client import NutritionAPIClient
 from models.schemas import (
     NutritionInfo, 
     ComplexFood, 
-    FoodComposition, 
     CalculatedNutrition,
-    NutritionCalculationRequest
+    IngredientCoverage,
+    NutritionCalculationRequest,
+    NutritionCoverage
 )
+from models.records import IngredientNutrients, NUTRIENT_KEYS
+from services.dish_graph import DishGraph, CompositionGraphError
+from utils.tracing import tracer
+from utils import deadline
+from utils.deadline import DeadlineExceeded
+from services.composition_catalog import DishRecord, compile_dish_record
+from services.composition_store import CompositionStore, create_composition_store
+from services.ingredient_index import read_snapshot_file
+from services.quantity import QuantityService, QuantityError
+from services.cooking_factors import CookingFactorTable
+from services.ingredient_versions import IngredientChange, create_ingredient_version_store
 
 logger = logging.getLogger(__name__)
 
+# 정상 출처 (이 출처의 재료로만 구성된 프로필만 캐시)
+RELIABLE_SOURCES = ('fresh', 'cache')
+
+
+class CachedIngredient(NamedTuple):
+    """조회된 재료 영양성분 캐시 항목 (source: 이번 조회의 출처)"""
+    record: IngredientNutrients
+    item: Dict[str, Any]
+    fetched_at: float
+    source: str = 'fresh'
+
+
+class IngredientShare(NamedTuple):
+    """음식 내 원재료 비중 및 100g당 영양성분"""
+    ingredient_name: str
+    fraction: float
+    nutrients: Dict[str, float]
+
+
+class IngredientSource(NamedTuple):
+    """음식 내 원재료 비중 및 영양성분 출처 (누락 시 None)"""
+    ingredient_name: str
+    fraction: float
+    source: Optional[str]
+
+
+class ProfileVariant(NamedTuple):
+    """폐기율/조리 보정을 적용한 100g당 영양성분 (완성된 음식 중량 기준)"""
+    ingredients: Tuple[IngredientShare, ...]
+    per_100g: Dict[str, float]
+
+
+class DishProfile(NamedTuple):
+    """평탄화된 음식의 100g당 영양성분 프로필
+
+    variants: (폐기율 적용, 조리 보정 적용) 조합별 보정 프로필 (보정 없는 값은 ingredients/per_100g)
+    fetched_at: 사용한 재료 중 가장 오래전에 조회된 시각 (캐시 유효 시간 판단)
+    """
+    food_name: str
+    ingredients: Tuple[IngredientShare, ...]
+    per_100g: Dict[str, float]
+    missing_ingredients: Tuple[str, ...]
+    deadline_exceeded: bool = False
+    sources: Tuple[IngredientSource, ...] = ()
+    variants: Optional[Dict[Tuple[bool, bool], ProfileVariant]] = None
+    fetched_at: float = 0.0
+
 
 class NutritionCalculationService:
     """영양성분 계산 서비스"""
     
-    def __init__(self, use_mock=None):
+    def __init__(self, use_mock=None, composition_store: Optional[CompositionStore] = None):
         self.api_client = NutritionAPIClient(use_mock=use_mock)
-        self.compositions_file = Path(__file__).parent.parent / "data" / "food_compositions.json"
-        self.food_compositions = self._load_food_compositions()
+        self.composition_store = composition_store or create_composition_store()
+        self.dish_graph = self._build_dish_graph(self.composition_store)
+        self.quantities = QuantityService(self.dish_graph)
+        self.cooking_factors = CookingFactorTable()
+        # 음식 프로필 LRU 캐시 (재료 캐시 유효 시간이 지나면 다시 계산)
+        self._profile_cache: "OrderedDict[str, DishProfile]" = OrderedDict()
+        self.profile_cache_size = int(os.getenv('PROFILE_CACHE_SIZE', '1024'))
+        self._profile_lock = threading.Lock()
+        self._ingredient_cache: Dict[str, CachedIngredient] = {}
+        self.ingredient_cache_ttl = float(os.getenv('INGREDIENT_CACHE_TTL', '3600'))
+        # API 조회 실패 시 만료된 캐시를 대신 사용할 수 있는 최대 보관 시간
+        self.ingredient_stale_max_age = float(os.getenv('INGREDIENT_STALE_MAX_AGE', '604800'))
+        # 로컬 재료 스냅샷 파일 (None이면 INGREDIENT_SNAPSHOT_FILE)
+        self.snapshot_file: Optional[str] = None
+        self._snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        # 프로필 무효화 시 증가 (프로필 기반 파생 데이터의 재생성 판단용)
+        self.profile_version = 0
+        # 최근 프로필 무효화 기록 (버전, 음식) — 파생 데이터가 바뀐 음식만 갱신하는 데 사용
+        self._profile_changes: deque = deque(maxlen=int(os.getenv('PROFILE_CHANGE_LOG_SIZE', '1024')))
+        # API에서 조회한 재료 데이터의 버전과 변경 피드
+        self.ingredient_versions = create_ingredient_version_store()
     
-    def _load_food_compositions(self) -> Dict[str, Any]:
-        """음식 구성요소 데이터 로드"""
-        try:
-            with open(self.compositions_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            logger.error(f"구성요소 데이터 파일을 찾을 수 없습니다: {self.compositions_file}")
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"구성요소 데이터 파싱 실패: {e}")
-            return {}
-    
-    def get_available_foods(self) -> List[str]:
-        """등록된 복합식품 목록 반환"""
-        return list(self.food_compositions.keys())
+    def _build_dish_graph(self, store: CompositionStore) -> DishGraph:
+        """음식 간 참조 그래프 생성
+        
+        전체 음식이 메모리에 로드된 저장소는 시작 시 순환/누락 참조가 있는 음식을 제외하고,
+        지연 로드 저장소는 가져오기 시점 검증을 전제로 조회 시 평탄화 단계에서 검증합니다.
+        """
+        dish_graph = DishGraph(store, int(os.getenv('COMPOSITION_CACHE_SIZE', '1024')))
+        if store.preloaded:
+            for food_name, error in dish_graph.validate().items():
+                logger.error(f"'{food_name}' 구성요소 참조 오류로 제외합니다: {error}")
+                dish_graph.remove_dish(food_name)
+        return dish_graph
     
-    def get_food_composition(self, food_name: str) -> Optional[ComplexFood]:
-        """특정 음식의 구성요소 정보 반환"""
-        if food_name not in self.food_compositions:
+    def _invalidate_profiles(self, food_names: Set[str]):
+        """음식 프로필 캐시 무효화"""
+        if not food_names:
+            return
+        with self._profile_lock:
+            for food_name in food_names:
+                self._profile_cache.pop(food_name, None)
+        self.profile_version += 1
+        self._profile_changes.append((self.profile_version, frozenset(food_names)))
+    
+    def profiles_changed_since(self, version: int) -> Optional[Set[str]]:
+        """해당 프로필 버전 이후 무효화된 음식 (기록이 남아 있지 않으면 None → 전체 재생성 필요)"""
+        if version == self.profile_version:
+            return set()
+        changes = list(self._profile_changes)
+        if not changes or changes[0][0] > version + 1:
             return None
+        changed: Set[str] = set()
+        for changed_version, food_names in changes:
+            if changed_version > version:
+                changed |= food_names
+        return changed
+    
+    def update_food_composition(self, food_name: str, composition_data: Dict[str, Any]) -> Set[str]:
+        """음식 구성요소 추가/변경 후 영향받는 음식만 무효화
         
-        composition_data = self.food_compositions[food_name]
+        Returns:
+            무효화된 음식 집합
+            
+        Raises:
+            CompositionValidationError: 잘못된 구성요소 또는 비율 합계
+            CompositionGraphError: 순환 참조 또는 등록되지 않은 음식 참조
+        """
+        record = compile_dish_record(food_name, composition_data)
+        return self._apply_dish_record(record)
+    
+    def _apply_dish_record(self, record: DishRecord) -> Set[str]:
+        """검증된 레코드를 반영하고 영향받는 음식 프로필 무효화"""
+        affected = self.dish_graph.update_dish(record.food_name, record)
+        self._invalidate_profiles(affected)
+        return affected
+    
+    def reload_food_compositions(self) -> Set[str]:
+        """저장소의 외부 변경을 다시 읽고 변경된 음식과 상위 음식만 무효화
         
-        # FoodComposition 객체 리스트 생성
-        compositions = []
-        for comp in composition_data['compositions']:
-            compositions.append(FoodComposition(
-                ingredient_name=comp['ingredient_name'],
-                percentage=comp['percentage'],
-                unit=comp.get('unit', 'g')
-            ))
+        Returns:
+            무효화된 음식 집합
+        """
+        affected: Set[str] = set()
         
-        return ComplexFood(
-            food_name=food_name,
-            compositions=compositions,
-            total_weight=composition_data.get('base_weight', 100.0)
-        )
+        for food_name, record in self.composition_store.pending_changes().items():
+            if record is None:
+                affected |= self.dish_graph.remove_dish(food_name)
+                affected |= self.dish_graph.invalidate(food_name)
+                continue
+            try:
+                affected |= self._apply_dish_record(record)
+            except CompositionGraphError as e:
+                logger.error(f"'{food_name}' 구성요소 변경을 반영하지 않습니다: {e}")
+        
+        self._invalidate_profiles(affected)
+        return affected
     
-    def get_ingredient_nutrition(self, ingredient_name: str) -> Optional[NutritionInfo]:
-        """개별 재료의 영양성분 정보 조회"""
+    def invalidate_ingredient(self, ingredient_name: str) -> Set[str]:
+        """재료 데이터 변경 시 해당 재료를 사용하는 음식 프로필만 무효화
+        
+        Returns:
+            무효화된 음식 집합
+        """
+        self._ingredient_cache.pop(ingredient_name, None)
+        affected = self.dish_graph.dishes_using_ingredient(ingredient_name)
+        self._invalidate_profiles(affected)
+        return affected
+    
+    def invalidate_dishes(self, food_names: Iterable[str]) -> Set[str]:
+        """지정한 음식 프로필 무효화 (다음 조회 시 재계산, 파생 데이터도 해당 음식만 갱신)
+        
+        Returns:
+            무효화된 음식 집합
+        """
+        affected = set(food_names)
+        self._invalidate_profiles(affected)
+        return affected
+    
+    def refresh_ingredient(self, ingredient_name: str) -> Optional[Set[str]]:
+        """캐시 유효 시간과 관계없이 재료를 다시 조회하고, 값이 바뀐 경우에만 사용하는 음식 무효화
+        
+        Returns:
+            무효화된 음식 집합 (조회 실패 시 None)
+        """
+        item = self._fetch_ingredient_item(ingredient_name)
+        if not item:
+            return None
+        
+        _, change = self._store_fetched_ingredient(ingredient_name, item)
+        return set(change.affected_dishes) if change else set()
+    
+    def _store_fetched_ingredient(
+        self, ingredient_name: str, item: Dict[str, Any]
+    ) -> Tuple[CachedIngredient, Optional[IngredientChange]]:
+        """API에서 조회한 항목을 캐시하고 버전 기록, 내용이 바뀌었으면 사용하는 음식 프로필만 무효화"""
+        cached = CachedIngredient(IngredientNutrients.from_api_item(item), item, time.time())
+        self._ingredient_cache[ingredient_name] = cached
+        change = self.ingredient_versions.record(ingredient_name, item, self.dish_graph.dishes_using_ingredient)
+        if change is not None:
+            self._invalidate_profiles(set(change.affected_dishes))
+        return cached, change
+    
+    def iter_ingredient_names(self) -> Iterator[str]:
+        """등록된 음식이 사용하는 전체 원재료 (하위 음식 평탄화, 중복 제외)"""
+        seen: Set[str] = set()
+        for food_name in self.iter_available_foods():
+            try:
+                shares = self.dish_graph.flatten(food_name)
+            except CompositionGraphError:
+                continue
+            for ingredient_name in shares:
+                if ingredient_name not in seen:
+                    seen.add(ingredient_name)
+                    yield ingredient_name
+    
+    def reload_snapshot(self, snapshot_file: Optional[str] = None):
+        """대체 조회용 로컬 스냅샷을 다음 사용 시 다시 로드 (snapshot_file 지정 시 이후 해당 파일 사용)"""
+        if snapshot_file is not None:
+            self.snapshot_file = snapshot_file
+        self._snapshot = None
+    
+    def get_available_foods(
+        self,
+        prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None
+    ) -> List[str]:
+        """등록된 복합식품 목록 반환 (이름순, 접두어 필터 및 after 이후 페이지 단위 조회)"""
+        return self.composition_store.names(prefix=prefix, limit=limit, after=after)
+    
+    def count_available_foods(self, prefix: Optional[str] = None) -> int:
+        """등록된 복합식품 수"""
+        return self.composition_store.count(prefix=prefix)
+    
+    def iter_available_foods(self) -> Iterator[str]:
+        """등록된 전체 복합식품 순회 (배치 단위 조회)"""
+        return self.composition_store.iter_names()
+    
+    def get_food_composition(self, food_name: str) -> Optional[ComplexFood]:
+        """특정 음식의 구성요소 정보 반환 (로드 시 생성된 객체 재사용)"""
+        record = self.dish_graph.get_dish(food_name)
+        return record.complex_food if record else None
+    
+    def _fetch_ingredient_item(self, ingredient_name: str) -> Optional[Dict[str, Any]]:
+        """API에서 재료의 영양성분 항목 조회 (첫 번째 결과 사용)"""
         try:
-            # API에서 해당 재료의 영양성분 조회
             response = self.api_client.search_food_by_name(ingredient_name, num_rows=1)
             nutrition_data = self.api_client.extract_nutrition_data(response)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"'{ingredient_name}' 영양성분 조회 실패: {e}")
+            return None
+        
+        if not nutrition_data:
+            logger.warning(f"'{ingredient_name}' 영양성분 정보를 찾을 수 없습니다.")
+            return None
+        
+        return nutrition_data[0]
+    
+    def _snapshot_items(self) -> Dict[str, Dict[str, Any]]:
+        """대체 조회용 로컬 스냅샷 (INGREDIENT_SNAPSHOT_FILE, 최초 사용 시 로드)"""
+        if self._snapshot is None:
+            try:
+                items = read_snapshot_file(self.api_client, self.snapshot_file) or []
+            except (OSError, ValueError) as e:
+                logger.error(f"재료 스냅샷 파일 로드 실패: {e}")
+                items = []
+            # 정식 식품명('양파, 생것')과 기본 이름('양파') 모두로 조회 (API 식품명 검색과 동일하게 첫 항목 우선)
+            snapshot: Dict[str, Dict[str, Any]] = {}
+            for item in items:
+                name = item.get('foodNm')
+                if name:
+                    snapshot.setdefault(name, item)
+                    snapshot.setdefault(name.split(',')[0].strip(), item)
+            self._snapshot = snapshot
+        return self._snapshot
+    
+    def _fallback_ingredient(self, ingredient_name: str, expired: Optional[CachedIngredient]) -> Optional[CachedIngredient]:
+        """API 조회 대신 사용할 데이터 (만료된 캐시 → 로컬 스냅샷 순)"""
+        if expired and time.time() - expired.fetched_at < self.ingredient_stale_max_age:
+            return expired._replace(source='stale')
+        item = self._snapshot_items().get(ingredient_name)
+        if item:
+            return CachedIngredient(IngredientNutrients.from_api_item(item), item, time.time(), 'snapshot')
+        return None
+    
+    def _get_cached_ingredient(self, ingredient_name: str) -> Optional[CachedIngredient]:
+        """재료 캐시 조회 (만료 또는 미조회 시 API 조회 후 캐시)
+        
+        API 조회에 실패하거나 요청 기한이 지난 경우 만료된 캐시(stale), 로컬 스냅샷(snapshot)
+        순으로 대체하며, 반환 항목의 source로 출처를 구분합니다.
+        
+        Raises:
+            DeadlineExceeded: API 조회가 필요하지만 요청 기한이 지났고 대체 데이터도 없는 경우
+        """
+        with tracer.start_span(
+            'NutritionCalculationService.get_ingredient_nutrition',
+            {'ingredient.name': ingredient_name}
+        ) as span:
+            cached = self._ingredient_cache.get(ingredient_name)
+            if cached and time.time() - cached.fetched_at < self.ingredient_cache_ttl:
+                span.set_attribute('cache.outcome', 'hit')
+                return cached._replace(source='cache')
             
-            if not nutrition_data:
-                logger.warning(f"'{ingredient_name}' 영양성분 정보를 찾을 수 없습니다.")
-                return None
-            
-            # 첫 번째 결과 사용
-            first_result = nutrition_data[0]
+            span.set_attribute('cache.outcome', 'expired' if cached else 'miss')
+            try:
+                if deadline.expired():
+                    raise DeadlineExceeded(f"'{ingredient_name}' 조회 전 요청 기한이 지났습니다.")
+                item = self._fetch_ingredient_item(ingredient_name)
+            except DeadlineExceeded:
+                span.set_attribute('deadline.exceeded', True)
+                fallback = self._fallback_ingredient(ingredient_name, cached)
+                if fallback is None:
+                    raise
+                span.set_attribute('ingredient.source', fallback.source)
+                return fallback
             
-            # NutritionInfo 객체 생성
-            nutrition_info = NutritionInfo(**first_result)
-            return nutrition_info
+            span.set_attribute('ingredient.found', item is not None)
+            if not item:
+                fallback = self._fallback_ingredient(ingredient_name, cached)
+                if fallback is not None:
+                    logger.warning(f"'{ingredient_name}' API 조회 실패로 {fallback.source} 데이터를 사용합니다.")
+                    span.set_attribute('ingredient.source', fallback.source)
+                return fallback
             
+            cached, change = self._store_fetched_ingredient(ingredient_name, item)
+            span.set_attribute('ingredient.source', 'fresh')
+            span.set_attribute('ingredient.changed', change is not None)
+            return cached
+    
+    def get_ingredient_record(self, ingredient_name: str) -> Optional[IngredientNutrients]:
+        """내부 계산용 재료 영양성분 레코드 조회"""
+        cached = self._get_cached_ingredient(ingredient_name)
+        return cached.record if cached else None
+    
+    def get_ingredient_nutrition(self, ingredient_name: str) -> Optional[NutritionInfo]:
+        """개별 재료의 영양성분 정보 조회 (API 응답용 전체 필드 모델)"""
+        cached = self._get_cached_ingredient(ingredient_name)
+        if not cached:
+            return None
+        
+        try:
+            return NutritionInfo(**cached.item)
         except Exception as e:
-            logger.error(f"'{ingredient_name}' 영양성분 조회 실패: {e}")
+            logger.error(f"'{ingredient_name}' 영양성분 변환 실패: {e}")
             return None
     
-    def calculate_nutrition(self, request: NutritionCalculationRequest) -> Optional[CalculatedNutrition]:
-        """영양성분 계산 메인 메소드"""
-        food_name = request.food_name
-        target_weight = request.weight_grams
+    def get_ingredient_nutrients(self, ingredient_name: str) -> Optional[Dict[str, float]]:
+        """계산에 사용하는 재료의 100g당 영양성분 반환"""
+        record = self.get_ingredient_record(ingredient_name)
+        return record.as_dict() if record else None
+    
+    def cached_profile(self, food_name: str) -> Optional[DishProfile]:
+        """캐시된(모든 재료가 정상 조회된) 음식 프로필, 없거나 무효화/만료되었으면 None"""
+        with self._profile_lock:
+            profile = self._profile_cache.get(food_name)
+            if profile is None:
+                return None
+            if time.time() - profile.fetched_at >= self.ingredient_cache_ttl:
+                # 재료 캐시 유효 시간이 지난 프로필은 다음 조회 시 재료를 다시 조회해 계산
+                del self._profile_cache[food_name]
+                return None
+            self._profile_cache.move_to_end(food_name)
+            return profile
+    
+    def get_dish_profile(self, food_name: str) -> Optional[DishProfile]:
+        """음식의 100g당 영양성분 프로필 반환 (하위 음식 포함 평탄화, 메모이제이션)
         
-        # 1. 음식 구성요소 정보 조회
-        complex_food = self.get_food_composition(food_name)
-        if not complex_food:
-            logger.error(f"'{food_name}' 구성요소 정보를 찾을 수 없습니다.")
+        모든 재료가 API 또는 캐시에서 조회된 프로필만 캐시하며, 일부 재료가 누락되었거나
+        만료된 캐시/스냅샷으로 대체된 경우 다음 요청에서 다시 계산합니다. 캐시된 프로필도
+        가장 오래된 재료의 캐시 유효 시간(INGREDIENT_CACHE_TTL)이 지나면 다시 계산합니다.
+        """
+        cached = self.cached_profile(food_name)
+        if cached is not None:
+            return cached
+        
+        if not self.dish_graph.has_dish(food_name):
             return None
         
-        # 2. 각 구성요소별 영양성분 조회 및 계산
-        total_nutrition = {
-            'energy': 0.0,
-            'protein': 0.0,
-            'fat': 0.0,
-            'carbohydrate': 0.0,
-            'sugar': 0.0,
-            'dietary_fiber': 0.0,
-            'calcium': 0.0,
-            'iron': 0.0,
-            'sodium': 0.0,
-            'potassium': 0.0,
-            'vitamin_a': 0.0,
-            'vitamin_c': 0.0
-        }
-        
-        composition_details = []
-        
-        # 기준 중량 대비 실제 요청 중량의 비율 계산
-        weight_ratio = target_weight / complex_food.total_weight
-        
-        for composition in complex_food.compositions:
-            ingredient_name = composition.ingredient_name
-            percentage = composition.percentage
-            
-            # 해당 재료의 영양성분 조회
-            nutrition = self.get_ingredient_nutrition(ingredient_name)
-            if not nutrition:
+        try:
+            shares = self.dish_graph.flatten(food_name)
+            prepared = self.dish_graph.flatten_preparations(food_name)
+        except CompositionGraphError as e:
+            logger.error(f"'{food_name}' 구성요소 평탄화 실패: {e}")
+            return None
+        
+        profile = self.compile_profile(food_name, shares, prepared)
+        if all(source.source in RELIABLE_SOURCES for source in profile.sources):
+            # 캐시된 프로필을 다시 사용할 때는 모든 재료가 캐시 출처
+            with self._profile_lock:
+                self._profile_cache[food_name] = profile._replace(
+                    sources=tuple(source._replace(source='cache') for source in profile.sources)
+                )
+                self._profile_cache.move_to_end(food_name)
+                if len(self._profile_cache) > self.profile_cache_size:
+                    self._profile_cache.popitem(last=False)
+        
+        return profile
+    
+    def compile_profile(
+        self,
+        food_name: str,
+        shares: Dict[str, float],
+        prepared: Dict[Tuple[str, Optional[str]], float]
+    ) -> DishProfile:
+        """평탄화된 재료 비율로 100g당 프로필과 보정 프로필 생성 (캐시하지 않음)
+        
+        Args:
+            shares: {재료명: 비율} (DishGraph.flatten 결과)
+            prepared: {(재료명, 조리 상태): 비율} (DishGraph.flatten_preparations 결과)
+        """
+        ingredients = []
+        missing = []
+        sources = []
+        records: Dict[str, IngredientNutrients] = {}
+        deadline_exceeded = False
+        fetched_at = time.time()
+        per_100g = {key: 0.0 for key in NUTRIENT_KEYS}
+        
+        for ingredient_name, fraction in shares.items():
+            # 해당 재료의 영양성분 조회 (요청 기한이 지나면 캐시에 없는 재료는 조회하지 않음)
+            try:
+                cached = self._get_cached_ingredient(ingredient_name)
+            except DeadlineExceeded:
+                cached = None
+            if not cached:
+                deadline_exceeded = deadline_exceeded or deadline.expired()
                 logger.warning(f"'{ingredient_name}' 영양성분을 건너뜁니다.")
+                missing.append(ingredient_name)
+                sources.append(IngredientSource(ingredient_name, fraction, None))
                 continue
             
-            # 실제 사용량 계산 (목표 중량 * 구성 비율 / 100)
-            actual_weight = target_weight * (percentage / 100.0)
+            nutrients = cached.record.as_dict()
+            ingredients.append(IngredientShare(ingredient_name, fraction, nutrients))
+            sources.append(IngredientSource(ingredient_name, fraction, cached.source))
+            records[ingredient_name] = cached.record
+            fetched_at = min(fetched_at, cached.fetched_at)
+            
+            for key in NUTRIENT_KEYS:
+                per_100g[key] += nutrients[key] * fraction
+        
+        return DishProfile(
+            food_name, tuple(ingredients), per_100g, tuple(missing), deadline_exceeded, tuple(sources),
+            self._build_variants(records, shares, prepared), fetched_at
+        )
+    
+    def _build_variants(
+        self,
+        records: Dict[str, IngredientNutrients],
+        shares: Dict[str, float],
+        prepared: Dict[Tuple[str, Optional[str]], float]
+    ) -> Dict[Tuple[bool, bool], ProfileVariant]:
+        """폐기율/조리 보정 프로필을 미리 계산 (요청 시에는 조합만 선택)
+        
+        구성 비율은 조리 전 구입 상태 중량으로 보고, 재료별로
+        가식부 중량 = 중량 * (1 - 폐기율), 조리 후 중량 = 가식부 중량 * 중량 변화율,
+        영양성분 = 가식부 영양성분 * 잔존율로 계산한 뒤 완성된 음식 100g 기준으로 환산합니다.
+        영양성분이 없는 재료는 보정 없이 원래 중량으로 남겨 둡니다.
+        """
+        variants = {}
+        for apply_refuse, apply_cooking in ((True, False), (False, True), (True, True)):
+            masses: Dict[str, float] = {}
+            amounts: Dict[str, List[float]] = {}
+            total_mass = sum(fraction for name, fraction in shares.items() if name not in records)
+            for (ingredient_name, preparation), fraction in prepared.items():
+                record = records.get(ingredient_name)
+                if record is None:
+                    continue
+                edible = fraction * (1.0 - record.refuse_rate / 100.0) if apply_refuse else fraction
+                if apply_cooking:
+                    factor = self.cooking_factors.factor(ingredient_name, preparation)
+                    mass = edible * factor.yield_factor
+                    retained = [value * ratio for value, ratio in zip(record.values(), factor.retention)]
+                else:
+                    mass = edible
+                    retained = list(record.values())
+                masses[ingredient_name] = masses.get(ingredient_name, 0.0) + mass
+                totals = amounts.setdefault(ingredient_name, [0.0] * len(NUTRIENT_KEYS))
+                for i, value in enumerate(retained):
+                    totals[i] += value * edible
+                total_mass += mass
+            
+            ingredients = []
+            per_100g = {key: 0.0 for key in NUTRIENT_KEYS}
+            for ingredient_name, mass in masses.items():
+                if mass <= 0 or total_mass <= 0:
+                    continue
+                # 조리 후 재료 100g당 영양성분과 완성된 음식 내 중량 비율
+                nutrients = {key: value / mass for key, value in zip(NUTRIENT_KEYS, amounts[ingredient_name])}
+                fraction = mass / total_mass
+                ingredients.append(IngredientShare(ingredient_name, fraction, nutrients))
+                for key in NUTRIENT_KEYS:
+                    per_100g[key] += nutrients[key] * fraction
+            variants[(apply_refuse, apply_cooking)] = ProfileVariant(tuple(ingredients), per_100g)
+        return variants
+    
+    @staticmethod
+    def select_variant(
+        profile: DishProfile,
+        apply_refuse: bool = False,
+        apply_cooking: bool = False
+    ) -> Tuple[Tuple[IngredientShare, ...], Dict[str, float]]:
+        """요청 보정 옵션에 맞는 (재료 비중, 100g당 영양성분)"""
+        variant = (profile.variants or {}).get((apply_refuse, apply_cooking))
+        if variant is None:
+            return profile.ingredients, profile.per_100g
+        return variant.ingredients, variant.per_100g
+    
+    @staticmethod
+    def build_coverage(profile: DishProfile) -> NutritionCoverage:
+        """프로필의 재료별 출처와 영양성분이 반영된 중량 비중"""
+        covered = sum(source.fraction for source in profile.sources if source.source is not None)
+        return NutritionCoverage(
+            covered_weight_percent=round(covered * 100, 1),
+            degraded=any(source.source in ('stale', 'snapshot') for source in profile.sources),
+            ingredients=[
+                IngredientCoverage(
+                    ingredient_name=source.ingredient_name,
+                    weight_percent=round(source.fraction * 100, 1),
+                    source=source.source
+                )
+                for source in profile.sources
+            ]
+        )
+    
+    def calculate_nutrition(
+        self,
+        request: NutritionCalculationRequest,
+        fields: Optional[Collection[str]] = None,
+        detail: bool = True
+    ) -> Optional[CalculatedNutrition]:
+        """영양성분 계산 메인 메소드
+        
+        Args:
+            fields: 계산할 영양성분 (None이면 NUTRIENT_KEYS 전체)
+            detail: 구성요소별 상세(composition_details) 계산 여부
+        """
+        food_name = request.food_name
+        
+        with tracer.start_span(
+            'NutritionCalculationService.calculate_nutrition',
+            {'food.name': food_name, 'food.unit': request.unit if request.quantity is not None else 'g'}
+        ) as span:
+            # 1. 음식 구성요소 정보 조회
+            if not self.dish_graph.has_dish(food_name):
+                logger.error(f"'{food_name}' 구성요소 정보를 찾을 수 없습니다.")
+                span.set_attribute('food.found', False)
+                return None
+            
+            # 요청 수량을 그램으로 환산
+            target_weight = self.resolve_weight(request)
+            span.set_attribute('food.weight_grams', target_weight)
+            
+            # 2. 평탄화된 음식 프로필 조회 (하위 음식 포함)
+            span.set_attribute('profile.cache_outcome', 'hit' if food_name in self._profile_cache else 'miss')
+            profile = self.get_dish_profile(food_name)
+            if not profile:
+                return None
+            span.set_attribute('profile.missing_ingredients', len(profile.missing_ingredients))
+            span.set_attribute('deadline.exceeded', profile.deadline_exceeded)
+            
+            # 3. 목표 중량 기준 결과 생성
+            result = self.build_profile_result(
+                profile, target_weight, request.apply_refuse, request.apply_cooking, fields, detail
+            )
+            if request.quantity is not None:
+                result.quantity, result.unit = request.quantity, request.unit
+            span.set_attribute('coverage.weight_percent', result.coverage.covered_weight_percent)
+            return result
+    
+    def resolve_weight(self, request: NutritionCalculationRequest) -> float:
+        """요청 중량(g) 결정 (weight_grams 또는 quantity/unit 환산)
+        
+        Raises:
+            QuantityError: 둘 다 없거나 둘 다 지정된 경우, 환산할 수 없는 단위
+        """
+        if request.quantity is None:
+            if request.weight_grams is None:
+                raise QuantityError("weight_grams 또는 quantity 중 하나가 필요합니다.")
+            return request.weight_grams
+        if request.weight_grams is not None:
+            raise QuantityError("weight_grams와 quantity는 함께 지정할 수 없습니다.")
+        return self.quantities.to_grams(request.food_name, request.quantity, request.unit)
+    
+    def build_profile_result(
+        self,
+        profile: DishProfile,
+        target_weight: float,
+        apply_refuse: bool = False,
+        apply_cooking: bool = False,
+        fields: Optional[Collection[str]] = None,
+        detail: bool = True
+    ) -> CalculatedNutrition:
+        """프로필 기반 목표 중량 계산 결과 (누락 재료가 있으면 부분 결과로 표시)"""
+        ingredients, per_100g = self.select_variant(profile, apply_refuse, apply_cooking)
+        result = self.build_calculated_nutrition(
+            profile.food_name, ingredients, per_100g, target_weight, fields, detail
+        )
+        result.partial = bool(profile.missing_ingredients)
+        result.missing_ingredients = list(profile.missing_ingredients)
+        result.deadline_exceeded = profile.deadline_exceeded
+        result.coverage = self.build_coverage(profile)
+        return result
+    
+    def build_calculated_nutrition(
+        self,
+        food_name: str,
+        ingredients: Tuple[IngredientShare, ...],
+        per_100g: Dict[str, float],
+        target_weight: float,
+        fields: Optional[Collection[str]] = None,
+        detail: bool = True
+    ) -> CalculatedNutrition:
+        """100g당 프로필과 재료 비중으로 목표 중량 기준 계산 결과 생성
+        
+        fields를 지정하면 해당 영양성분만, detail이 False이면 구성요소별 상세 없이 계산합니다.
+        """
+        keys = NUTRIENT_KEYS if fields is None else tuple(key for key in NUTRIENT_KEYS if key in fields)
+        
+        # 구성요소별 영양성분 계산
+        composition_details = [] if detail else None
+        for share in ingredients if detail else ():
+            # 실제 사용량 계산 (목표 중량 * 구성 비율)
+            actual_weight = target_weight * share.fraction
             
             # 영양성분 계산 (100g 기준 → 실제 사용량 기준)
             nutrition_ratio = actual_weight / 100.0
             
             ingredient_nutrition = {
-                'ingredient_name': ingredient_name,
-                'weight': actual_weight,
-                'energy': (nutrition.energy or 0) * nutrition_ratio,
-                'protein': (nutrition.protein or 0) * nutrition_ratio,
-                'fat': (nutrition.fat or 0) * nutrition_ratio,
-                'carbohydrate': (nutrition.carbohydrate or 0) * nutrition_ratio,
-                'sugar': (nutrition.sugar or 0) * nutrition_ratio,
-                'dietary_fiber': (nutrition.dietary_fiber or 0) * nutrition_ratio,
-                'calcium': (nutrition.calcium or 0) * nutrition_ratio,
-                'iron': (nutrition.iron or 0) * nutrition_ratio,
-                'sodium': (nutrition.sodium or 0) * nutrition_ratio,
-                'potassium': (nutrition.potassium or 0) * nutrition_ratio,
-                'vitamin_a': (nutrition.vitamin_a or 0) * nutrition_ratio,
-                'vitamin_c': (nutrition.vitamin_c or 0) * nutrition_ratio
+                'ingredient_name': share.ingredient_name,
+                'weight': actual_weight
             }
+            for key in keys:
+                ingredient_nutrition[key] = share.nutrients[key] * nutrition_ratio
             
             composition_details.append(ingredient_nutrition)
-            
-            # 총합에 추가
-            for key in total_nutrition:
-                if key in ingredient_nutrition:
-                    total_nutrition[key] += ingredient_nutrition[key]
         
-        # 3. 최종 결과 생성
-        calculated_nutrition = CalculatedNutrition(
+        # 최종 결과 생성 (100g 기준 → 목표 중량 기준)
+        weight_ratio = target_weight / 100.0
+        totals = {key: round(per_100g[key] * weight_ratio, 2) for key in keys}
+        
+        return CalculatedNutrition(
             food_name=food_name,
             weight_grams=target_weight,
-            energy=round(total_nutrition['energy'], 2),
-            protein=round(total_nutrition['protein'], 2),
-            fat=round(total_nutrition['fat'], 2),
-            carbohydrate=round(total_nutrition['carbohydrate'], 2),
-            sugar=round(total_nutrition['sugar'], 2),
-            dietary_fiber=round(total_nutrition['dietary_fiber'], 2),
-            calcium=round(total_nutrition['calcium'], 2),
-            iron=round(total_nutrition['iron'], 2),
-            sodium=round(total_nutrition['sodium'], 2),
-            potassium=round(total_nutrition['potassium'], 2),
-            vitamin_a=round(total_nutrition['vitamin_a'], 2),
-            vitamin_c=round(total_nutrition['vitamin_c'], 2),
-            composition_details=composition_details
+            composition_details=composition_details,
+            **totals
         )
-        
-        return calculated_nutrition
     
     def get_nutrition_summary(self, food_name: str, weight_grams: float) -> Dict[str, Any]:
         """영양성분 요약 정보 반환"""
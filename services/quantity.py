@@ -0,0 +1,199 @@
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from services.composition_catalog import DishRecord
+from services.dish_graph import DishGraph, CompositionGraphError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UNIT_FILE = Path(__file__).parent.parent / "data" / "unit_conversions.json"
+
+# 단위 종류
+MASS, VOLUME, PIECE, SERVING = 'mass', 'volume', 'piece', 'serving'
+
+# 밀도를 모르는 재료는 물과 같다고 가정 (g/ml)
+DEFAULT_DENSITY = 1.0
+
+# 개수 단위 환산에 사용할 대표 재료의 최소 비중
+MIN_PIECE_FRACTION = 0.5
+
+
+class QuantityError(ValueError):
+    """지원하지 않는 단위 또는 환산 정보가 없는 수량"""
+
+
+class Unit(NamedTuple):
+    name: str
+    kind: str
+    factor: float  # mass: g/단위, volume: ml/단위, piece/serving: 개수
+
+
+class DishUnits(NamedTuple):
+    """음식 한 개의 단위 환산 계수 (계산에 사용한 레코드/평탄화 결과 객체로 변경 여부 판단)"""
+    record: DishRecord
+    shares: Dict[str, float]
+    grams_per_ml: float
+    grams_per_piece: Optional[float]
+    grams_per_serving: Optional[float]
+    estimated_density: bool
+
+
+class QuantityService:
+    """수량(중량, 부피, 개수, 인분)을 그램으로 환산
+
+    단위 별칭, 재료별 밀도/개당 중량, 음식별 밀도/개당 중량은 data/unit_conversions.json에서
+    로드합니다. 음식의 밀도는 재료 밀도의 중량 가중 조화평균(부피 합)으로, 1개 중량은
+    음식 중량의 절반 이상을 차지하는 재료 1개가 들어가는 양으로 미리 계산하며,
+    구성요소가 바뀐 음식만 다시 계산합니다. 음식별 값이 파일에 있으면 그 값을 사용합니다.
+    """
+
+    def __init__(self, dish_graph: DishGraph, path: Optional[str] = None):
+        self.dish_graph = dish_graph
+        self.path = Path(path or os.getenv('UNIT_CONVERSIONS_FILE', str(DEFAULT_UNIT_FILE)))
+        data = self._load()
+
+        self.units: Dict[str, Unit] = {}
+        for name, spec in data.get('units', {}).items():
+            unit = Unit(name, spec['kind'], float(spec['factor']))
+            for alias in [name] + spec.get('aliases', []):
+                self.units[alias.lower()] = unit
+
+        self.ingredient_densities: Dict[str, float] = data.get('ingredient_densities', {})
+        self.ingredient_piece_weights: Dict[str, float] = data.get('ingredient_piece_weights', {})
+        self.dish_densities: Dict[str, float] = data.get('dish_densities', {})
+        self.dish_piece_weights: Dict[str, float] = data.get('dish_piece_weights', {})
+        self._dishes: Dict[str, DishUnits] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict:
+        if not self.path.exists():
+            logger.warning(f"단위 환산 파일이 없어 그램 단위만 지원합니다: {self.path}")
+            return {'units': {'g': {'kind': MASS, 'factor': 1.0}}}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def unit(self, name: str) -> Unit:
+        """단위명(별칭, 대소문자 무시)으로 단위 조회
+
+        Raises:
+            QuantityError: 지원하지 않는 단위
+        """
+        unit = self.units.get(name.strip().lower())
+        if unit is None:
+            raise QuantityError(f"지원하지 않는 단위입니다: {name}")
+        return unit
+
+    def dish_units(self, food_name: str) -> Optional[DishUnits]:
+        """음식의 단위 환산 계수 (등록되지 않은 음식이면 None)"""
+        record = self.dish_graph.get_dish(food_name)
+        if record is None:
+            return None
+        try:
+            shares = self.dish_graph.flatten(food_name)
+        except CompositionGraphError:
+            return None
+
+        cached = self._dishes.get(food_name)
+        if cached is not None and cached.record is record and cached.shares is shares:
+            return cached
+
+        units = self._build_dish_units(food_name, record, shares)
+        with self._lock:
+            self._dishes[food_name] = units
+        return units
+
+    def record_units(self, record: DishRecord, shares: Dict[str, float]) -> DishUnits:
+        """등록되지 않은(편집 중인) 음식 레코드의 단위 환산 계수 (결과는 캐시하지 않음)
+
+        음식별 밀도/개당 중량은 등록된 구성 기준 값이므로 사용하지 않고 재료 비율로만 계산하며,
+        레코드에 1인분 중량이 없으면 인분 단위는 환산할 수 없습니다.
+
+        Args:
+            shares: 레코드의 재료별 비율 (DishGraph.flatten_record 결과)
+        """
+        return self._build_dish_units(record.food_name, record, shares, overrides=False)
+
+    def _build_dish_units(
+        self, food_name: str, record: DishRecord, shares: Dict[str, float], overrides: bool = True
+    ) -> DishUnits:
+        density = self.dish_densities.get(food_name) if overrides else None
+        estimated = False
+        if density is None:
+            # 재료별 부피(중량 / 밀도)의 합으로 음식 1g의 부피를 구함
+            volume_per_gram = 0.0
+            for ingredient_name, fraction in shares.items():
+                ingredient_density = self.ingredient_densities.get(ingredient_name)
+                if ingredient_density is None:
+                    ingredient_density = DEFAULT_DENSITY
+                    estimated = True
+                volume_per_gram += fraction / ingredient_density
+            density = 1.0 / volume_per_gram if volume_per_gram > 0 else DEFAULT_DENSITY
+
+        piece_weight = self.dish_piece_weights.get(food_name) if overrides else None
+        if piece_weight is None:
+            countable = [
+                (fraction, ingredient_name) for ingredient_name, fraction in shares.items()
+                if ingredient_name in self.ingredient_piece_weights and fraction >= MIN_PIECE_FRACTION
+            ]
+            if countable:
+                fraction, ingredient_name = max(countable)
+                piece_weight = self.ingredient_piece_weights[ingredient_name] / fraction
+
+        return DishUnits(
+            record=record,
+            shares=shares,
+            grams_per_ml=density,
+            grams_per_piece=piece_weight,
+            grams_per_serving=record.serving_weight or (record.base_weight if overrides else None),
+            estimated_density=estimated
+        )
+
+    def grams_per_unit(self, food_name: str, unit_name: str, dish: Optional[DishUnits] = None) -> float:
+        """음식 1단위의 중량(g)
+
+        Args:
+            dish: 지정 시 등록된 음식 대신 사용할 환산 계수 (편집 중인 구성요소, record_units 결과)
+
+        Raises:
+            QuantityError: 지원하지 않는 단위, 등록되지 않은 음식 또는 개수 환산 정보가 없는 음식
+        """
+        unit = self.unit(unit_name)
+        if unit.kind == MASS:
+            return unit.factor
+
+        dish = dish or self.dish_units(food_name)
+        if dish is None:
+            raise QuantityError(f"'{food_name}' 음식 정보를 찾을 수 없어 {unit_name} 단위를 환산할 수 없습니다.")
+        if unit.kind == VOLUME:
+            return unit.factor * dish.grams_per_ml
+        if unit.kind == SERVING:
+            if dish.grams_per_serving is None:
+                raise QuantityError(f"'{food_name}'의 1인분 중량 정보가 없습니다.")
+            return unit.factor * dish.grams_per_serving
+        if dish.grams_per_piece is None:
+            raise QuantityError(f"'{food_name}'의 1개 중량 정보가 없습니다.")
+        return unit.factor * dish.grams_per_piece
+
+    def to_grams(self, food_name: str, quantity: float, unit_name: str, dish: Optional[DishUnits] = None) -> float:
+        """수량을 그램으로 환산 (dish: 편집 중인 구성요소의 환산 계수)"""
+        return quantity * self.grams_per_unit(food_name, unit_name, dish)
+
+    def resolve_many(self, items: Iterable[Tuple[str, float, str]]) -> List[float]:
+        """(음식명, 수량, 단위) 목록을 한 번에 그램으로 환산
+
+        같은 (음식, 단위) 조합의 환산 계수는 한 번만 구합니다.
+
+        Raises:
+            QuantityError: 환산할 수 없는 항목이 있는 경우
+        """
+        items = list(items)
+        factors: Dict[Tuple[str, str], float] = {}
+        for food_name, _, unit_name in items:
+            key = (food_name, unit_name)
+            if key not in factors:
+                factors[key] = self.grams_per_unit(food_name, unit_name)
+        return [quantity * factors[(food_name, unit_name)] for food_name, quantity, unit_name in items]
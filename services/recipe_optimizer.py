@@ -0,0 +1,247 @@
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.schemas import (
+    FoodComposition,
+    RecipeOptimizationRequest,
+    RecipeOptimizationResponse
+)
+from services.nutrition_service import (
+    NutritionCalculationService,
+    DishProfile,
+    IngredientShare,
+    NUTRIENT_KEYS
+)
+from utils.compute_pool import ComputePool
+
+logger = logging.getLogger(__name__)
+
+MAX_ITERATIONS = 5000
+TOLERANCE = 1e-9
+
+
+def project_capped_simplex(point: Sequence[float], lower: Sequence[float], upper: Sequence[float]) -> List[float]:
+    """{x | sum(x) = 1, lower <= x <= upper} 위로의 유클리드 사영
+
+    x_i = clip(point_i - tau, lower_i, upper_i)의 합은 tau에 대한 구간별 선형 함수이므로
+    구간 경계를 정렬해 합이 1이 되는 tau를 정확히 구합니다 (O(n log n)).
+    """
+    events = []
+    for p, lo, hi in zip(point, lower, upper):
+        events.append((p - hi, 1))   # tau가 지나면 상한에서 벗어남
+        events.append((p - lo, -1))  # tau가 지나면 하한에 고정됨
+    events.sort()
+
+    value = sum(upper)
+    free = 0
+    previous = events[0][0]
+    tau = events[-1][0]
+    for breakpoint, delta in events:
+        next_value = value - free * (breakpoint - previous)
+        if next_value <= 1.0 and free > 0:
+            tau = previous + (value - 1.0) / free
+            break
+        value = next_value
+        previous = breakpoint
+        free += delta
+
+    return [min(max(p - tau, lo), hi) for p, lo, hi in zip(point, lower, upper)]
+
+
+def solve_bounded_least_squares(
+    matrix: List[List[float]],
+    targets: List[float],
+    row_weights: List[float],
+    lower: List[float],
+    upper: List[float],
+    reference: List[float],
+    regularization: float
+) -> Tuple[List[float], int, bool]:
+    """구성 비율 제약 가중 최소제곱 문제 풀이 (적응형 재시작 가속 사영 경사법)
+
+    minimize  sum_n w_n (A x - t)_n^2 + reg * |x - x0|^2
+    subject to sum(x) = 1, lower <= x <= upper
+
+    Args:
+        matrix: 영양성분 행렬 A (영양성분 × 재료)
+        targets: 목표 벡터 t
+        row_weights: 영양성분별 가중치 w
+        lower, upper: 재료별 비율 범위 (0-1)
+        reference: 기존 구성 비율 x0
+        regularization: 기존 구성 유지 가중치
+
+    Returns:
+        (최적 비율, 반복 횟수, 수렴 여부)
+    """
+    n = len(reference)
+
+    def gradient(x: List[float]) -> List[float]:
+        residual = [
+            w * (sum(a * xi for a, xi in zip(row, x)) - t)
+            for row, t, w in zip(matrix, targets, row_weights)
+        ]
+        grad = [2.0 * regularization * (x[i] - reference[i]) for i in range(n)]
+        for row, r in zip(matrix, residual):
+            for i in range(n):
+                grad[i] += 2.0 * row[i] * r
+        return grad
+
+    # 립시츠 상수 추정 (거듭제곱법)
+    vector = [1.0] * n
+    lipschitz = 1.0
+    for _ in range(30):
+        projected = [sum(a * v for a, v in zip(row, vector)) for row in matrix]
+        product = [2.0 * regularization * v for v in vector]
+        for row, p, w in zip(matrix, projected, row_weights):
+            for i in range(n):
+                product[i] += 2.0 * w * row[i] * p
+        norm = sum(p * p for p in product) ** 0.5
+        if norm == 0:
+            break
+        lipschitz = norm / (sum(v * v for v in vector) ** 0.5)
+        vector = [p / norm for p in product]
+    step = 1.0 / (lipschitz * 1.01)
+
+    x = project_capped_simplex(reference, lower, upper)
+    y = list(x)
+    momentum = 1.0
+
+    for iteration in range(1, MAX_ITERATIONS + 1):
+        grad = gradient(y)
+        x_next = project_capped_simplex([yi - step * g for yi, g in zip(y, grad)], lower, upper)
+
+        # 진행 방향이 모멘텀과 반대이면 모멘텀 초기화 (적응형 재시작)
+        if sum((yi - xn) * (xn - xi) for yi, xn, xi in zip(y, x_next, x)) > 0:
+            momentum = 1.0
+        momentum_next = (1.0 + (1.0 + 4.0 * momentum * momentum) ** 0.5) / 2.0
+        beta = (momentum - 1.0) / momentum_next
+        y = [xn + beta * (xn - xi) for xn, xi in zip(x_next, x)]
+
+        change = sum((xn - xi) ** 2 for xn, xi in zip(x_next, x)) ** 0.5
+        x, momentum = x_next, momentum_next
+        if change < TOLERANCE:
+            return x, iteration, True
+
+    return x, MAX_ITERATIONS, False
+
+
+class RecipeOptimizer:
+    """영양성분 목표에 맞춘 레시피 구성 비율 최적화 서비스
+
+    compute_pool이 있으면 최적화 문제 풀이를 작업 프로세스에서 실행합니다.
+    """
+
+    def __init__(self, nutrition_service: NutritionCalculationService, compute_pool: Optional[ComputePool] = None):
+        self.nutrition_service = nutrition_service
+        self.compute_pool = compute_pool
+
+    def _resolve_candidates(
+        self,
+        profile: DishProfile,
+        additional_ingredients: List[str]
+    ) -> Tuple[List[str], List[float], List[Dict[str, float]]]:
+        """후보 재료와 기존 비율, 100g당 영양성분 조회
+
+        Raises:
+            ValueError: 영양성분을 조회할 수 없는 재료가 있는 경우
+        """
+        if profile.missing_ingredients:
+            raise ValueError(f"영양성분을 조회할 수 없는 재료가 있습니다: {', '.join(profile.missing_ingredients)}")
+
+        names = [share.ingredient_name for share in profile.ingredients]
+        reference = [share.fraction for share in profile.ingredients]
+        vectors = [share.nutrients for share in profile.ingredients]
+
+        # 기존 구성 비율 합이 100%가 아닌 경우 정규화
+        total = sum(reference)
+        reference = [fraction / total for fraction in reference]
+
+        for ingredient_name in additional_ingredients:
+            if ingredient_name in names:
+                continue
+            nutrients = self.nutrition_service.get_ingredient_nutrients(ingredient_name)
+            if not nutrients:
+                raise ValueError(f"'{ingredient_name}' 영양성분 정보를 찾을 수 없습니다.")
+            names.append(ingredient_name)
+            reference.append(0.0)
+            vectors.append(nutrients)
+
+        return names, reference, vectors
+
+    def optimize(self, food_name: str, request: RecipeOptimizationRequest) -> Optional[RecipeOptimizationResponse]:
+        """레시피 구성 비율 최적화
+
+        Returns:
+            최적화 결과 (등록되지 않은 음식이면 None)
+
+        Raises:
+            ValueError: 잘못된 목표 또는 만족할 수 없는 비율 범위
+        """
+        profile = self.nutrition_service.get_dish_profile(food_name)
+        if not profile:
+            return None
+
+        for key in list(request.targets) + request.keep + list(request.weights):
+            if key not in NUTRIENT_KEYS:
+                raise ValueError(f"지원하지 않는 영양성분입니다: {key}")
+        if not request.targets and not request.keep:
+            raise ValueError("targets 또는 keep 중 하나 이상이 필요합니다.")
+
+        names, reference, vectors = self._resolve_candidates(profile, request.additional_ingredients)
+
+        # 목표 벡터: keep 영양성분은 현재 값 유지
+        current = {key: sum(v[key] * f for v, f in zip(vectors, reference)) for key in NUTRIENT_KEYS}
+        targets = {key: current[key] for key in request.keep}
+        targets.update(request.targets)
+
+        keys = list(targets)
+        matrix = [[vector[key] for vector in vectors] for key in keys]
+        target_values = [targets[key] for key in keys]
+        # 상대 오차 기준으로 정규화
+        row_weights = [
+            request.weights.get(key, 1.0) / max(abs(targets[key]), abs(current[key]), 1e-6) ** 2
+            for key in keys
+        ]
+
+        lower, upper = [], []
+        for name, fraction in zip(names, reference):
+            lo = request.min_percentage.get(name, 0.0) / 100.0
+            hi = request.max_percentage.get(name, 100.0) / 100.0
+            if request.max_change is not None:
+                lo = max(lo, fraction - request.max_change / 100.0)
+                hi = min(hi, fraction + request.max_change / 100.0)
+            lower.append(max(lo, 0.0))
+            upper.append(min(hi, 1.0))
+
+        if any(lo > hi for lo, hi in zip(lower, upper)) or sum(lower) > 1.0 + 1e-9 or sum(upper) < 1.0 - 1e-9:
+            raise ValueError("재료별 비율 범위로는 합계 100%를 만족할 수 없습니다.")
+
+        problem = (matrix, target_values, row_weights, lower, upper, reference, request.regularization)
+        if self.compute_pool is not None:
+            fractions, iterations, converged = self.compute_pool.run(solve_bounded_least_squares, *problem)
+        else:
+            fractions, iterations, converged = solve_bounded_least_squares(*problem)
+        if not converged:
+            logger.warning(f"'{food_name}' 레시피 최적화가 최대 반복 횟수 내에 수렴하지 않았습니다.")
+
+        ingredients = tuple(
+            IngredientShare(name, fraction, vector)
+            for name, fraction, vector in zip(names, fractions, vectors)
+            if fraction > 1e-6
+        )
+        per_100g = {key: sum(share.nutrients[key] * share.fraction for share in ingredients) for key in NUTRIENT_KEYS}
+
+        return RecipeOptimizationResponse(
+            food_name=food_name,
+            compositions=[
+                FoodComposition(ingredient_name=share.ingredient_name, percentage=round(share.fraction * 100.0, 2))
+                for share in ingredients
+            ],
+            nutrition=self.nutrition_service.build_calculated_nutrition(
+                food_name, ingredients, per_100g, request.weight_grams
+            ),
+            targets={key: round(value, 2) for key, value in targets.items()},
+            achieved={key: round(per_100g[key], 2) for key in keys},
+            iterations=iterations,
+            converged=converged
+        )
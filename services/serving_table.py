@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from models.schemas import CalculatedNutrition, DishServings, ServingEntry
+from services.nutrition_service import NutritionCalculationService, DishProfile, NUTRIENT_KEYS
+
+logger = logging.getLogger(__name__)
+
+# 고정 표준 중량 (1인분은 음식별 serving_weight, 미지정 시 base_weight)
+STANDARD_WEIGHTS: Tuple[Tuple[str, float], ...] = (('100g', 100.0), ('150g', 150.0), ('200g', 200.0))
+SERVING_LABEL = 'serving'
+
+
+class ServingRow(NamedTuple):
+    """음식 한 개의 표준 제공량 계산 결과 (계산에 사용한 프로필 객체로 변경 여부 판단)"""
+    profile: DishProfile
+    servings: DishServings
+    results: Dict[float, CalculatedNutrition]
+
+
+class ServingTableService:
+    """음식별 표준 제공량(100g, 1인분, 150g, 200g) 영양성분 표
+
+    전체 표는 프로필이 바뀐 음식 행만 다시 계산하고 일괄 다운로드용 JSON을 미리 직렬화해 둡니다.
+    계산 API는 요청 중량이 표준 제공량과 같고 행이 최신 프로필로 계산된 경우 표의 결과를
+    그대로 사용합니다.
+    """
+
+    def __init__(self, nutrition_service: NutritionCalculationService):
+        self.nutrition_service = nutrition_service
+        self._rows: Dict[str, ServingRow] = {}
+        self._built_version: Optional[int] = None
+        self._complete = False
+        self._refreshed_at = 0.0
+        self._bulk: Optional[bytes] = None
+        # 누락 재료가 있는 표의 재시도 최소 간격(초)
+        self.retry_interval = float(os.getenv('SERVING_TABLE_RETRY_SECONDS', '60'))
+        # 행이 바뀔 때마다 증가 (일괄 다운로드 ETag)
+        self.table_version = 0
+        self._lock = threading.Lock()
+
+    def serving_weights(self, food_name: str) -> List[Tuple[str, float]]:
+        """음식의 표준 제공량 (구분, 중량) 목록"""
+        units = self.nutrition_service.quantities.dish_units(food_name)
+        serving = units.grams_per_serving if units else 100.0
+        return [STANDARD_WEIGHTS[0], (SERVING_LABEL, serving)] + list(STANDARD_WEIGHTS[1:])
+
+    def _build_row(self, food_name: str, profile: DishProfile) -> ServingRow:
+        weights = self.serving_weights(food_name)
+        results = {}
+        entries = []
+        for label, weight in weights:
+            result = results.get(weight)
+            if result is None:
+                result = self.nutrition_service.build_profile_result(profile, weight)
+                results[weight] = result
+            entries.append(ServingEntry(
+                label=label,
+                weight_grams=weight,
+                nutrients={key: getattr(result, key) for key in NUTRIENT_KEYS}
+            ))
+
+        servings = DishServings(
+            food_name=food_name,
+            serving_weight_grams=weights[1][1],
+            complete=not profile.missing_ingredients,
+            covered_weight_percent=self.nutrition_service.build_coverage(profile).covered_weight_percent,
+            servings=entries
+        )
+        return ServingRow(profile, servings, results)
+
+    def _is_current(self) -> bool:
+        if self._built_version != self.nutrition_service.profile_version or self._bulk is None:
+            return False
+        return self._complete or time.time() - self._refreshed_at < self.retry_interval
+
+    def refresh(self) -> int:
+        """프로필이 바뀐 음식 행만 다시 계산
+
+        이전 표가 완전하고 그 이후의 프로필 무효화 기록이 남아 있으면 무효화된 음식만 확인하고,
+        아니면 전체 음식의 프로필을 확인합니다.
+
+        Returns:
+            다시 계산한 음식 수
+        """
+        with self._lock:
+            if self._is_current():
+                return 0
+
+            version = self.nutrition_service.profile_version
+            changed = None
+            if self._complete and self._built_version is not None:
+                changed = self.nutrition_service.profiles_changed_since(self._built_version)
+            if changed is None:
+                food_names, rows = self.nutrition_service.iter_available_foods(), {}
+            else:
+                food_names, rows = sorted(changed), dict(self._rows)
+            rebuilt = 0
+            complete = True
+            for food_name in food_names:
+                if changed is not None and not self.nutrition_service.dish_graph.has_dish(food_name):
+                    # 삭제된 음식
+                    rows.pop(food_name, None)
+                    continue
+                profile = self._profile(food_name)
+                if profile is None:
+                    rows.pop(food_name, None)
+                    complete = False
+                    continue
+                # 캐시되지 않은 프로필(스냅샷 대체 등)은 재시도 간격 후 다시 확인
+                complete = complete and profile is self.nutrition_service.cached_profile(food_name)
+
+                row = self._rows.get(food_name)
+                if row is None or row.profile is not profile:
+                    row = self._build_row(food_name, profile)
+                    rebuilt += 1
+                rows[food_name] = row
+
+            if rebuilt or rows.keys() != self._rows.keys() or self._bulk is None:
+                self._rows = rows
+                self.table_version += 1
+                self._bulk = self._serialize(rows)
+            self._built_version = version
+            self._complete = complete
+            self._refreshed_at = time.time()
+            logger.info(f"제공량 표 갱신: {rebuilt}/{len(rows)}개 음식 재계산 (버전 {self.table_version})")
+            return rebuilt
+
+    def _serialize(self, rows: Dict[str, ServingRow]) -> bytes:
+        payload = {
+            'version': self.table_version,
+            'labels': [STANDARD_WEIGHTS[0][0], SERVING_LABEL] + [label for label, _ in STANDARD_WEIGHTS[1:]],
+            'foods': [rows[food_name].servings.model_dump() for food_name in sorted(rows)]
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def get_bulk(self) -> Tuple[int, bytes]:
+        """일괄 다운로드용 (표 버전, 직렬화된 JSON)"""
+        self.refresh()
+        with self._lock:
+            return self.table_version, self._bulk
+
+    def get_servings(self, food_name: str) -> Optional[DishServings]:
+        """음식 한 개의 제공량 표 (해당 음식 행만 최신화)"""
+        row = self._current_row(food_name)
+        return row.servings if row else None
+
+    def lookup(self, food_name: str, weight_grams: float) -> Optional[CalculatedNutrition]:
+        """표준 제공량 계산 결과 (최신 캐시 프로필로 계산된 행만 사용, 없으면 None)"""
+        profile = self.nutrition_service.cached_profile(food_name)
+        if profile is None:
+            return None
+        row = self._rows.get(food_name)
+        if row is None or row.profile is not profile:
+            if weight_grams not in {weight for _, weight in self.serving_weights(food_name)}:
+                return None
+            row = self._store_row(food_name, profile)
+        return row.results.get(weight_grams)
+
+    def _profile(self, food_name: str) -> Optional[DishProfile]:
+        """음식 프로필 (캐시된 프로필 객체를 우선 사용해 다음 갱신 시 변경 여부를 비교)"""
+        profile = self.nutrition_service.get_dish_profile(food_name)
+        return self.nutrition_service.cached_profile(food_name) or profile
+
+    def _current_row(self, food_name: str) -> Optional[ServingRow]:
+        profile = self._profile(food_name)
+        if profile is None:
+            return None
+        row = self._rows.get(food_name)
+        if row is not None and row.profile is profile:
+            return row
+        return self._store_row(food_name, profile)
+
+    def _store_row(self, food_name: str, profile: DishProfile) -> ServingRow:
+        """행 하나만 계산해 반영 (일괄 다운로드 JSON은 다음 조회 시 재직렬화)"""
+        row = self._build_row(food_name, profile)
+        if profile is self.nutrition_service.cached_profile(food_name):
+            with self._lock:
+                self._rows = {**self._rows, food_name: row}
+                self._bulk = None
+        return row
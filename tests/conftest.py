@@ -0,0 +1,92 @@
+"""
+pytest 공통 설정
+
+Mock 데이터로 서비스를 생성하고, SQLite 파일(작업/재료 버전)은 임시 디렉터리에 둡니다.
+main 모듈은 import 시 서비스를 생성하므로 환경변수를 먼저 설정합니다.
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_TEST_DATA_DIR = tempfile.mkdtemp(prefix='nutrition-tests-')
+os.environ['USE_MOCK_DATA'] = 'true'
+os.environ['JOBS_DB'] = os.path.join(_TEST_DATA_DIR, 'jobs.db')
+os.environ['INGREDIENT_VERSIONS_DB'] = os.path.join(_TEST_DATA_DIR, 'ingredient_versions.db')
+os.environ.pop('INGREDIENT_SNAPSHOT_FILE', None)
+
+import pytest
+
+from api import mock_data
+from services.nutrition_service import NutritionCalculationService
+
+
+@pytest.fixture
+def nutrition_service(tmp_path, monkeypatch):
+    """테스트마다 새 재료 버전 저장소를 사용하는 계산 서비스"""
+    monkeypatch.setenv('INGREDIENT_VERSIONS_DB', str(tmp_path / 'ingredient_versions.db'))
+    service = NutritionCalculationService(use_mock=True)
+    yield service
+    service.ingredient_versions.close()
+
+
+@pytest.fixture
+def mock_items(monkeypatch):
+    """Mock API 재료 데이터 (테스트 중 변경해도 테스트 후 원래 값으로 복원)"""
+    items = {name: dict(item) for name, item in mock_data.MOCK_NUTRITION_DATA.items()}
+    monkeypatch.setattr(mock_data, 'MOCK_NUTRITION_DATA', items)
+    return items
+
+
+@pytest.fixture
+def api_calls(nutrition_service, monkeypatch):
+    """계산 서비스의 재료명 API 조회 기록"""
+    calls = []
+    search = nutrition_service.api_client.search_food_by_name
+
+    def counting_search(food_name, *args, **kwargs):
+        calls.append(food_name)
+        return search(food_name, *args, **kwargs)
+
+    monkeypatch.setattr(nutrition_service.api_client, 'search_food_by_name', counting_search)
+    return calls
+
+
+@pytest.fixture(scope='session')
+def app_module():
+    """API 앱 모듈 (import 시 서비스 생성, 세션 동안 공유)"""
+    import main
+    return main
+
+
+@pytest.fixture
+def client(app_module):
+    """API 테스트 클라이언트 (종료 이벤트로 공유 서비스가 닫히지 않도록 lifespan 없이 사용)"""
+    from fastapi.testclient import TestClient
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """로컬 API 대역 서버 (실제 HTTP 클라이언트 경로 테스트용, 설정은 config로 변경)"""
+    import argparse
+    import threading
+    from http.server import ThreadingHTTPServer
+    from tools.stub_nutrition_api import FixtureCatalog, StubConfig, make_handler
+
+    args = argparse.Namespace(
+        latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, error_status=500,
+        result_code_rate=0.0, result_code='22', service_key='stub', seed=0
+    )
+    config = StubConfig(args)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(FixtureCatalog.load(None), config, quiet=True))
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv('SERVICE_KEY', 'stub')
+    monkeypatch.setenv('API_BASE_URL', f"http://127.0.0.1:{server.server_address[1]}/openapi")
+    yield config
+    server.shutdown()
+    server.server_close()
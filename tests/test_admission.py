@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from utils.admission import AdmissionController, AdmissionMiddleware, ClassLimiter, RequestShed, classify_request
+
+
+@pytest.mark.parametrize('method, path, expected', [
+    ('GET', '/health', 'exempt'),
+    ('GET', '/', 'exempt'),
+    ('GET', '/foods', 'read'),
+    ('GET', '/servings/감자샐러드', 'read'),
+    ('POST', '/meal-plans', 'compute'),
+    ('GET', '/calculate-nutrition/감자샐러드/100', 'compute')
+])
+def test_classify_request(method, path, expected):
+    assert classify_request(method, path) == expected
+
+
+def test_queue_full_and_budget_rejections():
+    async def scenario():
+        limiter = ClassLimiter('compute', concurrency=1, max_queue=1, budget_ms=1000)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RequestShed) as shed:
+            await limiter.acquire()
+        assert shed.value.reason == 'queue_full'
+
+        # 슬롯은 대기 중인 요청에 바로 넘겨짐
+        limiter.release(10.0)
+        await waiter
+        assert limiter.active == 1 and not limiter.waiters
+
+        # 예상 대기 시간이 예산을 넘으면 대기열에 넣지 않고 거부
+        limiter.service_ms = 5000.0
+        with pytest.raises(RequestShed) as shed:
+            await limiter.acquire()
+        assert shed.value.reason == 'latency_budget'
+        assert shed.value.retry_after == 5
+        return limiter
+
+    limiter = asyncio.run(scenario())
+    assert limiter.shed == {'queue_full': 1, 'latency_budget': 1, 'timeout': 0}
+
+
+def test_wait_timeout_rejection():
+    async def scenario():
+        limiter = ClassLimiter('read', concurrency=1, max_queue=4, budget_ms=20)
+        await limiter.acquire()
+        with pytest.raises(RequestShed) as shed:
+            await limiter.acquire()
+        assert shed.value.reason == 'timeout'
+        assert not limiter.waiters
+        limiter.release(1.0)
+        assert limiter.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_middleware_returns_503_with_retry_after():
+    app = FastAPI()
+    controller = AdmissionController({'read': (1, 0, 1000.0), 'compute': (1, 0, 1000.0)})
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @app.get('/foods')
+    async def slow():
+        await asyncio.sleep(0.1)
+        return []
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await asyncio.gather(client.get('/foods'), client.get('/foods'))
+
+    first, second = asyncio.run(scenario())
+    assert first.status_code == 200
+    assert second.status_code == 503
+    assert second.headers['retry-after'] == '1'
+    assert second.json()['reason'] == 'queue_full'
+    assert controller.metrics()['read']['shed']['queue_full'] == 1
+
+
+def test_blocking_calculation_does_not_stall_event_loop(app_module, monkeypatch):
+    def slow_calculation(*args, **kwargs):
+        time.sleep(0.5)
+        return None
+
+    monkeypatch.setattr(app_module.nutrition_service, 'calculate_nutrition', slow_calculation)
+    monkeypatch.setattr(app_module.serving_table_service, 'lookup', lambda *args: None)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            started = time.perf_counter()
+            calculation = asyncio.ensure_future(client.get('/calculate-nutrition/감자샐러드/123'))
+            await asyncio.sleep(0.05)
+            health = await client.get('/health')
+            health_seconds = time.perf_counter() - started
+            return await calculation, health, health_seconds
+
+    calculation, health, health_seconds = asyncio.run(scenario())
+    assert health.status_code == 200
+    assert health_seconds < 0.3
+    assert calculation.json()['success'] is False
@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from services.background_jobs import register_jobs
+from services.ingredient_index import IngredientIndexService
+from services.job_runner import CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueueFull, JobRunner
+from services.nutrient_query import NutrientQueryService
+from services.serving_table import ServingTableService
+
+
+class StepsParams(BaseModel):
+    steps: int = 3
+
+
+def _wait(runner, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = runner.get(job_id)
+        if job['status'] not in (QUEUED, RUNNING):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"작업이 끝나지 않았습니다: {runner.get(job_id)}")
+
+
+@pytest.fixture
+def runner(tmp_path):
+    runner = JobRunner(tmp_path / 'jobs.db', max_pending=2)
+    runner.recover()
+    yield runner
+    runner.shutdown()
+
+
+@pytest.fixture
+def ingredient_index_service(nutrition_service):
+    return IngredientIndexService(nutrition_service)
+
+
+@pytest.fixture
+def job_runner(runner, nutrition_service, ingredient_index_service):
+    register_jobs(
+        runner, nutrition_service, NutrientQueryService(nutrition_service),
+        ServingTableService(nutrition_service), ingredient_index_service
+    )
+    return runner
+
+
+def test_runner_lifecycle(runner):
+    release = threading.Event()
+
+    def blocking(context, steps=3):
+        for step in range(steps):
+            release.wait(2)
+            context.report(step + 1, steps)
+        return {'steps': steps}
+
+    def broken(context):
+        raise RuntimeError("boom")
+
+    runner.register('blocking', blocking, StepsParams)
+    runner.register('broken', broken)
+
+    with pytest.raises(ValueError):
+        runner.submit('unknown')
+
+    first = runner.submit('blocking', {'steps': 2})
+    runner.submit('blocking')
+    with pytest.raises(JobQueueFull):
+        runner.submit('blocking')
+
+    release.set()
+    assert _wait(runner, first['job_id'])['result'] == {'steps': 2}
+
+    failed = _wait(runner, runner.submit('broken')['job_id'])
+    assert failed['status'] == FAILED and failed['error'] == 'boom'
+
+
+@pytest.mark.parametrize('kind, params', [
+    ('rebuild_profiles', {'food': ['오믈렛']}),
+    ('rebuild_profiles', {'foods': '김치찌개'}),
+    ('rebuild_profiles', {'since': -1}),
+    ('refresh_ingredients', {'force': True}),
+    ('sync_dataset', {'snapshot_file': '/tmp/ingredients.json'}),
+])
+def test_invalid_params_are_rejected_on_submit(job_runner, kind, params):
+    with pytest.raises(ValueError):
+        job_runner.submit(kind, params)
+    assert job_runner.list() == []
+
+
+def test_running_job_is_cancelled_at_next_report(runner):
+    started = threading.Event()
+
+    def endless(context):
+        started.set()
+        while True:
+            time.sleep(0.01)
+            context.report(0, 1)
+
+    runner.register('endless', endless)
+    job_id = runner.submit('endless')['job_id']
+    assert started.wait(2)
+    runner.cancel(job_id)
+    assert _wait(runner, job_id)['status'] == CANCELLED
+
+
+def test_recover_requeues_pending_jobs(tmp_path):
+    first = JobRunner(tmp_path / 'jobs.db')
+    first.register('noop', lambda context: 'done')
+    first._conn.execute(
+        "INSERT INTO jobs (job_id, kind, params, status, created_at) VALUES ('a', 'noop', '{}', ?, 0), ('b', 'noop', '{}', ?, 1)",
+        (RUNNING, QUEUED)
+    )
+    first.shutdown()
+
+    second = JobRunner(tmp_path / 'jobs.db')
+    second.register('noop', lambda context: 'done')
+    second.recover()
+    try:
+        assert second.get('a')['status'] == FAILED
+        assert _wait(second, 'b')['result'] == 'done'
+    finally:
+        second.shutdown()
+
+
+def test_rebuild_profiles_recomputes_listed_foods(job_runner, nutrition_service):
+    nutrition_service.get_dish_profile('오믈렛')
+    nutrition_service.get_dish_profile('감자샐러드')
+    omelette = nutrition_service.cached_profile('오믈렛')
+    salad = nutrition_service.cached_profile('감자샐러드')
+
+    job = _wait(job_runner, job_runner.submit('rebuild_profiles', {'foods': ['오믈렛']})['job_id'])
+    assert job['status'] == SUCCEEDED
+    assert job['result']['foods'] == 1 and job['result']['incomplete'] == []
+    assert nutrition_service.cached_profile('오믈렛') is not omelette
+    assert nutrition_service.cached_profile('감자샐러드') is salad
+
+    unknown = _wait(job_runner, job_runner.submit('rebuild_profiles', {'foods': ['없는음식']})['job_id'])
+    assert unknown['status'] == FAILED
+
+
+def test_refresh_ingredients_invalidates_changed_only(job_runner, nutrition_service, mock_items):
+    nutrition_service.get_dish_profile('감자샐러드')
+    mock_items['계란'] = {**mock_items['계란'], 'prot': 13.5}
+
+    job = _wait(job_runner, job_runner.submit('refresh_ingredients')['job_id'])
+    assert job['status'] == SUCCEEDED
+    assert job['result']['changed'] == ['계란']
+    assert set(job['result']['invalidated_foods']) == nutrition_service.dish_graph.dishes_using_ingredient('계란')
+    assert nutrition_service.cached_profile('감자샐러드') is None
+
+
+def test_sync_dataset_writes_configured_snapshot(job_runner, nutrition_service, ingredient_index_service, tmp_path, mock_items):
+    snapshot_file = tmp_path / 'snapshot' / 'ingredients.json'
+    nutrition_service.snapshot_file = str(snapshot_file)
+    job = _wait(job_runner, job_runner.submit('sync_dataset')['job_id'])
+
+    assert job['status'] == SUCCEEDED
+    assert job['result']['items'] == len(mock_items)
+    assert len(json.loads(snapshot_file.read_text(encoding='utf-8'))) == len(mock_items)
+    assert nutrition_service.snapshot_file == str(snapshot_file)
+    assert 'INGREDIENT_SNAPSHOT_FILE' not in os.environ
+    assert len(ingredient_index_service.get_index()) == job['result']['indexed']
+
+
+def test_jobs_api_requires_admin_token(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module.profiling, 'token', 'secret')
+    body = {'kind': 'rebuild_profiles', 'params': {'foods': ['오믈렛']}}
+
+    assert client.post('/jobs', json=body).status_code == 403
+    assert client.post('/jobs', json=body, headers={'X-Profile-Token': 'wrong'}).status_code == 403
+    assert client.get('/jobs').status_code == 403
+
+    headers = {'X-Profile-Token': 'secret'}
+    job = client.post('/jobs', json=body, headers=headers)
+    assert job.status_code == 202
+    assert client.get(f"/jobs/{job.json()['job_id']}", headers=headers).status_code == 200
+
+    # 토큰이 설정되지 않으면 모든 요청 거부
+    monkeypatch.setattr(app_module.profiling, 'token', '')
+    assert client.get('/jobs', headers={'X-Profile-Token': ''}).status_code == 403
+
+
+def test_jobs_api_rejects_invalid_params(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module.profiling, 'token', 'secret')
+    response = client.post(
+        '/jobs', json={'kind': 'rebuild_profiles', 'params': {'foods': '김치찌개'}}, headers={'X-Profile-Token': 'secret'}
+    )
+    assert response.status_code == 400
+    assert 'foods' in response.json()['detail']
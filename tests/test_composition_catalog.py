@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from services.composition_catalog import (
+    CompositionValidationError,
+    compile_dish_record,
+    compile_dish_records,
+    dish_record_to_dict
+)
+from services.composition_store import DEFAULT_COMPOSITIONS_FILE
+
+
+def _data(**overrides):
+    data = {
+        'base_weight': 100,
+        'compositions': [
+            {'ingredient_name': '감자', 'percentage': 60.0},
+            {'ingredient_name': '마요네즈', 'percentage': 40.0, 'preparation': '생것'}
+        ]
+    }
+    data.update(overrides)
+    return data
+
+
+def test_record_is_immutable_and_reuses_complex_food():
+    record = compile_dish_record('감자샐러드', _data(serving_weight=150))
+    assert record.complex_food.total_weight == 100.0
+    assert record.serving_weight == 150.0
+    assert record.compositions[1].preparation == '생것'
+    with pytest.raises(AttributeError):
+        record.base_weight = 200
+
+
+@pytest.mark.parametrize('data', [
+    {},
+    _data(compositions=[]),
+    _data(base_weight=0),
+    _data(serving_weight=-1),
+    _data(compositions=[{'percentage': 100.0}]),
+    _data(compositions=[{'ingredient_name': '감자', 'percentage': 0}, {'ingredient_name': '계란', 'percentage': 100}]),
+    _data(compositions=[{'ingredient_name': '감자', 'percentage': 'sixty'}]),
+    _data(compositions=[{'ingredient_name': '감자', 'percentage': 60.0}, {'ingredient_name': '계란', 'percentage': 30.0}])
+])
+def test_invalid_compositions(data):
+    with pytest.raises(CompositionValidationError):
+        compile_dish_record('잘못된음식', data)
+
+
+def test_batch_compile_separates_errors():
+    records, errors = compile_dish_records({'정상': _data(), '오류': _data(base_weight=-5)})
+    assert set(records) == {'정상'}
+    assert set(errors) == {'오류'}
+
+
+def test_round_trip_to_dict():
+    data = _data(description='설명', serving_weight=150.0)
+    record = compile_dish_record('감자샐러드', data)
+    assert compile_dish_record('감자샐러드', dish_record_to_dict(record)) == record
+
+
+def test_bundled_compositions_are_valid():
+    with open(DEFAULT_COMPOSITIONS_FILE, 'r', encoding='utf-8') as f:
+        _, errors = compile_dish_records(json.load(f))
+    assert errors == {}
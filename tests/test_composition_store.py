@@ -0,0 +1,75 @@
+import pytest
+
+from services.composition_catalog import compile_dish_record
+from services.composition_store import CompositionStore, InMemoryCompositionStore, SqliteCompositionStore
+from services.dish_graph import DishGraph
+
+
+def _record(food_name, *compositions):
+    return compile_dish_record(food_name, {
+        'base_weight': 100,
+        'compositions': [
+            {'ingredient_name': name, 'percentage': percentage, 'is_dish': is_dish}
+            for name, percentage, is_dish in compositions
+        ]
+    })
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    store = SqliteCompositionStore(tmp_path / 'compositions.db', cache_size=2)
+    store.put(_record('소스', ('마요네즈', 50.0, False), ('계란', 50.0, False)))
+    store.put(_record('샐러드', ('감자', 80.0, False), ('소스', 20.0, True)))
+    store.put(_record('도시락', ('샐러드', 50.0, True), ('감자', 50.0, False)))
+    yield store
+    store.close()
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        CompositionStore()
+
+
+def test_sqlite_names_and_dependents(sqlite_store):
+    assert sqlite_store.names() == ['도시락', '샐러드', '소스']
+    assert sqlite_store.names(after='도시락', limit=1) == ['샐러드']
+    assert sqlite_store.count(prefix='샐') == 1
+    assert sqlite_store.dish_dependents('소스') == {'샐러드'}
+    assert sqlite_store.ingredient_dependents('감자') == {'샐러드', '도시락'}
+
+    sqlite_store.remove('도시락')
+    assert not sqlite_store.contains('도시락')
+    assert sqlite_store.ingredient_dependents('감자') == {'샐러드'}
+
+
+def test_sqlite_record_cache_is_bounded(sqlite_store):
+    for food_name in ('도시락', '샐러드', '소스'):
+        assert sqlite_store.get(food_name) is not None
+    assert list(sqlite_store._cache) == ['샐러드', '소스']
+
+
+def test_sqlite_detects_changes_from_other_process(sqlite_store, tmp_path):
+    other = SqliteCompositionStore(tmp_path / 'compositions.db')
+    other.put(_record('소스', ('계란', 100.0, False)))
+    other.remove('도시락')
+    other.close()
+
+    changes = sqlite_store.pending_changes()
+    assert set(changes) == {'소스', '도시락'}
+    assert changes['도시락'] is None
+    assert sqlite_store.get('소스').compositions[0].ingredient_name == '계란'
+    assert sqlite_store.pending_changes() == {}
+
+
+def test_graph_memo_is_bounded():
+    store = InMemoryCompositionStore({
+        name: _record(name, ('감자', 100.0, False)) for name in ('가', '나', '다')
+    })
+    graph = DishGraph(store, cache_size=2)
+    for food_name in ('가', '나', '다'):
+        graph.flatten(food_name)
+        graph.flatten_preparations(food_name)
+
+    assert list(graph._flattened) == ['나', '다']
+    assert list(graph._prepared) == ['나', '다']
+    assert graph.flatten('가') == pytest.approx({'감자': 1.0})
@@ -0,0 +1,132 @@
+import asyncio
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from utils.compression import CompressionMiddleware, choose_encoding, parse_accept_encoding
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding('gzip, br;q=0.5, identity;q=x') == {'gzip': 1.0, 'br': 0.5, 'identity': 0.0}
+
+
+@pytest.mark.parametrize('header, brotli_available, expected', [
+    ('gzip, br', True, 'br'),
+    ('gzip, br', False, 'gzip'),
+    ('gzip;q=1.0, br;q=0.2', True, 'gzip'),
+    ('*', True, 'br'),
+    ('gzip;q=0, identity', True, None),
+    ('deflate', False, None)
+])
+def test_choose_encoding(header, brotli_available, expected):
+    assert choose_encoding(header, brotli_available) == expected
+
+
+@pytest.fixture
+def small_app_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get('/json')
+    def large_json():
+        return {'values': list(range(100))}
+
+    @app.get('/small')
+    def small_json():
+        return {'ok': True}
+
+    @app.get('/binary')
+    def binary():
+        return PlainTextResponse('x' * 500, media_type='image/png')
+
+    @app.get('/stream')
+    def stream():
+        return StreamingResponse((f'{{"line": {i}}}\n' for i in range(50)), media_type='text/plain')
+
+    return TestClient(app)
+
+
+def test_large_json_is_gzipped(small_app_client):
+    response = small_app_client.get('/json', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['vary'] == 'Accept-Encoding'
+    assert response.json() == {'values': list(range(100))}
+
+
+def test_small_or_binary_responses_are_not_compressed(small_app_client):
+    small = small_app_client.get('/small', headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in small.headers
+    assert small.json() == {'ok': True}
+
+    binary = small_app_client.get('/binary', headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in binary.headers
+
+
+def test_identity_request_is_passed_through(small_app_client):
+    response = small_app_client.get('/json', headers={'Accept-Encoding': 'identity'})
+    assert 'content-encoding' not in response.headers
+    assert response.json() == {'values': list(range(100))}
+
+
+def test_uncompressed_responses_vary_on_accept_encoding(small_app_client):
+    for accept in ('identity', 'deflate'):
+        response = small_app_client.get('/json', headers={'Accept-Encoding': accept})
+        assert 'content-encoding' not in response.headers
+        assert response.headers['vary'] == 'Accept-Encoding'
+
+    binary = small_app_client.get('/binary', headers={'Accept-Encoding': 'identity'})
+    assert 'vary' not in binary.headers
+
+
+def test_streaming_response_is_compressed(small_app_client):
+    response = small_app_client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['content-encoding'] == 'gzip'
+    assert 'content-length' not in response.headers
+    assert response.text == ''.join(f'{{"line": {i}}}\n' for i in range(50))
+
+
+def test_streaming_chunks_are_sent_without_buffering():
+    chunks = [b'{"line": 1}\n', b'{"line": 2}\n', b'']
+
+    async def app(scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/plain')]})
+        for chunk in chunks:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': bool(chunk)})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'headers': [(b'accept-encoding', b'gzip')]}
+    asyncio.run(CompressionMiddleware(app)(scope, None, send))
+
+    bodies = [message for message in sent if message['type'] == 'http.response.body']
+    assert len(bodies) == len(chunks)
+    # 청크마다 flush하므로 지금까지 받은 압축 데이터만으로 해당 청크까지 복원됨
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for message, chunk in zip(bodies, chunks):
+        assert decoder.decompress(message['body']) == chunk
+    assert decoder.eof
+
+
+def test_fields_and_detail_shape_response(client):
+    response = client.get('/calculate-nutrition/감자샐러드/150', params={'fields': 'energy,protein', 'detail': 'false'})
+    assert response.status_code == 200
+    data = response.json()['data']
+    assert 'energy' in data and 'protein' in data
+    assert 'sodium' not in data
+    assert 'composition_details' not in data
+
+    full = client.get('/calculate-nutrition/감자샐러드/150').json()['data']
+    assert data['energy'] == pytest.approx(full['energy'])
+    assert full['composition_details']
+
+
+def test_unknown_field_is_rejected(client):
+    response = client.get('/calculate-nutrition/감자샐러드/150', params={'fields': 'energy,unknown'})
+    assert response.status_code == 400
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from api import mock_data
+from services.ingredient_index import IngredientIndex
+from utils.compute_pool import ComputePool, SharedArray, create_compute_pool, iter_rows
+
+
+def _row_sums(start, stop, handle):
+    return [sum(row) for row in iter_rows(handle, start, stop)]
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = ComputePool(2, task_ms=20.0)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def shared():
+    array = SharedArray([[float(i), float(i) * 2] for i in range(50)], 2)
+    yield array
+    array.close()
+
+
+def test_shared_array_rows(shared):
+    assert shared.handle[1:] == (50, 2)
+    rows = [list(row) for row in iter_rows(shared.handle, 3, 5)]
+    assert rows == [[3.0, 6.0], [4.0, 8.0]]
+
+
+def test_run_uses_worker_process(pool):
+    assert pool.run(os.getpid) != os.getpid()
+
+
+def test_map_chunks_keeps_chunk_order(pool, shared):
+    chunks = pool.map_chunks('row_sums', 50, _row_sums, (shared.handle,))
+    # 처리 시간 측정 전에는 작업 프로세스마다 4개 청크로 나눔
+    assert len(chunks) == 2 * 4
+    assert [value for chunk in chunks for value in chunk] == [i * 3.0 for i in range(50)]
+    assert 'row_sums' in pool.metrics()['row_cost_ms']
+
+
+def test_small_work_runs_inline(pool):
+    # 측정된 행당 처리 시간으로 전체가 목표 청크 시간보다 짧으면 현재 프로세스에서 계산
+    pool._record('inline_kind', 1.0, 1000)
+    assert pool.chunk_size('inline_kind', 100) is None
+    inline_runs = pool.metrics()['inline_runs']
+
+    chunks = pool.map_chunks('inline_kind', 100, _row_sums, (), inline=lambda start, stop: (start, stop))
+    assert chunks == [(0, 100)]
+    assert pool.metrics()['inline_runs'] == inline_runs + 1
+
+
+def test_chunk_size_targets_task_time(pool):
+    pool._record('slow_kind', 100.0, 10)
+    # 행당 10ms, 목표 20ms → 청크당 2행
+    assert pool.chunk_size('slow_kind', 100) == 2
+
+
+def test_ingredient_search_matches_inline(pool):
+    index = IngredientIndex(list(mock_data.MOCK_NUTRITION_DATA.values()))
+    for metric in ('euclidean', 'manhattan', 'cosine'):
+        values = index.raw[0]
+        expected = index.search(values, k=3, metric=metric, exclude=0)
+        assert index.search(values, k=3, metric=metric, exclude=0, pool=pool) == pytest.approx(expected)
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv('COMPUTE_POOL_WORKERS', raising=False)
+    assert create_compute_pool() is None
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from models.records import NUTRIENT_KEYS
+from services.composition_catalog import compile_dish_record
+from services.composition_store import InMemoryCompositionStore
+from services.cooking_factors import RAW, CookingFactorTable
+from services.nutrition_service import NutritionCalculationService
+
+
+def _record(food_name, *compositions):
+    return compile_dish_record(food_name, {
+        'base_weight': 100,
+        'compositions': [
+            {'ingredient_name': name, 'percentage': percentage, 'is_dish': False, 'preparation': preparation}
+            for name, percentage, preparation in compositions
+        ]
+    })
+
+
+@pytest.fixture
+def table():
+    return CookingFactorTable()
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """조리 상태가 있는 음식만 등록한 계산 서비스 (저장소 파일을 바꾸지 않음)"""
+    monkeypatch.setenv('INGREDIENT_VERSIONS_DB', str(tmp_path / 'ingredient_versions.db'))
+    store = InMemoryCompositionStore({
+        '삶은감자': _record('삶은감자', ('감자', 100.0, '삶은 감자')),
+        '감자튀김': _record('감자튀김', ('감자', 50.0, '튀긴 감자'), ('식용유', 50.0, None)),
+        '감자계란': _record('감자계란', ('감자', 50.0, None), ('계란', 50.0, None))
+    })
+    service = NutritionCalculationService(use_mock=True, composition_store=store)
+    yield service
+    service.ingredient_versions.close()
+
+
+def test_method_from_preparation_keywords(table):
+    assert table.method_of('삶은 감자') == 'boiled'
+    assert table.method_of('구워낸 전') == 'fried'
+    assert table.method_of('구운 감자') == 'grilled'
+    assert table.method_of('다진 감자') == 'raw'
+    assert table.method_of(None) == 'raw'
+
+
+def test_ingredient_override(table):
+    potato = table.factor('감자', '삶은 감자')
+    onion = table.factor('양파', '삶은 양파')
+    assert potato.retention[NUTRIENT_KEYS.index('vitamin_c')] == 0.75
+    assert onion.retention[NUTRIENT_KEYS.index('vitamin_c')] == 0.7
+    assert potato.retention[NUTRIENT_KEYS.index('energy')] == 1.0
+    assert table.factor('감자', '삶은 감자') is potato
+
+
+def test_missing_file_means_raw(tmp_path):
+    table = CookingFactorTable(str(tmp_path / 'missing.json'))
+    assert table.factor('감자', '튀긴 감자') == RAW
+
+
+def test_custom_factor_file(tmp_path):
+    path = tmp_path / 'factors.json'
+    path.write_text(json.dumps({
+        'methods': {'smoked': {'keywords': ['훈제'], 'yield': 0.7, 'retention': {'vitamin_c': 0.5}}}
+    }), encoding='utf-8')
+    factor = CookingFactorTable(str(path)).factor('감자', '훈제 감자')
+    assert (factor.method, factor.yield_factor) == ('smoked', 0.7)
+    assert factor.retention[NUTRIENT_KEYS.index('vitamin_c')] == 0.5
+
+
+def test_variants_are_precomputed(service):
+    profile = service.get_dish_profile('삶은감자')
+    assert set(profile.variants) == {(True, False), (False, True), (True, True)}
+    # 재료가 하나면 폐기율을 적용해도 100g당 값은 같음
+    _, refused = service.select_variant(profile, apply_refuse=True)
+    assert refused == pytest.approx(profile.per_100g)
+    _, raw = service.select_variant(profile)
+    assert raw is profile.per_100g
+
+
+def test_cooking_retention(service):
+    profile = service.get_dish_profile('삶은감자')
+    _, cooked = service.select_variant(profile, apply_cooking=True)
+    assert cooked['vitamin_c'] == pytest.approx(profile.per_100g['vitamin_c'] * 0.75)
+    assert cooked['potassium'] == pytest.approx(profile.per_100g['potassium'] * 0.9)
+    assert cooked['energy'] == pytest.approx(profile.per_100g['energy'])
+
+
+def test_cooking_yield_concentrates_nutrients(service):
+    profile = service.get_dish_profile('감자튀김')
+    _, cooked = service.select_variant(profile, apply_cooking=True)
+    # 튀긴 감자는 중량이 80%로 줄어 완성된 음식 90g에 조리 전 100g의 열량이 남음
+    assert cooked['energy'] == pytest.approx(profile.per_100g['energy'] / 0.9)
+
+
+def test_refuse_reweights_ingredients(service):
+    profile = service.get_dish_profile('감자계란')
+    ingredients, _ = service.select_variant(profile, apply_refuse=True)
+    fractions = {share.ingredient_name: share.fraction for share in ingredients}
+    # 감자 폐기율 15%, 계란 폐기율 12%
+    assert fractions['감자'] == pytest.approx(0.85 / (0.85 + 0.88))
+    assert sum(fractions.values()) == pytest.approx(1.0)
+
+
+def test_corrected_request_bypasses_serving_table(client):
+    plain = client.get('/calculate-nutrition/감자샐러드/150').json()['data']
+    cooked = client.get('/calculate-nutrition/감자샐러드/150', params={'apply_refuse': True}).json()['data']
+    assert plain['energy'] != cooked['energy']
@@ -0,0 +1,113 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from api.nutrition_client import NutritionAPIClient
+from models.schemas import NutritionCalculationRequest
+from utils import deadline
+from utils.deadline import DeadlineExceeded
+
+
+@pytest.fixture(autouse=True)
+def clear_deadline():
+    yield
+    deadline.set_deadline(None)
+
+
+def test_bounded_timeout():
+    assert deadline.bounded_timeout(30) == 30
+    deadline.set_deadline(500)
+    assert 0 < deadline.bounded_timeout(30) <= 0.5
+    assert deadline.bounded_timeout(0.1) == 0.1
+
+    deadline.set_deadline(1)
+    time.sleep(0.01)
+    assert deadline.expired()
+    with pytest.raises(DeadlineExceeded):
+        deadline.bounded_timeout(30)
+
+
+def test_expired_deadline_skips_fetch(stub_api):
+    client = NutritionAPIClient(use_mock=False)
+    deadline.set_deadline(1)
+    time.sleep(0.01)
+    with pytest.raises(DeadlineExceeded):
+        client.search_food_by_name('감자')
+    assert stub_api.stats['requests'] == 0
+
+
+def test_slow_response_is_cut_at_deadline(stub_api):
+    stub_api.update({'latency_ms': 1000})
+    client = NutritionAPIClient(use_mock=False)
+    deadline.set_deadline(150)
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        client.search_food_by_name('감자')
+    assert time.perf_counter() - started < 0.5
+
+
+@pytest.fixture
+def trickling_server(monkeypatch):
+    """응답 헤더 후 본문을 조금씩 보내는 서버 (소켓 작업 단위 타임아웃으로는 끊기지 않음)"""
+    class TrickleHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(64 * 1024 * 40))
+            self.end_headers()
+            try:
+                for _ in range(40):
+                    self.wfile.write(b' ' * 64 * 1024)
+                    self.wfile.flush()
+                    time.sleep(0.03)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TrickleHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    monkeypatch.setenv('SERVICE_KEY', 'stub')
+    monkeypatch.setenv('API_BASE_URL', f"http://127.0.0.1:{server.server_address[1]}/openapi")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_trickling_body_is_bounded_by_deadline(trickling_server):
+    client = NutritionAPIClient(use_mock=False)
+    deadline.set_deadline(200)
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        client.search_food_by_name('감자')
+    assert time.perf_counter() - started < 0.6
+
+
+def test_partial_result_when_deadline_passes(nutrition_service, monkeypatch):
+    search = nutrition_service.api_client.search_food_by_name
+
+    def slow_search(food_name, *args, **kwargs):
+        time.sleep(0.15)
+        return search(food_name, *args, **kwargs)
+
+    monkeypatch.setattr(nutrition_service.api_client, 'search_food_by_name', slow_search)
+    deadline.set_deadline(100)
+    result = nutrition_service.calculate_nutrition(
+        NutritionCalculationRequest(food_name='감자샐러드', weight_grams=100)
+    )
+
+    assert result is not None
+    assert result.partial and result.deadline_exceeded
+    assert len(result.missing_ingredients) == 2
+    assert result.energy > 0
+
+
+def test_deadline_header_validation(client):
+    response = client.get('/calculate-nutrition/감자샐러드/100', headers={'X-Request-Deadline-Ms': '0'})
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+import pytest
+
+from services.composition_catalog import compile_dish_record
+from services.composition_store import InMemoryCompositionStore
+from services.dish_graph import CompositionCycleError, CompositionGraphError, DishGraph
+
+
+def _record(food_name, *compositions):
+    return compile_dish_record(food_name, {
+        'base_weight': 100,
+        'compositions': [
+            {'ingredient_name': name, 'percentage': percentage, 'is_dish': is_dish}
+            for name, percentage, is_dish in compositions
+        ]
+    })
+
+
+@pytest.fixture
+def graph():
+    store = InMemoryCompositionStore({
+        '소스': _record('소스', ('마요네즈', 50.0, False), ('계란', 50.0, False)),
+        '샐러드': _record('샐러드', ('감자', 80.0, False), ('소스', 20.0, True)),
+        '도시락': _record('도시락', ('샐러드', 50.0, True), ('감자', 50.0, False))
+    })
+    return DishGraph(store)
+
+
+def test_flatten_nested_dishes(graph):
+    shares = graph.flatten('도시락')
+    assert shares == pytest.approx({'감자': 0.9, '마요네즈': 0.05, '계란': 0.05})
+
+
+def test_cycle_is_rejected_and_rolled_back(graph):
+    before = graph.get_dish('소스')
+    with pytest.raises(CompositionCycleError):
+        graph.update_dish('소스', _record('소스', ('도시락', 100.0, True)))
+
+    assert graph.get_dish('소스') == before
+    assert graph.flatten('도시락') == pytest.approx({'감자': 0.9, '마요네즈': 0.05, '계란': 0.05})
+
+
+def test_unknown_dish_reference(graph):
+    with pytest.raises(CompositionGraphError):
+        graph.update_dish('비빔밥', _record('비빔밥', ('없는음식', 100.0, True)))
+    assert not graph.has_dish('비빔밥')
+
+
+def test_invalidation_only_touches_dependents(graph):
+    graph.flatten('도시락')
+    affected = graph.update_dish('소스', _record('소스', ('계란', 100.0, False)))
+
+    assert affected == {'소스', '샐러드', '도시락'}
+    assert graph.flatten('도시락') == pytest.approx({'감자': 0.9, '계란': 0.1})
+    assert graph.dishes_using_ingredient('마요네즈') == set()
+    assert graph.dishes_using_ingredient('계란') == {'소스', '샐러드', '도시락'}
+
+
+def test_remove_dish_invalidates_parents(graph):
+    affected = graph.remove_dish('도시락')
+    assert affected == {'도시락'}
+    assert not graph.has_dish('도시락')
+    assert graph.remove_dish('도시락') == set()
+
+
+def test_profile_is_memoized_and_invalidated(nutrition_service):
+    nutrition_service.get_dish_profile('도시락')
+    profile = nutrition_service.cached_profile('도시락')
+    assert profile is not None
+    assert nutrition_service.get_dish_profile('도시락') is profile
+
+    affected = nutrition_service.invalidate_ingredient('계란')
+    assert {'도시락', '오믈렛', '감자샐러드'} <= affected
+    assert nutrition_service.cached_profile('도시락') is None
+    assert nutrition_service.get_dish_profile('도시락') is not profile
+
+
+def test_profile_cache_expires_with_ingredient_ttl(nutrition_service, api_calls, monkeypatch):
+    nutrition_service.get_dish_profile('감자샐러드')
+    profile = nutrition_service.cached_profile('감자샐러드')
+    calls = len(api_calls)
+    assert nutrition_service.get_dish_profile('감자샐러드') is profile
+    assert len(api_calls) == calls
+
+    # 가장 오래된 재료 조회 시각 기준으로 유효 시간이 지나면 재료를 다시 조회해 계산
+    clock = profile.fetched_at + nutrition_service.ingredient_cache_ttl + 1
+    monkeypatch.setattr('services.nutrition_service.time.time', lambda: clock)
+    assert nutrition_service.cached_profile('감자샐러드') is None
+    refreshed = nutrition_service.get_dish_profile('감자샐러드')
+    assert refreshed is not profile
+    assert len(api_calls) > calls
+    assert refreshed.per_100g == pytest.approx(profile.per_100g)
+
+
+def test_profile_cache_is_bounded(nutrition_service):
+    nutrition_service.profile_cache_size = 2
+    for food_name in ('감자샐러드', '오믈렛', '스크램블에그'):
+        nutrition_service.get_dish_profile(food_name)
+
+    assert nutrition_service.cached_profile('감자샐러드') is None
+    assert nutrition_service.cached_profile('오믈렛') is not None
+    assert nutrition_service.cached_profile('스크램블에그') is not None
@@ -0,0 +1,73 @@
+import pytest
+
+from models.schemas import NutrientConstraint
+from services.food_listing import FoodListingService, parse_nutrient_range
+from services.nutrient_query import NutrientQueryService
+
+
+@pytest.fixture
+def listing(nutrition_service):
+    return FoodListingService(nutrition_service, NutrientQueryService(nutrition_service))
+
+
+def _all_pages(listing, **filters):
+    names, cursor = [], None
+    while True:
+        page = listing.list_foods(limit=3, cursor=cursor, **filters)
+        names += page.items
+        cursor = page.next_cursor
+        if cursor is None:
+            return names
+
+
+def test_cursor_pages_cover_all_foods(listing, nutrition_service):
+    first = listing.list_foods(limit=3)
+    assert len(first.items) == 3
+    assert first.total == len(nutrition_service.get_available_foods())
+    assert _all_pages(listing) == sorted(nutrition_service.get_available_foods())
+
+
+def test_prefix_and_ingredient_filters(listing, nutrition_service):
+    assert _all_pages(listing, prefix='감자') == ['감자샐러드', '감자전', '감자튀김']
+    using_egg = _all_pages(listing, ingredient='계란')
+    assert using_egg == sorted(nutrition_service.dish_graph.dishes_using_ingredient('계란'))
+
+
+def test_nutrient_range_filter(listing, nutrition_service):
+    ranges = [parse_nutrient_range('protein:5:')]
+    names = _all_pages(listing, nutrient_ranges=ranges)
+    assert names
+    for food_name in nutrition_service.get_available_foods():
+        matched = nutrition_service.get_dish_profile(food_name).per_100g['protein'] >= 5
+        assert (food_name in names) == matched
+
+
+def test_cursor_is_bound_to_filters(listing):
+    cursor = listing.list_foods(prefix='감자', limit=1).next_cursor
+    with pytest.raises(ValueError):
+        listing.list_foods(prefix='샐', cursor=cursor)
+    with pytest.raises(ValueError):
+        listing.list_foods(cursor='not-a-cursor')
+
+
+def test_invalid_nutrient_range():
+    with pytest.raises(ValueError):
+        parse_nutrient_range('protein:5')
+    with pytest.raises(ValueError):
+        parse_nutrient_range('protein:a:')
+    assert parse_nutrient_range('energy::200') == NutrientConstraint(nutrient='energy', max=200.0)
+
+
+def test_foods_endpoint_paging_headers(client, app_module):
+    response = client.get('/foods', params={'limit': 2})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert int(response.headers['X-Total-Count']) > 2
+
+    names = response.json()
+    while 'X-Next-Cursor' in response.headers:
+        response = client.get('/foods', params={'limit': 2, 'cursor': response.headers['X-Next-Cursor']})
+        names += response.json()
+    assert names == sorted(app_module.nutrition_service.get_available_foods())
+
+    assert client.get('/foods', params={'cursor': 'broken'}).status_code == 400
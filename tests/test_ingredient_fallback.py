@@ -0,0 +1,77 @@
+import json
+import time
+
+import pytest
+
+from api import mock_data
+from models.schemas import NutritionCalculationRequest
+
+
+@pytest.fixture
+def failing_api(nutrition_service, monkeypatch):
+    """API 조회를 실패시키는 스위치"""
+    state = {'failing': False}
+    search = nutrition_service.api_client.search_food_by_name
+
+    def flaky_search(food_name, *args, **kwargs):
+        if state['failing']:
+            raise ConnectionError("upstream down")
+        return search(food_name, *args, **kwargs)
+
+    monkeypatch.setattr(nutrition_service.api_client, 'search_food_by_name', flaky_search)
+    return state
+
+
+def _calculate(service, food_name='감자샐러드'):
+    return service.calculate_nutrition(NutritionCalculationRequest(food_name=food_name, weight_grams=100))
+
+
+def _advance_clock(monkeypatch, seconds):
+    """캐시된 재료/프로필이 seconds만큼 오래된 것처럼 시계를 앞당김"""
+    now = time.time() + seconds
+    monkeypatch.setattr('services.nutrition_service.time.time', lambda: now)
+
+
+def test_fresh_result_has_full_coverage(nutrition_service):
+    result = _calculate(nutrition_service)
+    assert result.coverage.covered_weight_percent == pytest.approx(100.0)
+    assert not result.coverage.degraded
+    assert {item.source for item in result.coverage.ingredients} == {'fresh'}
+    assert {item.source for item in _calculate(nutrition_service).coverage.ingredients} <= {'cache', 'fresh'}
+
+
+def test_expired_cache_is_used_when_api_fails(nutrition_service, failing_api, monkeypatch):
+    fresh = _calculate(nutrition_service)
+    _advance_clock(monkeypatch, nutrition_service.ingredient_cache_ttl + 1)
+    failing_api['failing'] = True
+
+    result = _calculate(nutrition_service)
+    assert not result.partial
+    assert result.coverage.degraded
+    assert {item.source for item in result.coverage.ingredients} == {'stale'}
+    assert result.energy == pytest.approx(fresh.energy)
+    # 대체 데이터로 만든 프로필은 캐시하지 않음
+    assert nutrition_service.cached_profile('감자샐러드') is None
+
+
+def test_stale_data_older_than_max_age_is_dropped(nutrition_service, failing_api, monkeypatch):
+    _calculate(nutrition_service)
+    _advance_clock(monkeypatch, nutrition_service.ingredient_stale_max_age + 1)
+    failing_api['failing'] = True
+
+    result = _calculate(nutrition_service)
+    assert result.partial
+    assert result.coverage.covered_weight_percent == 0.0
+    assert {item.source for item in result.coverage.ingredients} == {None}
+
+
+def test_snapshot_is_used_when_api_fails(nutrition_service, failing_api, tmp_path, monkeypatch):
+    snapshot = tmp_path / 'snapshot.json'
+    snapshot.write_text(json.dumps(list(mock_data.MOCK_NUTRITION_DATA.values()), ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setenv('INGREDIENT_SNAPSHOT_FILE', str(snapshot))
+    failing_api['failing'] = True
+
+    result = _calculate(nutrition_service)
+    assert not result.partial
+    assert result.coverage.degraded
+    assert {item.source for item in result.coverage.ingredients} == {'snapshot'}
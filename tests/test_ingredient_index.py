@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from api import mock_data
+from models.records import NUTRIENT_KEYS
+from services.ingredient_index import IngredientIndex, IngredientIndexService, fetch_ingredient_list
+
+
+@pytest.fixture
+def index():
+    return IngredientIndex(list(mock_data.MOCK_NUTRITION_DATA.values()))
+
+
+def test_nearest_neighbour_is_itself(index):
+    for position, values in enumerate(index.raw):
+        distance, nearest = index.search(values, k=1)[0]
+        assert distance == pytest.approx(0.0)
+        assert index.raw[nearest] == values
+
+
+def test_results_are_sorted_and_exclude_query(index):
+    position = index.find(food_name=mock_data.MOCK_NUTRITION_DATA['마요네즈']['foodNm'])
+    results = index.search(index.raw[position], k=3, exclude=position)
+    assert position not in [i for _, i in results]
+    assert [distance for distance, _ in results] == sorted(distance for distance, _ in results)
+
+
+def test_lower_filter(index):
+    position = index.find(food_name=mock_data.MOCK_NUTRITION_DATA['마요네즈']['foodNm'])
+    fat = index.raw[position][NUTRIENT_KEYS.index('fat')]
+    results = index.search(index.raw[position], k=10, lower=['fat'], exclude=position)
+    assert results
+    assert all(index.raw[i][NUTRIENT_KEYS.index('fat')] < fat for _, i in results)
+
+
+def test_invalid_metric_and_nutrient(index):
+    with pytest.raises(ValueError):
+        index.search(index.raw[0], metric='chebyshev')
+    with pytest.raises(ValueError):
+        index.search(index.raw[0], nutrients=['unknown'])
+
+
+def test_list_api_pages(nutrition_service, monkeypatch):
+    monkeypatch.setenv('SNAPSHOT_PAGE_SIZE', '2')
+    progress = []
+    items = fetch_ingredient_list(nutrition_service.api_client, progress=lambda done, total: progress.append(done))
+    assert len(items) == len(mock_data.MOCK_NUTRITION_DATA)
+    assert progress == sorted(progress)
+
+
+def test_service_uses_snapshot_file(nutrition_service, tmp_path, monkeypatch):
+    snapshot = tmp_path / 'snapshot.json'
+    snapshot.write_text(json.dumps(list(mock_data.MOCK_NUTRITION_DATA.values()), ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setenv('INGREDIENT_SNAPSHOT_FILE', str(snapshot))
+
+    result = IngredientIndexService(nutrition_service).find_similar('계란', k=2)
+    assert result['indexed_count'] == len(mock_data.MOCK_NUTRITION_DATA)
+    assert len(result['results']) == 2
+    assert result['food_code'] not in [item['food_code'] for item in result['results']]
@@ -0,0 +1,99 @@
+import pytest
+
+from services.ingredient_versions import IngredientVersionStore
+
+
+def _item(energy, protein=2.0):
+    return {'foodCd': 'R001', 'foodNm': '감자, 생것', 'enerc': energy, 'prot': protein}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = IngredientVersionStore(tmp_path / 'versions.db', feed_size=2)
+    yield store
+    store.close()
+
+
+def test_first_fetch_is_baseline(store):
+    assert store.record('감자', _item(77.0), lambda name: pytest.fail('변경이 없으면 호출하지 않음')) is None
+    assert store.current('감자').version == 1
+    assert store.record('감자', dict(reversed(list(_item(77.0).items()))), lambda name: ()) is None
+    assert store.last_seq() == 0
+
+
+def test_changed_content_is_recorded(store):
+    store.record('감자', _item(77.0), lambda name: ())
+    change = store.record('감자', _item(80.0), lambda name: {'감자전', '감자샐러드'})
+
+    assert (change.old_version, change.new_version) == (1, 2)
+    assert change.food_code == 'R001'
+    assert change.changes == {'enerc': {'old': 77.0, 'new': 80.0}}
+    assert change.affected_dishes == ('감자샐러드', '감자전')
+    assert store.changes() == [change]
+    assert store.affected_since(0) == ({'감자샐러드', '감자전'}, change.seq)
+    assert store.affected_since(change.seq) == (set(), change.seq)
+
+
+def test_versions_survive_restart(tmp_path):
+    path = tmp_path / 'versions.db'
+    store = IngredientVersionStore(path)
+    store.record('감자', _item(77.0), lambda name: ())
+    store.close()
+
+    reopened = IngredientVersionStore(path)
+    try:
+        assert reopened.record('감자', _item(77.0), lambda name: ()) is None
+        change = reopened.record('감자', _item(77.0, protein=3.0), lambda name: ())
+        assert change.new_version == 2
+        assert change.changes == {'prot': {'old': 2.0, 'new': 3.0}}
+    finally:
+        reopened.close()
+
+
+def test_feed_keeps_recent_entries(store):
+    for energy in (70.0, 71.0, 72.0, 73.0):
+        store.record('감자', _item(energy), lambda name: ())
+
+    changes = store.changes()
+    assert [change.new_version for change in changes] == [3, 4]
+    assert store.changes(since=changes[0].seq) == changes[1:]
+    assert store.last_seq() == changes[-1].seq
+
+
+def test_change_invalidates_only_dependents(nutrition_service, mock_items):
+    nutrition_service.get_dish_profile('감자샐러드')
+    nutrition_service.get_dish_profile('계란프라이')
+    version = nutrition_service.profile_version
+
+    assert nutrition_service.refresh_ingredient('감자') == set()
+    mock_items['감자'] = {**mock_items['감자'], 'enerc': 90.0}
+    affected = nutrition_service.refresh_ingredient('감자')
+
+    assert '감자샐러드' in affected and '계란프라이' not in affected
+    assert nutrition_service.cached_profile('감자샐러드') is None
+    assert nutrition_service.cached_profile('계란프라이') is not None
+    assert nutrition_service.profiles_changed_since(version) == affected
+
+
+def test_profile_change_log_overflow(nutrition_service):
+    version = nutrition_service.profile_version
+    for _ in range(nutrition_service._profile_changes.maxlen + 1):
+        nutrition_service.invalidate_dishes({'감자샐러드'})
+    # 기록이 잘린 경우 전체 재생성이 필요함
+    assert nutrition_service.profiles_changed_since(version) is None
+
+
+def test_change_feed_endpoint(client, app_module, mock_items):
+    service = app_module.nutrition_service
+    service.refresh_ingredient('양파')
+    since = service.ingredient_versions.last_seq()
+    mock_items['양파'] = {**mock_items['양파'], 'prot': 9.9}
+    service.refresh_ingredient('양파')
+
+    feed = client.get('/ingredients/changes', params={'since': since}).json()
+    assert [change['ingredient_name'] for change in feed['changes']] == ['양파']
+    assert feed['changes'][0]['changes']['prot']['new'] == 9.9
+    assert feed['next_since'] == feed['last_seq']
+
+    empty = client.get('/ingredients/changes', params={'since': feed['next_since']}).json()
+    assert empty['changes'] == [] and empty['next_since'] == feed['next_since']
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from models.schemas import LiveCalculationUpdate
+from services.live_calculation import LiveCalculationError, LiveCalculationSession, diff_payload
+
+
+@pytest.fixture
+def session(nutrition_service):
+    return LiveCalculationSession(nutrition_service)
+
+
+def _run(session, **update):
+    session.apply(LiveCalculationUpdate(**update))
+    if session.needs_profile():
+        session.load_profile()
+    return session.calculate()
+
+
+def test_diff_payload():
+    previous = {'energy': 100.0, 'protein': 5.0, 'composition_details': {'감자': {'energy': 70.0, 'fat': 0.1}}, 'partial': False}
+    current = {'energy': 120.0, 'protein': 5.0, 'composition_details': {'감자': {'energy': 84.0, 'fat': 0.1}}}
+    assert diff_payload(previous, current) == {
+        'energy': 120.0, 'composition_details': {'감자': {'energy': 84.0}}, 'partial': None
+    }
+    assert diff_payload(current, current) == {}
+
+
+def test_weight_change_sends_only_changes(session, api_calls):
+    first = _run(session, food_name='감자샐러드', weight_grams=150)
+    assert first['full'] and first['seq'] == 1
+    assert first['data']['weight_grams'] == 150
+
+    calls = len(api_calls)
+    second = _run(session, weight_grams=300)
+    assert not second['full'] and second['seq'] == 2
+    assert second['data']['weight_grams'] == 300
+    assert second['data']['energy'] == pytest.approx(first['data']['energy'] * 2, abs=0.02)
+    assert 'food_name' not in second['data']
+    assert len(api_calls) == calls
+
+    assert _run(session, weight_grams=300)['data'] == {}
+
+
+def test_invalid_field_is_rejected(session):
+    with pytest.raises(LiveCalculationError):
+        session.apply(LiveCalculationUpdate(food_name='감자샐러드', fields=['unknown']))
+
+
+def test_missing_ingredient_retry_interval(session, api_calls, monkeypatch):
+    compositions = [{'ingredient_name': '감자', 'percentage': 50.0}, {'ingredient_name': '없는재료', 'percentage': 50.0}]
+    result = _run(session, food_name='감자샐러드', weight_grams=100, compositions=compositions)
+    assert result['data']['missing_ingredients'] == ['없는재료']
+
+    # 재시도 간격 전에는 입력마다 재료를 다시 조회하지 않음
+    calls = len(api_calls)
+    for weight in (110, 120, 130):
+        _run(session, weight_grams=weight)
+    assert len(api_calls) == calls
+
+    clock = session._loaded_at + session.retry_interval
+    monkeypatch.setattr('services.live_calculation.time.time', lambda: clock)
+    assert session.needs_profile()
+    _run(session, weight_grams=140)
+    assert '없는재료' in api_calls[calls:]
+
+
+def test_edited_composition_units(session, nutrition_service):
+    registered = nutrition_service.quantities.grams_per_unit('감자샐러드', 'cup')
+    _run(session, food_name='감자샐러드', quantity=1, unit='cup')
+    assert session._resolve_weight() == pytest.approx(registered)
+
+    # 편집한 구성(감자만)의 밀도로 환산
+    _run(session, compositions=[{'ingredient_name': '감자', 'percentage': 100.0}])
+    assert session._resolve_weight() == pytest.approx(200 * 0.65)
+
+    session.apply(LiveCalculationUpdate(unit='인분'))
+    with pytest.raises(LiveCalculationError):
+        session.calculate()
+
+
+def test_websocket_flow(client):
+    with client.websocket_connect('/ws/calculate') as websocket:
+        websocket.send_json({'food_name': '감자샐러드', 'weight_grams': 150})
+        first = websocket.receive_json()
+        assert first['type'] == 'result' and first['full']
+
+        websocket.send_json({'fields': ['energy', 'cholesterol']})
+        assert websocket.receive_json()['type'] == 'error'
+
+        websocket.send_json({'weight_grams': 75})
+        second = websocket.receive_json()
+        assert second['type'] == 'result' and not second['full']
+        assert second['data']['weight_grams'] == 75
+        assert second['data']['energy'] == pytest.approx(first['data']['energy'] / 2, abs=0.02)
+
+
+def test_failed_handshake_releases_session_slot(app_module):
+    class DroppedWebSocket:
+        async def accept(self):
+            raise OSError("connection reset")
+
+    before = app_module._live_sessions
+    with pytest.raises(OSError):
+        asyncio.run(app_module.live_calculation(DroppedWebSocket()))
+    assert app_module._live_sessions == before
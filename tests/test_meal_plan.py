@@ -0,0 +1,58 @@
+import pytest
+
+from models.schemas import MealEntry
+from services.meal_plan import MealPlanService
+
+
+@pytest.fixture
+def meal_plans(nutrition_service):
+    return MealPlanService(nutrition_service)
+
+
+def test_create_plan_totals_and_meals(meal_plans, nutrition_service):
+    summary = meal_plans.create_plan([
+        MealEntry(food_name='오믈렛', weight_grams=120.0, meal='아침'),
+        MealEntry(food_name='감자샐러드', weight_grams=150.0, meal='점심'),
+        MealEntry(food_name='스크램블에그', weight_grams=100.0, meal='점심')
+    ])
+
+    profile = nutrition_service.get_dish_profile('오믈렛')
+    assert summary.meals['아침']['energy'] == pytest.approx(profile.per_100g['energy'] * 1.2, abs=0.01)
+    assert summary.totals['energy'] == pytest.approx(
+        summary.meals['아침']['energy'] + summary.meals['점심']['energy'], abs=0.02
+    )
+    energy = next(item for item in summary.intake_comparison if item.nutrient == 'energy')
+    assert energy.percentage == pytest.approx(summary.totals['energy'] / 2000.0 * 100, abs=0.1)
+
+
+def test_incremental_add_and_remove(meal_plans):
+    summary = meal_plans.create_plan([MealEntry(food_name='오믈렛', weight_grams=100.0, meal='아침')])
+    plan_id = summary.plan_id
+    before = summary.totals['protein']
+
+    added = meal_plans.add_entry(plan_id, MealEntry(food_name='감자샐러드', weight_grams=200.0, meal='점심'))
+    entry_id = next(entry.entry_id for entry in added.entries if entry.food_name == '감자샐러드')
+    assert added.totals['protein'] > before
+
+    removed = meal_plans.remove_entry(plan_id, entry_id)
+    assert removed.totals['protein'] == pytest.approx(before)
+    assert '점심' not in removed.meals
+    assert meal_plans.remove_entry(plan_id, entry_id) is None
+
+
+def test_unknown_food_and_missing_weight(meal_plans):
+    with pytest.raises(ValueError):
+        meal_plans.create_plan([MealEntry(food_name='없는음식', weight_grams=100.0)])
+    with pytest.raises(ValueError):
+        meal_plans.create_plan([MealEntry(food_name='오믈렛')])
+
+
+def test_plans_are_evicted_lru(meal_plans):
+    meal_plans.max_plans = 2
+    first = meal_plans.create_plan([]).plan_id
+    second = meal_plans.create_plan([]).plan_id
+    meal_plans.get_plan(first)
+    meal_plans.create_plan([])
+
+    assert meal_plans.get_plan(first) is not None
+    assert meal_plans.get_plan(second) is None
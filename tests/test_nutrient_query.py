@@ -0,0 +1,108 @@
+import pytest
+
+from models.schemas import NutrientConstraint, NutrientQueryRequest
+from services.composition_catalog import compile_dish_record
+from services.composition_store import InMemoryCompositionStore
+from services.nutrient_query import NutrientQueryService
+from services.nutrition_service import NutritionCalculationService
+
+
+@pytest.fixture
+def query_service(nutrition_service):
+    return NutrientQueryService(nutrition_service)
+
+
+def test_weight_range_satisfies_all_constraints(query_service, nutrition_service):
+    response = query_service.query(NutrientQueryRequest(
+        constraints=[NutrientConstraint(nutrient='protein', min=10.0), NutrientConstraint(nutrient='energy', max=400.0)],
+        scope='dishes',
+        max_weight=500.0
+    ))
+
+    assert response.total_matches == len(response.matches) > 0
+    for match in response.matches:
+        per_100g = nutrition_service.get_dish_profile(match.name).per_100g
+        assert match.nutrients_at_min_weight['protein'] >= 10.0 - 0.01
+        assert per_100g['energy'] * match.max_weight / 100 <= 400.0 + 0.01
+
+
+def test_invalid_constraint(query_service):
+    with pytest.raises(ValueError):
+        query_service.query(NutrientQueryRequest(constraints=[NutrientConstraint(nutrient='unknown', min=1.0)]))
+
+
+def test_only_invalidated_dishes_are_rebuilt(query_service, nutrition_service, monkeypatch):
+    query_service.get_vectors()
+    built = []
+    build = query_service._build_vectors
+    monkeypatch.setattr(query_service, '_build_vectors', lambda names, *args: build(built.extend(names) or names, *args))
+
+    assert query_service.get_vectors() is query_service.get_vectors()
+    assert built == []
+
+    nutrition_service.invalidate_ingredient('당근')
+    query_service.get_vectors()
+    assert set(built) == nutrition_service.dish_graph.dishes_using_ingredient('당근')
+
+
+def test_incomplete_dishes_wait_for_retry_interval(nutrition_service, mock_items, api_calls, monkeypatch):
+    del mock_items['마요네즈']
+    query_service = NutrientQueryService(nutrition_service)
+    query_service.get_vectors()
+    incomplete = set(query_service._incomplete)
+    assert incomplete == nutrition_service.dish_graph.dishes_using_ingredient('마요네즈')
+
+    # 재시도 간격 내에는 업스트림을 다시 조회하지 않음
+    calls = len(api_calls)
+    query_service.get_vectors()
+    query_service.get_vectors()
+    assert len(api_calls) == calls
+
+    # 간격이 지나면 누락 재료가 있던 음식만 다시 계산
+    query_service.retry_interval = 0
+    built = []
+    build = query_service._build_vectors
+    monkeypatch.setattr(query_service, '_build_vectors', lambda names, *args: build(built.extend(names) or names, *args))
+    query_service.get_vectors()
+    assert set(built) == incomplete
+    assert set(api_calls[calls:]) == {'마요네즈'}
+
+
+def test_incomplete_dishes_are_not_candidates(nutrition_service, mock_items):
+    mayonnaise = mock_items.pop('마요네즈')
+    query_service = NutrientQueryService(nutrition_service)
+    request = NutrientQueryRequest(constraints=[NutrientConstraint(nutrient='fat', max=5.0)], scope='dishes')
+
+    # 마요네즈가 빠진 음식은 지방이 실제보다 작게 계산되므로 조건과 관계없이 제외
+    names = {match.name for match in query_service.query(request).matches}
+    assert not names & nutrition_service.dish_graph.dishes_using_ingredient('마요네즈')
+    assert '감자샐러드' not in {vector.name for vector in query_service.iter_dish_vectors()}
+    assert '마요네즈' not in {vector.name for vector in query_service.get_vectors()}
+    assert '감자' in {vector.name for vector in query_service.get_vectors() if vector.kind == 'ingredient'}
+
+    # 재조회에 성공하면 후보에 포함
+    mock_items['마요네즈'] = mayonnaise
+    query_service.retry_interval = 0
+    assert '감자샐러드' in {vector.name for vector in query_service.iter_dish_vectors()}
+    assert query_service._incomplete == set()
+
+
+def test_unused_ingredient_vectors_are_dropped(tmp_path, monkeypatch):
+    monkeypatch.setenv('INGREDIENT_VERSIONS_DB', str(tmp_path / 'ingredient_versions.db'))
+    store = InMemoryCompositionStore({
+        name: compile_dish_record(name, {'compositions': [
+            {'ingredient_name': ingredient, 'percentage': 90.0}, {'ingredient_name': '식용유', 'percentage': 10.0}
+        ]})
+        for name, ingredient in (('당근볶음', '당근'), ('감자볶음', '감자'))
+    })
+    service = NutritionCalculationService(use_mock=True, composition_store=store)
+    try:
+        query_service = NutrientQueryService(service)
+        query_service.get_vectors()
+        assert {'당근', '감자', '식용유'} <= set(query_service._ingredients)
+
+        service.update_food_composition('당근볶음', {'compositions': [{'ingredient_name': '감자', 'percentage': 100.0}]})
+        query_service.get_vectors()
+        assert set(query_service._ingredients) == {'감자', '식용유'}
+    finally:
+        service.ingredient_versions.close()
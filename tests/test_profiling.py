@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from utils import profiling as profiling_module
+from utils.profiling import ProfilingSettings, StackSampler
+
+
+@pytest.fixture
+def settings(monkeypatch, tmp_path):
+    monkeypatch.setenv('PROFILING_ENABLED', 'true')
+    monkeypatch.setenv('PROFILING_TOKEN', 'secret')
+    monkeypatch.setenv('PROFILE_DIR', str(tmp_path))
+    return ProfilingSettings()
+
+
+def test_token_check(settings):
+    assert settings.is_authorized('secret')
+    assert not settings.is_authorized('wrong')
+    assert not settings.is_authorized(None)
+    # 비ASCII 토큰은 예외 없이 거부
+    assert not settings.is_authorized('비밀')
+
+
+def test_disabled_or_missing_token_rejects(monkeypatch):
+    monkeypatch.setenv('PROFILING_ENABLED', 'true')
+    monkeypatch.setenv('PROFILING_TOKEN', '')
+    assert not ProfilingSettings().is_authorized('')
+    monkeypatch.setenv('PROFILING_ENABLED', 'false')
+    monkeypatch.setenv('PROFILING_TOKEN', 'secret')
+    assert not ProfilingSettings().is_authorized('secret')
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_sampler_collects_collapsed_stacks():
+    import threading
+    sampler = StackSampler(thread_ids=[threading.get_ident()], interval=0.001)
+    sampler.start()
+    _busy(0.05)
+    sampler.stop()
+
+    assert sampler.sample_count > 0
+    lines = sampler.collapsed().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(' ', 1)
+    assert '_busy' in stack
+    assert int(count) > 0
+
+
+def test_stored_profile_round_trip(settings):
+    sampler = StackSampler(interval=0.001)
+    sampler.stacks['a;b'] = 3
+    profile_id = settings.save(sampler, 'GET /foods')
+    assert settings.load(profile_id).startswith('a;b 3')
+
+
+def test_debug_endpoint_rejects_non_ascii_token(client, monkeypatch):
+    monkeypatch.setattr(profiling_module.profiling, 'enabled', True)
+    monkeypatch.setattr(profiling_module.profiling, 'token', 'secret')
+    response = client.get('/debug/profiles/unknown', headers={'X-Profile-Token': '비밀'.encode('utf-8')})
+    assert response.status_code == 403
+    response = client.get('/debug/profiles/unknown', headers={'X-Profile-Token': 'secret'})
+    assert response.status_code == 404
@@ -0,0 +1,88 @@
+import pytest
+
+from services.composition_catalog import compile_dish_record
+from services.composition_store import InMemoryCompositionStore
+from services.dish_graph import DishGraph
+from services.quantity import QuantityError, QuantityService
+
+
+def _record(food_name, compositions, serving_weight=None):
+    return compile_dish_record(food_name, {
+        'base_weight': 100,
+        'serving_weight': serving_weight,
+        'compositions': [
+            {'ingredient_name': name, 'percentage': percentage, 'is_dish': False}
+            for name, percentage in compositions
+        ]
+    })
+
+
+@pytest.fixture
+def quantities():
+    store = InMemoryCompositionStore({
+        '감자볶음': _record('감자볶음', [('감자', 90.0), ('식용유', 10.0)], serving_weight=120),
+        '드레싱': _record('드레싱', [('마요네즈', 50.0), ('식초', 50.0)])
+    })
+    return QuantityService(DishGraph(store))
+
+
+def test_unit_aliases(quantities):
+    assert quantities.unit('큰술') == quantities.unit('TBSP')
+    assert quantities.grams_per_unit('드레싱', 'kg') == 1000.0
+    with pytest.raises(QuantityError):
+        quantities.unit('bushel')
+
+
+def test_volume_uses_ingredient_densities(quantities):
+    dish = quantities.dish_units('감자볶음')
+    # 재료별 부피(중량 / 밀도)의 합으로 음식 밀도 계산
+    assert dish.grams_per_ml == pytest.approx(1.0 / (0.9 / 0.65 + 0.1 / 0.92))
+    assert not dish.estimated_density
+    assert quantities.to_grams('감자볶음', 1, 'cup') == pytest.approx(200 * dish.grams_per_ml)
+
+    # 밀도 정보가 없는 재료(식초)는 1.0으로 추정
+    assert quantities.dish_units('드레싱').estimated_density
+
+
+def test_piece_and_serving(quantities):
+    # 음식 중량의 90%인 감자 1개(150g)가 들어가는 양
+    assert quantities.grams_per_unit('감자볶음', '개') == pytest.approx(150 / 0.9)
+    assert quantities.grams_per_unit('감자볶음', '인분') == 120
+    assert quantities.grams_per_unit('드레싱', 'serving') == 100
+    with pytest.raises(QuantityError):
+        quantities.grams_per_unit('드레싱', 'piece')
+    with pytest.raises(QuantityError):
+        quantities.grams_per_unit('없는음식', 'ml')
+
+
+def test_factors_rebuilt_only_on_change(quantities):
+    dish = quantities.dish_units('감자볶음')
+    assert quantities.dish_units('감자볶음') is dish
+
+    quantities.dish_graph.update_dish('감자볶음', _record('감자볶음', [('감자', 50.0), ('식용유', 50.0)]))
+    changed = quantities.dish_units('감자볶음')
+    assert changed is not dish
+    assert changed.grams_per_ml == pytest.approx(1.0 / (0.5 / 0.65 + 0.5 / 0.92))
+
+
+def test_resolve_many(quantities):
+    grams = quantities.resolve_many([('감자볶음', 2, '인분'), ('드레싱', 30, 'g'), ('감자볶음', 1, 'serving')])
+    assert grams == pytest.approx([240, 30, 120])
+
+
+def test_calculate_with_unit(client):
+    by_weight = client.post('/calculate-nutrition', json={'food_name': '감자샐러드', 'weight_grams': 150}).json()['data']
+    by_serving = client.post('/calculate-nutrition', json={'food_name': '감자샐러드', 'quantity': 1, 'unit': '인분'}).json()['data']
+    assert by_serving['weight_grams'] == 150
+    assert (by_serving['quantity'], by_serving['unit']) == (1, '인분')
+    assert by_serving['energy'] == by_weight['energy']
+
+    by_piece = client.get('/calculate-nutrition/계란프라이/2', params={'unit': '개'}).json()['data']
+    assert by_piece['weight_grams'] == pytest.approx(2 * 50 / 0.9, abs=0.01)
+
+
+def test_invalid_quantity_requests(client):
+    both = client.post('/calculate-nutrition', json={'food_name': '감자샐러드', 'weight_grams': 100, 'quantity': 1})
+    assert both.status_code == 400
+    unknown = client.get('/calculate-nutrition/감자샐러드/1', params={'unit': 'bushel'})
+    assert unknown.status_code == 400
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from models.schemas import RecipeOptimizationRequest
+from services.recipe_optimizer import RecipeOptimizer, project_capped_simplex
+
+
+def _brute_force_projection(point, lower, upper):
+    """이분 탐색으로 구한 기준 사영 (sum(clip(p - tau)) = 1)"""
+    low, high = min(p - u for p, u in zip(point, upper)), max(p - l for p, l in zip(point, lower))
+    for _ in range(200):
+        tau = (low + high) / 2
+        total = sum(min(max(p - tau, l), u) for p, l, u in zip(point, lower, upper))
+        low, high = (tau, high) if total > 1 else (low, tau)
+    return [min(max(p - tau, l), u) for p, l, u in zip(point, lower, upper)]
+
+
+def test_projection_onto_simplex():
+    assert project_capped_simplex([0.5, 0.5], [0, 0], [1, 1]) == pytest.approx([0.5, 0.5])
+    assert project_capped_simplex([2.0, 0.0, 0.0], [0, 0, 0], [1, 1, 1]) == pytest.approx([1.0, 0.0, 0.0])
+    assert project_capped_simplex([1.0, 1.0, 1.0], [0, 0, 0], [1, 1, 1]) == pytest.approx([1 / 3] * 3)
+
+
+def test_projection_respects_caps():
+    result = project_capped_simplex([0.9, 0.1, 0.0], [0.0, 0.0, 0.2], [0.5, 1.0, 1.0])
+    assert sum(result) == pytest.approx(1.0)
+    assert result[0] == pytest.approx(0.5)
+    assert result[2] >= 0.2 - 1e-12
+
+
+def test_projection_matches_bisection():
+    rng = random.Random(7)
+    for _ in range(200):
+        n = rng.randint(2, 8)
+        point = [rng.uniform(-1, 2) for _ in range(n)]
+        lower = [rng.uniform(0, 0.5 / n) for _ in range(n)]
+        upper = [max(lo, rng.uniform(1.5 / n, 1.0)) for lo in lower]
+        result = project_capped_simplex(point, lower, upper)
+        assert sum(result) == pytest.approx(1.0)
+        assert result == pytest.approx(_brute_force_projection(point, lower, upper), abs=1e-9)
+
+
+def test_optimize_reaches_target(nutrition_service):
+    optimizer = RecipeOptimizer(nutrition_service)
+    response = optimizer.optimize('감자샐러드', RecipeOptimizationRequest(targets={'fat': 10.0}, max_change=30.0))
+
+    assert response.achieved['fat'] == pytest.approx(10.0, abs=0.5)
+    assert sum(comp.percentage for comp in response.compositions) == pytest.approx(100.0, abs=0.05)
+
+
+@pytest.mark.parametrize('body', [
+    {'targets': {'energy': 100}, 'weights': {'energy': -1}},
+    {'targets': {'energy': 100}, 'weights': {'energy': 0}},
+    {'targets': {'energy': 100}, 'min_percentage': {'감자': -5}},
+    {'targets': {'energy': 100}, 'max_percentage': {'감자': 120}},
+    {'targets': {'energy': 100}, 'min_percentage': {'감자': 60}, 'max_percentage': {'감자': 50}}
+])
+def test_invalid_request_is_rejected(client, body):
+    response = client.post('/foods/감자샐러드/optimize', json=body)
+    assert response.status_code == 422
@@ -0,0 +1,49 @@
+import pytest
+
+from api import mock_data
+from models.records import DEFAULT_NUTRIENTS, NUTRIENT_KEYS, NUTRIENT_REGISTRY, IngredientNutrients, _enabled_nutrients
+from models.schemas import NutritionInfo
+
+
+def test_record_matches_response_model():
+    item = mock_data.MOCK_NUTRITION_DATA['감자']
+    record = IngredientNutrients.from_api_item(item)
+    info = NutritionInfo(**item)
+
+    assert record.food_code == info.food_code
+    assert record.as_dict() == pytest.approx({key: getattr(info, key) or 0.0 for key in NUTRIENT_KEYS})
+    assert record.values() == tuple(record.as_dict().values())
+
+
+def test_missing_and_invalid_values_are_zero():
+    record = IngredientNutrients.from_api_item({'foodCd': 'X', 'foodNm': '테스트', 'enerc': '', 'prot': 'N/A', 'refuse': '12'})
+    assert record.energy == 0.0
+    assert record.protein == 0.0
+    assert record.refuse_rate == 12.0
+
+
+def test_record_is_slotted():
+    record = IngredientNutrients.from_api_item(mock_data.MOCK_NUTRITION_DATA['계란'])
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.unknown_field = 1.0
+
+
+def test_default_nutrients(monkeypatch):
+    monkeypatch.delenv('NUTRIENTS', raising=False)
+    assert _enabled_nutrients() == DEFAULT_NUTRIENTS
+    assert NUTRIENT_KEYS == DEFAULT_NUTRIENTS
+    assert 'cholesterol' not in NUTRIENT_KEYS
+
+
+def test_configured_nutrients_keep_registry_order(monkeypatch):
+    monkeypatch.setenv('NUTRIENTS', 'cholesterol, energy,unknown')
+    assert _enabled_nutrients() == ('energy', 'cholesterol')
+    monkeypatch.setenv('NUTRIENTS', 'all')
+    assert _enabled_nutrients() == tuple(NUTRIENT_REGISTRY)
+
+
+def test_disabled_nutrient_field_is_rejected(client):
+    response = client.get('/calculate-nutrition/감자샐러드/150', params={'fields': 'energy,cholesterol'})
+    assert response.status_code == 400
+    assert 'cholesterol' in response.json()['detail']
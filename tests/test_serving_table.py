@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from models.schemas import NutritionCalculationRequest
+from services.serving_table import ServingTableService
+
+
+@pytest.fixture
+def table(nutrition_service):
+    return ServingTableService(nutrition_service)
+
+
+def test_bulk_table_lists_standard_servings(table, nutrition_service):
+    version, body = table.get_bulk()
+    payload = json.loads(body)
+    assert payload['labels'] == ['100g', 'serving', '150g', '200g']
+    assert [food['food_name'] for food in payload['foods']] == sorted(nutrition_service.get_available_foods())
+
+    row = payload['foods'][0]
+    per_100g = nutrition_service.get_dish_profile(row['food_name']).per_100g
+    assert row['servings'][2]['nutrients']['energy'] == pytest.approx(per_100g['energy'] * 1.5, abs=0.1)
+    assert table.get_bulk() == (version, body)
+
+
+def test_only_invalidated_rows_are_rebuilt(table, nutrition_service):
+    table.refresh()
+    assert table.refresh() == 0
+
+    affected = nutrition_service.invalidate_ingredient('당근')
+    version = table.table_version
+    assert table.refresh() == len(affected & set(nutrition_service.get_available_foods()))
+    assert table.table_version == version + 1
+
+
+def test_lookup_reuses_table_result(table, nutrition_service):
+    request = NutritionCalculationRequest(food_name='감자샐러드', weight_grams=150)
+    calculated = nutrition_service.calculate_nutrition(request)
+    table.refresh()
+
+    looked_up = table.lookup('감자샐러드', 150.0)
+    assert looked_up is table.lookup('감자샐러드', 150.0)
+    assert looked_up.energy == pytest.approx(calculated.energy)
+    assert table.lookup('감자샐러드', 123.0) is None
+
+
+def _bulk_row(table, food_name):
+    _, body = table.get_bulk()
+    return next(food for food in json.loads(body)['foods'] if food['food_name'] == food_name)
+
+
+def test_incomplete_table_retries_after_interval(table, mock_items, monkeypatch):
+    egg = mock_items.pop('계란')
+    assert not _bulk_row(table, '오믈렛')['complete']
+
+    # 재시도 간격 전에는 일괄 표를 다시 계산하지 않음
+    mock_items['계란'] = egg
+    assert table.refresh() == 0
+    assert not _bulk_row(table, '오믈렛')['complete']
+
+    monkeypatch.setattr(table, 'retry_interval', 0.0)
+    assert _bulk_row(table, '오믈렛')['complete']
+    # 완전한 표는 프로필이 바뀌기 전까지 다시 계산하지 않음
+    assert table.refresh() == 0
+
+
+def test_servings_endpoint_etag(client):
+    response = client.get('/servings')
+    assert response.status_code == 200
+    etag = response.headers['etag']
+    assert client.get('/servings', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/servings/없는음식').status_code == 404
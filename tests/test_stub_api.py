@@ -0,0 +1,66 @@
+import time
+
+import pytest
+import requests
+
+from api.mock_data import MOCK_NUTRITION_DATA
+from api.nutrition_client import NutritionAPIClient
+from tools.stub_nutrition_api import FixtureCatalog
+
+
+def test_catalog_search():
+    catalog = FixtureCatalog({'감자': [{'foodCd': 'A1', 'foodNm': '감자'}, {'foodCd': 'A2', 'foodNm': '감자전분'}]})
+    assert len(catalog.search('감자', None)) == 2
+    assert catalog.search('전분', None) == [{'foodCd': 'A2', 'foodNm': '감자전분'}]
+    assert catalog.search(None, 'A1') == [{'foodCd': 'A1', 'foodNm': '감자'}]
+    assert len(catalog.search(None, None)) == 2
+
+
+def test_client_searches_through_stub(stub_api):
+    client = NutritionAPIClient(use_mock=False)
+    items = client.extract_nutrition_data(client.search_food_by_name('감자'))
+    assert items and all('감자' in item['foodNm'] for item in items)
+
+    food_code = items[0]['foodCd']
+    assert client.extract_nutrition_data(client.search_food_by_code(food_code))[0]['foodCd'] == food_code
+
+    # 조회 결과 없음(03)은 에러가 아닌 빈 결과
+    assert client.extract_nutrition_data(client.search_food_by_name('없는재료')) == []
+    assert stub_api.stats['no_data'] == 1
+
+
+def test_list_paging(stub_api):
+    client = NutritionAPIClient(use_mock=False)
+    first = client.get_food_list(page_no=1, num_rows=2)
+    assert len(client.extract_nutrition_data(first)) == 2
+    assert first['response']['body']['totalCount'] == len(MOCK_NUTRITION_DATA)
+
+    last_page = (len(MOCK_NUTRITION_DATA) + 1) // 2
+    assert client.extract_nutrition_data(client.get_food_list(page_no=last_page + 1, num_rows=2)) == []
+
+
+def test_injected_failures(stub_api):
+    client = NutritionAPIClient(use_mock=False)
+
+    stub_api.update({'error_rate': 1.0})
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.search_food_by_name('감자')
+
+    stub_api.update({'error_rate': 0.0, 'result_code_rate': 1.0})
+    with pytest.raises(Exception, match='LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR'):
+        client.search_food_by_name('감자')
+    assert stub_api.stats == {'requests': 2, 'http_errors': 1, 'injected_result_codes': 1, 'no_data': 0}
+
+
+def test_injected_latency(stub_api):
+    stub_api.update({'latency_ms': 100})
+    client = NutritionAPIClient(use_mock=False)
+    started = time.perf_counter()
+    client.search_food_by_name('감자')
+    assert time.perf_counter() - started >= 0.1
+
+
+def test_wrong_service_key(stub_api, monkeypatch):
+    monkeypatch.setenv('SERVICE_KEY', 'wrong')
+    with pytest.raises(Exception, match='SERVICE_KEY_IS_NOT_REGISTERED_ERROR'):
+        NutritionAPIClient(use_mock=False).search_food_by_name('감자')
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from utils.tracing import NOOP_SPAN, Tracer
+
+
+@pytest.fixture
+def file_tracer(tmp_path, monkeypatch):
+    trace_file = tmp_path / 'traces.jsonl'
+    monkeypatch.setenv('TRACING_ENABLED', 'true')
+    monkeypatch.setenv('TRACE_EXPORTER', 'file')
+    monkeypatch.setenv('TRACE_FILE', str(trace_file))
+    monkeypatch.setenv('TRACE_SAMPLE_RATIO', '1.0')
+    return Tracer(), trace_file
+
+
+def _read_spans(trace_file):
+    return [json.loads(line) for line in trace_file.read_text(encoding='utf-8').splitlines()]
+
+
+def test_disabled_tracer_yields_noop(monkeypatch):
+    monkeypatch.setenv('TRACING_ENABLED', 'false')
+    with Tracer().start_span('noop') as span:
+        assert span is NOOP_SPAN
+
+
+def test_child_spans_share_trace(file_tracer):
+    tracer, trace_file = file_tracer
+    with tracer.start_span('parent', {'food.name': '감자샐러드'}):
+        with tracer.start_span('child') as child:
+            child.set_attribute('cache.outcome', 'hit')
+
+    child, parent = _read_spans(trace_file)
+    assert child['context']['trace_id'] == parent['context']['trace_id']
+    assert child['parent_id'] == parent['context']['span_id']
+    assert parent['parent_id'] is None
+    assert parent['attributes'] == {'food.name': '감자샐러드'}
+    assert child['attributes'] == {'cache.outcome': 'hit'}
+
+
+def test_exception_is_recorded(file_tracer):
+    tracer, trace_file = file_tracer
+    with pytest.raises(RuntimeError):
+        with tracer.start_span('failing'):
+            raise RuntimeError('boom')
+
+    span, = _read_spans(trace_file)
+    assert span['status'] == {'status_code': 'ERROR', 'description': 'boom'}
+    assert span['events'][0]['attributes']['exception.type'] == 'RuntimeError'
+
+
+def test_unsampled_trace_skips_children(file_tracer):
+    tracer, trace_file = file_tracer
+    tracer.sample_ratio = 0.0
+    with tracer.start_span('root'):
+        with tracer.start_span('child') as child:
+            assert child is NOOP_SPAN
+    assert not trace_file.exists()
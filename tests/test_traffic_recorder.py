@@ -0,0 +1,84 @@
+import gzip
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tools.replay_traffic import percentile, read_jsonl, summarize
+from utils.traffic_recorder import TrafficRecorder, TrafficRecordingMiddleware, anonymise_query
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = TrafficRecorder(str(tmp_path / 'traffic.jsonl.gz'), flush_interval=0.05)
+    yield recorder
+    recorder.close()
+
+
+def _wait_for(path, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            entries = list(read_jsonl(path))
+        except FileNotFoundError:
+            entries = []
+        if len(entries) >= count:
+            return entries
+        time.sleep(0.02)
+    raise AssertionError(f"{count}건이 기록되지 않았습니다")
+
+
+def test_anonymise_query():
+    assert anonymise_query('serviceKey=abc&foodNm=%EA%B0%90%EC%9E%90') == 'serviceKey=&foodNm=%EA%B0%90%EC%9E%90'
+    assert anonymise_query('') == ''
+
+
+def test_records_are_readable_before_close(recorder):
+    for index in range(3):
+        recorder.record({'i': index})
+    # 종료 전에도 완결된 gzip 멤버로 기록되어 읽을 수 있음
+    assert _wait_for(recorder.path, 3) == [{'i': 0}, {'i': 1}, {'i': 2}]
+
+
+def test_truncated_tail_is_skipped(recorder):
+    recorder.record({'i': 0})
+    _wait_for(recorder.path, 1)
+    recorder.close()
+
+    # 비정상 종료로 마지막 멤버가 일부만 기록된 상황
+    with open(recorder.path, 'ab') as f:
+        f.write(gzip.compress(b'{"i":1}\n{"i":2}\n')[:12])
+    assert list(read_jsonl(recorder.path)) == [{'i': 0}]
+
+
+def test_middleware_records_requests(recorder):
+    app = FastAPI()
+    app.add_middleware(TrafficRecordingMiddleware, recorder=recorder)
+
+    @app.post('/items/{name}')
+    def create(name: str, payload: dict):
+        return {'name': name}
+
+    client = TestClient(app)
+    client.post('/items/감자?token=secret', json={'weight': 100})
+    client.get('/health')
+
+    entry, = _wait_for(recorder.path, 1)
+    assert entry['m'] == 'POST'
+    assert entry['r'] == '/items/{name}'
+    assert entry['q'] == 'token='
+    assert entry['b'] == {'weight': 100}
+    assert entry['s'] == 200
+
+
+def test_summarize_by_route():
+    results = [
+        {'m': 'GET', 'r': '/foods', 'p': '/foods', 'latency_ms': float(ms), 'error': None, 'status': 200}
+        for ms in (10, 20, 30)
+    ] + [{'m': 'GET', 'r': None, 'p': '/x', 'latency_ms': None, 'error': 'ConnectionError', 'status': None}]
+    summary = summarize(results)
+    assert summary['GET /foods']['p50'] == 20.0
+    assert summary['GET /x']['error_rate'] == 1.0
+    assert summary['*']['count'] == 4
+    assert percentile([1.0, 2.0], 50) == 1.5
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+음식 구성요소 가져오기 도구
+JSON 파일(또는 팀별 JSON 파일이 모인 디렉터리)을 검증한 뒤 SQLite 구성요소 저장소에 기록합니다.
+
+사용 예:
+    python tools/import_compositions.py data/food_compositions.json
+    python tools/import_compositions.py compositions/ --db data/food_compositions.db --replace
+"""
+
+import sys
+import os
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Any, List
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.composition_catalog import compile_dish_records
+from services.composition_store import (
+    DEFAULT_COMPOSITIONS_DB,
+    InMemoryCompositionStore,
+    SqliteCompositionStore
+)
+from services.dish_graph import DishGraph
+
+
+def collect_input_files(paths: List[str]) -> List[Path]:
+    """입력 경로에서 JSON 파일 목록 수집 (디렉터리는 *.json을 이름순으로)"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob('*.json')))
+        else:
+            files.append(path)
+    return files
+
+
+def load_compositions(files: List[Path]) -> Dict[str, Any]:
+    """JSON 파일들을 하나의 {음식명: 구성요소} 사전으로 병합 (중복 음식명은 에러)"""
+    merged: Dict[str, Any] = {}
+    origins: Dict[str, Path] = {}
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for food_name, composition in data.items():
+            if food_name in merged:
+                raise ValueError(f"'{food_name}'이(가) {origins[food_name]}와 {path}에 중복 정의되어 있습니다.")
+            merged[food_name] = composition
+            origins[food_name] = path
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음식 구성요소를 SQLite 저장소로 가져오기")
+    parser.add_argument('inputs', nargs='+', help="JSON 파일 또는 JSON 파일 디렉터리")
+    parser.add_argument('--db', default=str(DEFAULT_COMPOSITIONS_DB), help="SQLite 저장소 경로")
+    parser.add_argument('--replace', action='store_true', help="입력에 없는 기존 음식 삭제")
+    parser.add_argument('--skip-invalid', action='store_true', help="검증 실패 음식만 제외하고 나머지 기록")
+    args = parser.parse_args()
+
+    try:
+        raw = load_compositions(collect_input_files(args.inputs))
+    except (OSError, ValueError) as e:
+        print(f"❌ 입력 파일 로드 실패: {e}")
+        sys.exit(1)
+
+    records, errors = compile_dish_records(raw)
+    store = SqliteCompositionStore(args.db)
+
+    # 입력에 없는 하위 음식은 기존 저장소에서 가져와 참조 구조를 함께 검증
+    memory = InMemoryCompositionStore(records)
+    pending = [
+        comp.ingredient_name
+        for record in records.values()
+        for comp in record.compositions
+        if comp.is_dish
+    ]
+    while pending:
+        food_name = pending.pop()
+        if memory.contains(food_name):
+            continue
+        existing = None if args.replace else store.get(food_name)
+        if existing is None:
+            continue
+        memory.put(existing)
+        pending.extend(comp.ingredient_name for comp in existing.compositions if comp.is_dish)
+
+    for food_name, error in DishGraph(memory).validate().items():
+        if food_name in records:
+            errors[food_name] = error
+            records.pop(food_name)
+
+    for food_name, error in sorted(errors.items()):
+        print(f"❌ {food_name}: {error}")
+
+    if errors and not args.skip_invalid:
+        print(f"검증 실패 {len(errors)}건으로 가져오기를 중단합니다. (--skip-invalid로 제외 후 진행)")
+        sys.exit(1)
+
+    removed = 0
+    if args.replace:
+        for food_name in list(store.iter_names()):
+            if food_name not in records:
+                store.remove(food_name)
+                removed += 1
+
+    for record in records.values():
+        store.put(record)
+
+    print(f"✅ {len(records)}개 음식 기록, {removed}개 삭제, {len(errors)}개 제외 → {args.db}")
+    print(f"   저장소 전체 음식 수: {store.count()}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+트래픽 재생 및 비교 도구
+TRAFFIC_RECORD_ENABLED=true로 기록한 요청 스트림을 대상 서버에 원래 속도 또는 배속으로
+재생하고, 두 재생 결과의 라우트별 지연 시간/에러율 차이를 비교합니다.
+
+사용 예:
+    # 기록 속도 그대로 재생 (--speed 2 = 2배속, --speed 0 = 대기 없이 최대한 빠르게)
+    python tools/replay_traffic.py replay traffic.jsonl.gz --target http://localhost:8000 --out before.jsonl
+
+    # 변경 후 빌드로 다시 재생하고 비교
+    python tools/replay_traffic.py replay traffic.jsonl.gz --target http://localhost:8000 --out after.jsonl
+    python tools/replay_traffic.py compare before.jsonl after.jsonl
+"""
+
+import gzip
+import json
+import time
+import argparse
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
+
+import requests
+
+
+def open_text(path: str, mode: str = 'rt'):
+    """.gz 확장자면 gzip으로 열기"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """JSON Lines 읽기 (비정상 종료로 마지막 gzip 멤버가 잘린 경우 그 앞까지만 읽음)"""
+    with open_text(path) as f:
+        try:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile):
+            print(f"⚠️  {path}: 파일 끝이 잘려 있어 마지막 기록 묶음을 건너뜁니다.")
+
+
+def percentile(values: List[float], p: float) -> float:
+    """선형 보간 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """라우트별 요청 수, 에러율, 지연 시간 백분위수 (전체는 '*')"""
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for result in results:
+        groups[f"{result['m']} {result['r'] or result['p']}"].append(result)
+        groups['*'].append(result)
+
+    summary = {}
+    for route, items in groups.items():
+        latencies = [item['latency_ms'] for item in items if item['latency_ms'] is not None]
+        errors = sum(1 for item in items if item['error'] or (item['status'] or 0) >= 500)
+        summary[route] = {
+            'count': len(items),
+            'error_rate': errors / len(items),
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies) if latencies else 0.0
+        }
+    return summary
+
+
+def print_summary(summary: Dict[str, Dict[str, float]]):
+    print(f"{'라우트':48s} {'요청':>6s} {'에러율':>7s} {'p50':>8s} {'p95':>8s} {'p99':>8s}")
+    for route in sorted(summary, key=lambda key: (key != '*', key)):
+        s = summary[route]
+        print(
+            f"{route[:48]:48s} {s['count']:6d} {s['error_rate'] * 100:6.1f}% "
+            f"{s['p50']:8.2f} {s['p95']:8.2f} {s['p99']:8.2f}"
+        )
+
+
+def replay(args: argparse.Namespace):
+    """기록된 요청을 도착 시각 간격에 맞춰 재생"""
+    entries = list(read_jsonl(args.log))
+    if args.limit:
+        entries = entries[:args.limit]
+    if not entries:
+        print("재생할 요청이 없습니다.")
+        return
+
+    local = threading.local()
+
+    def session() -> requests.Session:
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        return local.session
+
+    def send(index: int, entry: Dict[str, Any]) -> Dict[str, Any]:
+        url = args.target.rstrip('/') + entry['p'] + (f"?{entry['q']}" if entry.get('q') else '')
+        result = {
+            'i': index, 'm': entry['m'], 'p': entry['p'], 'r': entry.get('r'),
+            'status': None, 'latency_ms': None, 'error': None,
+            'recorded_status': entry.get('s'), 'recorded_ms': entry.get('d')
+        }
+        start = time.perf_counter()
+        try:
+            response = session().request(
+                entry['m'], url,
+                json=entry['b'] if entry.get('b') is not None else None,
+                timeout=args.timeout
+            )
+            result['status'] = response.status_code
+        except requests.RequestException as e:
+            result['error'] = type(e).__name__
+        result['latency_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        return result
+
+    first_t = entries[0]['t']
+    started = time.perf_counter()
+    futures = []
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for index, entry in enumerate(entries):
+            if args.speed > 0:
+                due = (entry['t'] - first_t) / args.speed
+                wait = due - (time.perf_counter() - started)
+                if wait > 0:
+                    time.sleep(wait)
+            futures.append(executor.submit(send, index, entry))
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+
+    if args.out:
+        with open_text(args.out, 'wt') as f:
+            for result in results:
+                f.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+    mismatched = sum(1 for result in results if result['status'] != result['recorded_status'])
+    print(f"재생 완료: {len(results)}건, {elapsed:.1f}초 ({len(results) / max(elapsed, 1e-9):.1f} req/s), "
+          f"기록과 상태 코드가 다른 요청 {mismatched}건")
+    print_summary(summarize(results))
+
+
+def compare(args: argparse.Namespace):
+    """두 재생 결과의 라우트별 지연 시간/에러율 비교 (B - A)"""
+    before = summarize(list(read_jsonl(args.before)))
+    after = summarize(list(read_jsonl(args.after)))
+
+    print(f"{'라우트':48s} {'p50 (A→B)':>20s} {'p95 (A→B)':>20s} {'p99 변화':>9s} {'에러율 변화':>10s}")
+    for route in sorted(set(before) | set(after), key=lambda key: (key != '*', key)):
+        a, b = before.get(route), after.get(route)
+        if a is None or b is None:
+            print(f"{route[:48]:48s} {'(한쪽에만 존재)':>20s}")
+            continue
+
+        def change(key: str) -> str:
+            if a[key] == 0:
+                return '   n/a'
+            return f"{(b[key] - a[key]) / a[key] * 100:+6.1f}%"
+
+        print(
+            f"{route[:48]:48s} {a['p50']:8.2f}→{b['p50']:8.2f}ms {a['p95']:8.2f}→{b['p95']:8.2f}ms "
+            f"{change('p99'):>9s} {(b['error_rate'] - a['error_rate']) * 100:+9.1f}%p"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 트래픽 재생 및 비교")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    replay_parser = commands.add_parser('replay', help="기록된 요청 재생")
+    replay_parser.add_argument('log', help="기록 파일 (TRAFFIC_RECORD_FILE)")
+    replay_parser.add_argument('--target', default='http://localhost:8000', help="대상 서버 주소")
+    replay_parser.add_argument('--speed', type=float, default=1.0, help="재생 배속 (0이면 대기 없이 재생)")
+    replay_parser.add_argument('--concurrency', type=int, default=16, help="최대 동시 요청 수")
+    replay_parser.add_argument('--timeout', type=float, default=30.0, help="요청 타임아웃(초)")
+    replay_parser.add_argument('--limit', type=int, help="재생할 최대 요청 수")
+    replay_parser.add_argument('--out', help="재생 결과 파일 (비교용)")
+
+    compare_parser = commands.add_parser('compare', help="두 재생 결과 비교")
+    compare_parser.add_argument('before', help="기준 재생 결과 (A)")
+    compare_parser.add_argument('after', help="비교 재생 결과 (B)")
+
+    args = parser.parse_args()
+    if args.command == 'replay':
+        replay(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
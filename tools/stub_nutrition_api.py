@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+공공데이터포털 통합식품영양성분 API 로컬 대역 서버
+기록된 응답(fixture)을 실제 API와 같은 JSON 형식으로 재생하며, foodNm / foodCd 검색과
+pageNo / numOfRows 페이지 처리, 지연·HTTP 에러·resultCode 주입을 지원합니다.
+USE_MOCK_DATA와 달리 실제 HTTP 클라이언트 경로(연결, 타임아웃, 에러 처리)를 그대로 사용합니다.
+
+사용 예:
+    # 서버 실행 (fixture 미지정 시 api/mock_data.py 데이터 사용)
+    python tools/stub_nutrition_api.py serve --port 8081 --latency-ms 80 --jitter-ms 40 --error-rate 0.02
+
+    # 클라이언트 연결
+    USE_MOCK_DATA=false SERVICE_KEY=stub \\
+    API_BASE_URL=http://127.0.0.1:8081/openapi/tn_pubr_public_nutri_material_info_api python main.py
+
+    # 실제 API 응답 기록 (SERVICE_KEY 필요)
+    python tools/stub_nutrition_api.py record 감자 계란 마요네즈 --out fixtures/nutrition_api.json
+
+    # 실행 중 설정 변경 / 통계 조회
+    curl -X POST http://127.0.0.1:8081/_stub/config -d '{"latency_ms": 300, "result_code_rate": 0.1}'
+    curl http://127.0.0.1:8081/_stub/stats
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+# 프로젝트 루트를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.mock_data import MOCK_NUTRITION_DATA
+
+# 실제 API의 결과 코드/메시지
+RESULT_MESSAGES = {
+    '00': 'NORMAL SERVICE.',
+    '01': 'APPLICATION_ERROR',
+    '03': 'NODATA_ERROR',
+    '10': 'INVALID_REQUEST_PARAMETER_ERROR',
+    '22': 'LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR',
+    '30': 'SERVICE_KEY_IS_NOT_REGISTERED_ERROR',
+    '99': 'UNKNOWN_ERROR'
+}
+
+
+class FixtureCatalog:
+    """기록된 응답 항목 저장소
+
+    fixture 파일 형식: {검색어: [API 응답 항목, ...]} (검색어별 기록 결과)
+    값이 단일 항목(dict)인 경우 api/mock_data.py와 같은 형식으로 간주합니다.
+    """
+
+    def __init__(self, recorded: Dict[str, Any]):
+        self.recorded: Dict[str, List[Dict[str, Any]]] = {
+            name: items if isinstance(items, list) else [items]
+            for name, items in recorded.items()
+        }
+        unique = {}
+        for items in self.recorded.values():
+            for item in items:
+                unique.setdefault(item.get('foodCd'), item)
+        self.items = sorted(unique.values(), key=lambda item: item.get('foodCd') or '')
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> 'FixtureCatalog':
+        if not path:
+            return cls(MOCK_NUTRITION_DATA)
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def search(self, food_name: Optional[str], food_code: Optional[str]) -> List[Dict[str, Any]]:
+        """검색 조건에 맞는 항목 (기록된 검색어 우선, 없으면 식품명 부분 일치)"""
+        if food_code:
+            items = [item for item in self.items if item.get('foodCd') == food_code]
+        elif food_name:
+            items = self.recorded.get(food_name)
+            if items is None:
+                items = [item for item in self.items if food_name in (item.get('foodNm') or '')]
+        else:
+            items = self.items
+        return items
+
+
+class StubConfig:
+    """지연/에러 주입 설정 (실행 중 /_stub/config로 변경 가능)"""
+
+    FIELDS = ('latency_ms', 'jitter_ms', 'error_rate', 'error_status', 'result_code_rate', 'result_code')
+
+    def __init__(self, args: argparse.Namespace):
+        self.latency_ms: float = args.latency_ms
+        self.jitter_ms: float = args.jitter_ms
+        self.error_rate: float = args.error_rate
+        self.error_status: int = args.error_status
+        self.result_code_rate: float = args.result_code_rate
+        self.result_code: str = args.result_code
+        self.service_key: Optional[str] = args.service_key
+        self.random = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {'requests': 0, 'http_errors': 0, 'injected_result_codes': 0, 'no_data': 0}
+
+    def update(self, values: Dict[str, Any]):
+        with self.lock:
+            for key in self.FIELDS:
+                if key in values:
+                    setattr(self, key, type(getattr(self, key))(values[key]))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def draw(self) -> Dict[str, Any]:
+        """요청 한 건에 적용할 지연과 주입 여부"""
+        with self.lock:
+            delay = max(0.0, self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000.0
+            http_error = self.random.random() < self.error_rate
+            result_code = self.result_code if self.random.random() < self.result_code_rate else None
+        return {'delay': delay, 'http_error': http_error, 'result_code': result_code}
+
+
+def build_response(result_code: str, items: List[Dict[str, Any]], page_no: int, num_rows: int, total: int) -> Dict[str, Any]:
+    return {
+        'response': {
+            'header': {
+                'resultCode': result_code,
+                'resultMsg': RESULT_MESSAGES.get(result_code, 'UNKNOWN_ERROR')
+            },
+            'body': {
+                'items': items,
+                'totalCount': total,
+                'pageNo': page_no,
+                'numOfRows': num_rows
+            }
+        }
+    }
+
+
+def make_handler(catalog: FixtureCatalog, config: StubConfig, quiet: bool = False):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+        def _send_json(self, status: int, payload: Dict[str, Any]):
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json;charset=UTF-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/_stub/config':
+                self._send_json(404, {'error': 'not found'})
+                return
+            length = int(self.headers.get('Content-Length', '0'))
+            try:
+                config.update(json.loads(self.rfile.read(length) or b'{}'))
+            except (ValueError, TypeError) as e:
+                self._send_json(400, {'error': str(e)})
+                return
+            self._send_json(200, config.as_dict())
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path == '/_stub/stats':
+                self._send_json(200, {'config': config.as_dict(), 'stats': dict(config.stats)})
+                return
+
+            config.count('requests')
+            params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+            fault = config.draw()
+            if fault['delay']:
+                time.sleep(fault['delay'])
+
+            if fault['http_error']:
+                config.count('http_errors')
+                self._send_json(config.error_status, {'error': 'injected failure'})
+                return
+
+            try:
+                page_no = max(1, int(params.get('pageNo', '1')))
+                num_rows = max(1, int(params.get('numOfRows', '10')))
+            except ValueError:
+                self._send_json(200, build_response('10', [], 1, 0, 0))
+                return
+
+            if config.service_key and params.get('serviceKey') != config.service_key:
+                self._send_json(200, build_response('30', [], page_no, num_rows, 0))
+                return
+
+            if fault['result_code']:
+                config.count('injected_result_codes')
+                self._send_json(200, build_response(fault['result_code'], [], page_no, num_rows, 0))
+                return
+
+            items = catalog.search(params.get('foodNm'), params.get('foodCd'))
+            page = items[(page_no - 1) * num_rows:page_no * num_rows]
+            if not page:
+                config.count('no_data')
+                self._send_json(200, build_response('03', [], page_no, num_rows, len(items)))
+                return
+            self._send_json(200, build_response('00', page, page_no, num_rows, len(items)))
+
+    return StubHandler
+
+
+def serve(args: argparse.Namespace):
+    catalog = FixtureCatalog.load(args.fixtures)
+    config = StubConfig(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(catalog, config, args.quiet))
+    print(f"🧪 영양성분 API 대역 서버: http://{args.host}:{args.port} (항목 {len(catalog.items)}개)")
+    print(f"   설정: {config.as_dict()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def record(args: argparse.Namespace):
+    """실제 API 응답을 검색어별로 기록 (기존 fixture에 병합)"""
+    from api.nutrition_client import NutritionAPIClient
+
+    client = NutritionAPIClient(use_mock=False)
+    recorded: Dict[str, Any] = {}
+    if os.path.exists(args.out):
+        with open(args.out, 'r', encoding='utf-8') as f:
+            recorded = json.load(f)
+
+    for food_name in args.names:
+        response = client.search_food_by_name(food_name, num_rows=args.num_rows)
+        items = client.extract_nutrition_data(response)
+        recorded[food_name] = items
+        print(f"  - {food_name}: {len(items)}건")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(recorded, f, ensure_ascii=False, indent=2)
+    print(f"✅ {len(args.names)}개 검색어 기록 → {args.out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영양성분 API 로컬 대역 서버")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help="기록된 응답 재생 서버 실행")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8081)
+    serve_parser.add_argument('--fixtures', help="기록된 응답 파일 (미지정 시 api/mock_data.py)")
+    serve_parser.add_argument('--latency-ms', type=float, default=0.0, help="응답 지연")
+    serve_parser.add_argument('--jitter-ms', type=float, default=0.0, help="지연 편차 (±)")
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help="HTTP 에러 응답 비율 (0-1)")
+    serve_parser.add_argument('--error-status', type=int, default=500, help="주입할 HTTP 상태 코드")
+    serve_parser.add_argument('--result-code-rate', type=float, default=0.0, help="에러 resultCode 응답 비율 (0-1)")
+    serve_parser.add_argument('--result-code', default='22', help="주입할 resultCode (기본 22: 요청 한도 초과)")
+    serve_parser.add_argument('--service-key', help="지정 시 serviceKey가 다르면 resultCode 30 응답")
+    serve_parser.add_argument('--seed', type=int, help="지연/에러 주입 난수 시드")
+    serve_parser.add_argument('--quiet', action='store_true', help="요청 로그 생략")
+
+    record_parser = commands.add_parser('record', help="실제 API 응답 기록")
+    record_parser.add_argument('names', nargs='+', help="기록할 검색어")
+    record_parser.add_argument('--out', required=True, help="fixture 파일 경로")
+    record_parser.add_argument('--num-rows', type=int, default=10)
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        serve(args)
+    else:
+        record(args)
+
+
+if __name__ == "__main__":
+    main()
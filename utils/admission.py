@@ -0,0 +1,234 @@
+"""
+요청 수용 제어(admission control) 미들웨어
+
+엔드포인트를 우선순위 클래스로 분류하고 클래스별 동시 처리 수와 대기열 길이를 제한합니다.
+캐시 기반의 가벼운 조회(read)는 공공데이터 API를 호출할 수 있는 계산(compute)과 별도
+슬롯을 사용하므로 계산 요청이 몰려도 대기하지 않습니다. 예상 대기 시간이 클래스의
+지연 예산을 넘거나 대기열이 가득 차면 즉시 503과 Retry-After를 반환합니다.
+
+클래스:
+    exempt  - 헬스체크, 문서, 디버그 (제한 없음)
+    read    - GET /foods, GET /servings, GET /meal-plans, GET /jobs
+    compute - 그 외 (영양성분 계산, 재료 조회, 목표 영양소 검색 등)
+
+환경변수:
+    ADMISSION_CONTROL_ENABLED: 사용 여부 (기본 false)
+    ADMISSION_<CLASS>_CONCURRENCY: 클래스별 동시 처리 수 (read 64, compute 8)
+    ADMISSION_<CLASS>_QUEUE: 클래스별 최대 대기 요청 수 (read 256, compute 32)
+    ADMISSION_<CLASS>_BUDGET_MS: 클래스별 최대 대기 시간 (read 1000, compute 2000)
+"""
+
+import os
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 제한 없이 통과시키는 경로 접두어
+EXEMPT_PREFIXES = ('/health', '/docs', '/redoc', '/openapi.json', '/debug')
+
+# GET 요청을 read 클래스로 분류하는 경로 접두어 (캐시/메모리 조회만 수행)
+READ_PREFIXES = ('/foods', '/servings', '/meal-plans', '/jobs')
+
+# 클래스별 기본 설정 (동시 처리 수, 대기열 길이, 지연 예산 ms)
+DEFAULT_LIMITS = {
+    'read': (64, 256, 1000.0),
+    'compute': (8, 32, 2000.0)
+}
+
+# 처리 시간 이동 평균 가중치
+EWMA_ALPHA = 0.2
+
+
+def classify_request(method: str, path: str) -> str:
+    """요청 경로를 우선순위 클래스로 분류"""
+    if path == '/' or path.startswith(EXEMPT_PREFIXES):
+        return 'exempt'
+    if method in ('GET', 'HEAD') and path.startswith(READ_PREFIXES):
+        return 'read'
+    return 'compute'
+
+
+class RequestShed(Exception):
+    """수용 거부 (reason: queue_full, latency_budget, timeout)"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ClassLimiter:
+    """클래스 단위 동시 처리 슬롯과 FIFO 대기열
+
+    슬롯 반환 시 대기 중인 요청에 슬롯을 직접 넘기므로 새로 도착한 요청이
+    대기열을 앞지르지 않습니다. 이벤트 루프 스레드에서만 사용합니다.
+    """
+
+    def __init__(self, name: str, concurrency: int, max_queue: int, budget_ms: float):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.max_queue = max(0, max_queue)
+        self.budget_ms = budget_ms
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.service_ms = 0.0
+        self.wait_ms = 0.0
+        self.admitted = 0
+        self.queued = 0
+        self.shed: Dict[str, int] = {'queue_full': 0, 'latency_budget': 0, 'timeout': 0}
+
+    def estimated_wait_ms(self, position: int) -> float:
+        """대기열 position번째 요청의 예상 대기 시간 (처리 시간 이동 평균 기준)"""
+        return position / self.concurrency * self.service_ms
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait_ms(len(self.waiters) + 1) / 1000))
+
+    def _reject(self, reason: str):
+        self.shed[reason] += 1
+        raise RequestShed(reason, self._retry_after())
+
+    async def acquire(self):
+        if self.active < self.concurrency and not self.waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+
+        if len(self.waiters) >= self.max_queue:
+            self._reject('queue_full')
+        if self.estimated_wait_ms(len(self.waiters) + 1) > self.budget_ms:
+            self._reject('latency_budget')
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append(future)
+        self.queued += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.wait({future}, timeout=self.budget_ms / 1000)
+        except asyncio.CancelledError:
+            # 대기 중 연결이 끊긴 경우 (이미 슬롯을 넘겨받았다면 다음 요청에 전달)
+            if future.done():
+                self._hand_off()
+            else:
+                self._leave(future)
+            raise
+        if not future.done():
+            self._leave(future)
+            self._reject('timeout')
+
+        waited = (time.perf_counter() - start) * 1000
+        self.wait_ms += EWMA_ALPHA * (waited - self.wait_ms)
+        self.admitted += 1
+
+    def _leave(self, future: asyncio.Future):
+        future.cancel()
+        self.waiters.remove(future)
+
+    def release(self, elapsed_ms: float):
+        self.service_ms += EWMA_ALPHA * (elapsed_ms - self.service_ms)
+        self._hand_off()
+
+    def _hand_off(self):
+        while self.waiters:
+            future = self.waiters.popleft()
+            if not future.done():
+                # 슬롯을 그대로 넘기므로 active는 유지
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'concurrency': self.concurrency,
+            'max_queue': self.max_queue,
+            'budget_ms': self.budget_ms,
+            'active': self.active,
+            'queue_depth': len(self.waiters),
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'shed': dict(self.shed),
+            'avg_service_ms': round(self.service_ms, 3),
+            'avg_queue_wait_ms': round(self.wait_ms, 3)
+        }
+
+
+class AdmissionController:
+    """클래스별 제한기 묶음"""
+
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None):
+        limits = limits or DEFAULT_LIMITS
+        self.limiters: Dict[str, ClassLimiter] = {
+            name: ClassLimiter(name, *values) for name, values in limits.items()
+        }
+
+    def limiter_for(self, method: str, path: str) -> Optional[ClassLimiter]:
+        return self.limiters.get(classify_request(method, path))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {name: limiter.metrics() for name, limiter in self.limiters.items()}
+
+
+class AdmissionMiddleware:
+    """요청 수용 제어 ASGI 미들웨어"""
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.limiter_for(scope['method'], scope['path'])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except RequestShed as shed:
+            logger.warning(f"요청 거부 ({limiter.name}/{shed.reason}): {scope['method']} {scope['path']}")
+            await _send_overloaded(send, shed)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release((time.perf_counter() - start) * 1000)
+
+
+async def _send_overloaded(send, shed: RequestShed):
+    body = ('{"error":"서버가 혼잡합니다. 잠시 후 다시 시도해주세요.","reason":"%s"}' % shed.reason).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': 503,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('ascii')),
+            (b'retry-after', str(shed.retry_after).encode('ascii'))
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def create_admission_controller() -> Optional[AdmissionController]:
+    """환경변수 설정에 따른 제어기 생성 (비활성화 시 None)"""
+    if os.getenv('ADMISSION_CONTROL_ENABLED', 'false').lower() != 'true':
+        return None
+    limits = {}
+    for name, (concurrency, max_queue, budget_ms) in DEFAULT_LIMITS.items():
+        prefix = f"ADMISSION_{name.upper()}_"
+        limits[name] = (
+            int(os.getenv(prefix + 'CONCURRENCY', str(concurrency))),
+            int(os.getenv(prefix + 'QUEUE', str(max_queue))),
+            float(os.getenv(prefix + 'BUDGET_MS', str(budget_ms)))
+        )
+    logger.info(f"요청 수용 제어 활성화: {limits}")
+    return AdmissionController(limits)
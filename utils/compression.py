@@ -0,0 +1,200 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding 협상으로 brotli(설치된 경우) 또는 gzip을 선택하고,
+본문이 최소 크기 이상인 응답만 압축합니다. 스트리밍 응답은 버퍼링하지 않고
+청크마다 압축해 바로 전송합니다. 이미 인코딩된 응답과 압축 효과가 없는
+형식(이미지 등)은 그대로 전달합니다.
+
+환경변수:
+    COMPRESSION_ENABLED: 압축 사용 여부 (기본 true)
+    COMPRESSION_MIN_SIZE: 압축 최소 본문 크기 bytes (기본 500)
+    GZIP_LEVEL: gzip 압축 레벨 1-9 (기본 6)
+    BROTLI_QUALITY: brotli 품질 0-11 (기본 4)
+"""
+
+import os
+import gzip
+import zlib
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 압축 대상 Content-Type 접두어
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'application/xml')
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값}으로 변환"""
+    encodings = {}
+    for part in header.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, params = part.partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[name.strip().lower()] = q
+    return encodings
+
+
+def choose_encoding(header: str, brotli_available: bool) -> Optional[str]:
+    """클라이언트가 허용하는 인코딩 중 서버 우선순위(br > gzip)로 선택"""
+    encodings = parse_accept_encoding(header)
+    wildcard = encodings.get('*', 0.0)
+    candidates = ['br', 'gzip'] if brotli_available else ['gzip']
+    best, best_q = None, 0.0
+    for name in candidates:
+        q = encodings.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class StreamingCompressor:
+    """스트리밍 응답용 점진 압축기 (청크마다 flush해 받은 만큼 바로 풀 수 있음)"""
+
+    def __init__(self, encoding: str, gzip_level: int = 6, brotli_quality: int = 4):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits 16 + MAX_WBITS: gzip 헤더/트레일러
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == 'br':
+            return self._brotli.process(data) + (self._brotli.finish() if final else self._brotli.flush())
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """ASGI 응답 압축 미들웨어
+
+    한 번에 전송되는 응답(JSON API 응답 등)은 크기를 확인해 압축하고, 여러 번에 나눠
+    전송되는 스트리밍 응답은 버퍼링하지 않고 청크마다 압축해 바로 전달합니다.
+    압축 대상 형식의 응답에는 압축 여부와 관계없이 Vary: Accept-Encoding을 붙입니다.
+    """
+
+    def __init__(self, app, minimum_size: int = 500, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        accept = ''
+        for key, value in scope.get('headers', []):
+            if key == b'accept-encoding':
+                accept = value.decode('latin-1')
+                break
+
+        encoding = choose_encoding(accept, brotli is not None) if accept else None
+        await self.app(scope, receive, self._wrap_send(send, encoding))
+
+    def _wrap_send(self, send: Callable, encoding: Optional[str]) -> Callable:
+        start_message: Optional[dict] = None
+        compressor: Optional[StreamingCompressor] = None
+        passthrough = False
+
+        async def wrapped_send(message):
+            nonlocal start_message, compressor, passthrough
+
+            if message['type'] == 'http.response.start':
+                headers = message.get('headers', [])
+                content_type = _header(headers, b'content-type') or ''
+                if _header(headers, b'content-encoding') or not content_type.startswith(COMPRESSIBLE_TYPES):
+                    passthrough = True
+                    await send(message)
+                elif encoding is None:
+                    # 압축하지 않아도 캐시가 다른 Accept-Encoding 요청에 재사용하지 않도록 표시
+                    passthrough = True
+                    await send({**message, 'headers': _with_vary(headers)})
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            headers = _with_vary([(k, v) for k, v in start_message.get('headers', []) if k != b'content-length'])
+
+            if compressor is None and more_body:
+                # 스트리밍 응답: 본문 길이를 알 수 없으므로 content-length 없이 청크마다 압축해 전송
+                compressor = StreamingCompressor(encoding, self.gzip_level, self.brotli_quality)
+                headers.append((b'content-encoding', encoding.encode('ascii')))
+                await send({**start_message, 'headers': headers})
+            if compressor is not None:
+                await send({
+                    'type': 'http.response.body',
+                    'body': compressor.compress(body, final=not more_body),
+                    'more_body': more_body
+                })
+                return
+
+            if len(body) >= self.minimum_size:
+                body = compress(body, encoding, self.gzip_level, self.brotli_quality)
+                headers.append((b'content-encoding', encoding.encode('ascii')))
+
+            headers.append((b'content-length', str(len(body)).encode('ascii')))
+            await send({**start_message, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': body})
+
+        return wrapped_send
+
+
+def _with_vary(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    """Vary 헤더에 Accept-Encoding 추가 (기존 Vary 값은 유지)"""
+    vary = _header(headers, b'vary')
+    if vary is None:
+        return list(headers) + [(b'vary', b'Accept-Encoding')]
+    if 'accept-encoding' in vary.lower():
+        return list(headers)
+    return [
+        (k, f"{vary}, Accept-Encoding".encode('latin-1') if k.lower() == b'vary' else v)
+        for k, v in headers
+    ]
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode('latin-1')
+    return None
+
+
+def compression_settings() -> Dict[str, int]:
+    """환경변수 기반 미들웨어 설정"""
+    return {
+        'minimum_size': int(os.getenv('COMPRESSION_MIN_SIZE', '500')),
+        'gzip_level': int(os.getenv('GZIP_LEVEL', '6')),
+        'brotli_quality': int(os.getenv('BROTLI_QUALITY', '4'))
+    }
+
+
+def compression_enabled() -> bool:
+    return os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
@@ -0,0 +1,216 @@
+"""
+CPU 집약 계산용 프로세스 풀
+
+유사 재료 검색, 레시피 최적화처럼 순수 파이썬으로 계산량이 큰 작업을 별도 프로세스에서
+실행해 요청 처리 스레드와 이벤트 루프가 GIL을 기다리지 않도록 합니다.
+
+- 재료 벡터처럼 여러 작업이 함께 읽는 데이터는 SharedArray로 공유 메모리에 한 번만 기록하고,
+  작업에는 (이름, 행 수, 열 수) 핸들만 전달합니다 (작업마다 피클링하지 않음).
+- map_chunks()는 작업 종류별 행당 처리 시간(이동 평균)으로 청크 크기를 정해 청크 하나가
+  COMPUTE_POOL_TASK_MS 정도 걸리도록 나누고, 전체 예상 시간이 그보다 짧으면 현재 스레드에서
+  바로 계산합니다.
+
+환경변수:
+    COMPUTE_POOL_WORKERS: 작업 프로세스 수 (기본 0: 사용 안 함, 요청 스레드에서 직접 계산)
+    COMPUTE_POOL_START_METHOD: 프로세스 시작 방식 (기본: 지원 시 fork, 아니면 spawn)
+    COMPUTE_POOL_TASK_MS: 청크 하나의 목표 처리 시간 (기본 20)
+"""
+
+import os
+import math
+import time
+import logging
+import threading
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 공유 배열 핸들: (공유 메모리 이름, 행 수, 열 수)
+Handle = Tuple[str, int, int]
+
+# 처리 시간 이동 평균 가중치
+EWMA_ALPHA = 0.2
+
+# 작업 프로세스에서 연결해 둔 공유 배열 (인덱스 재생성 직후 이전/새 배열이 함께 쓰일 수 있어 2개까지 유지)
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, memoryview]] = {}
+MAX_ATTACHED = 2
+
+
+class SharedArray:
+    """float64 행렬을 공유 메모리에 행 우선으로 기록 (생성한 프로세스가 close()로 해제)"""
+
+    def __init__(self, rows: Sequence[Sequence[float]], cols: int):
+        flat = array('d')
+        for row in rows:
+            flat.extend(row)
+        self.rows = len(rows)
+        self.cols = cols
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(flat) * flat.itemsize, 1))
+        self._shm.buf[:len(flat) * flat.itemsize] = flat.tobytes()
+        self._closed = False
+
+    @property
+    def handle(self) -> Handle:
+        return self._shm.name, self.rows, self.cols
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def attach(handle: Handle) -> memoryview:
+    """작업 프로세스에서 공유 배열 연결 (프로세스별로 한 번만 연결)"""
+    name = handle[0]
+    entry = _attached.get(name)
+    if entry is None:
+        while len(_attached) >= MAX_ATTACHED:
+            old_shm, old_view = _attached.pop(next(iter(_attached)))
+            old_view.release()
+            old_shm.close()
+        shm = shared_memory.SharedMemory(name=name)
+        entry = (shm, shm.buf.cast('d'))
+        _attached[name] = entry
+    return entry[1]
+
+
+def iter_rows(handle: Handle, start: int, stop: int) -> Iterator[memoryview]:
+    """공유 배열의 [start, stop) 행을 복사 없이 순회 (행마다 float 메모리뷰)"""
+    view = attach(handle)
+    cols = handle[2]
+    return (view[i * cols:(i + 1) * cols] for i in range(start, stop))
+
+
+def _timed(fn: Callable[..., Any], *args) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _noop(_=None):
+    return os.getpid()
+
+
+class ComputePool:
+    """CPU 집약 작업용 프로세스 풀과 적응형 청크 분할"""
+
+    def __init__(self, workers: int, start_method: Optional[str] = None, task_ms: float = 20.0):
+        self.workers = max(1, workers)
+        self.task_ms = task_ms
+        self.start_method = start_method or (
+            'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        )
+        # 작업 프로세스가 공유 메모리 추적 프로세스를 함께 쓰도록 먼저 시작
+        # (각자 시작하면 작업 프로세스 종료 시 공유 배열이 해제됨)
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context(self.start_method)
+        )
+        # 작업 종류별 행당 처리 시간 (ms, 이동 평균)
+        self._row_cost: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.pooled_tasks = 0
+        self.inline_runs = 0
+
+    def start(self):
+        """작업 프로세스를 미리 시작 (fork 방식은 요청 처리 스레드가 생기기 전에 호출)"""
+        list(self._executor.map(_noop, range(self.workers)))
+        logger.info(f"계산 프로세스 풀 시작: {self.workers}개 ({self.start_method})")
+
+    def run(self, fn: Callable[..., Any], *args) -> Any:
+        """함수 하나를 작업 프로세스에서 실행하고 결과를 기다림 (인자와 결과는 피클링 가능해야 함)"""
+        with self._lock:
+            self.pooled_tasks += 1
+        return self._executor.submit(fn, *args).result()
+
+    def chunk_size(self, kind: str, total: int) -> Optional[int]:
+        """청크 크기 (전체 예상 시간이 목표 청크 시간보다 짧으면 None: 직접 계산)"""
+        cost = self._row_cost.get(kind)
+        if cost is None:
+            # 처음에는 작업 프로세스마다 4개씩 나눠 처리 시간 측정
+            return max(1, math.ceil(total / (self.workers * 4)))
+        if total * cost < self.task_ms:
+            return None
+        size = max(1, int(self.task_ms / cost)) if cost > 0 else total
+        return min(size, math.ceil(total / self.workers))
+
+    def _record(self, kind: str, elapsed_ms: float, rows: int):
+        if rows <= 0:
+            return
+        cost = elapsed_ms / rows
+        with self._lock:
+            previous = self._row_cost.get(kind)
+            self._row_cost[kind] = cost if previous is None else previous + EWMA_ALPHA * (cost - previous)
+
+    def map_chunks(
+        self,
+        kind: str,
+        total: int,
+        fn: Callable[..., Any],
+        args: tuple = (),
+        inline: Optional[Callable[[int, int], Any]] = None
+    ) -> List[Any]:
+        """[0, total) 구간을 청크로 나눠 fn(start, stop, *args)를 작업 프로세스에서 실행
+
+        Args:
+            kind: 처리 시간 통계를 구분하는 작업 종류
+            fn: 모듈 최상위 함수 (공유 데이터는 args의 SharedArray 핸들로 전달)
+            inline: 작업량이 작을 때 현재 프로세스에서 실행할 함수 (start, stop)
+
+        Returns:
+            청크 순서대로 정렬된 결과 리스트
+        """
+        size = self.chunk_size(kind, total)
+        if size is None and inline is not None:
+            with self._lock:
+                self.inline_runs += 1
+            result, elapsed = _timed(inline, 0, total)
+            self._record(kind, elapsed, total)
+            return [result]
+
+        size = size or total
+        bounds = [(start, min(start + size, total)) for start in range(0, total, size)]
+        futures = [self._executor.submit(_timed, fn, start, stop, *args) for start, stop in bounds]
+        with self._lock:
+            self.pooled_tasks += len(futures)
+
+        results = []
+        for future, (start, stop) in zip(futures, bounds):
+            result, elapsed = future.result()
+            self._record(kind, elapsed, stop - start)
+            results.append(result)
+        return results
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'start_method': self.start_method,
+            'task_ms': self.task_ms,
+            'pooled_tasks': self.pooled_tasks,
+            'inline_runs': self.inline_runs,
+            'row_cost_ms': {kind: round(cost, 6) for kind, cost in self._row_cost.items()}
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def create_compute_pool() -> Optional[ComputePool]:
+    """환경변수 설정에 따른 프로세스 풀 생성 (COMPUTE_POOL_WORKERS=0이면 None)"""
+    workers = int(os.getenv('COMPUTE_POOL_WORKERS', '0'))
+    if workers <= 0:
+        return None
+    return ComputePool(
+        workers,
+        start_method=os.getenv('COMPUTE_POOL_START_METHOD') or None,
+        task_ms=float(os.getenv('COMPUTE_POOL_TASK_MS', '20'))
+    )
@@ -0,0 +1,82 @@
+"""
+요청 기한(deadline) 전파
+
+요청마다 절대 기한(monotonic)을 contextvar에 저장하고, 계산 서비스와 공공데이터 API
+클라이언트가 남은 시간을 조회해 업스트림 타임아웃을 줄이거나 추가 조회를 건너뜁니다.
+기한은 X-Request-Deadline-Ms 헤더(요청 시점부터 남은 ms)로 지정하거나 엔드포인트별
+기본값을 사용합니다. 기한이 없으면 기존 동작(REQUEST_TIMEOUT)과 동일합니다.
+
+환경변수:
+    REQUEST_DEADLINE_MS: 계산/재료 조회 엔드포인트 기본 기한 (기본 8000, 0이면 없음)
+    REQUEST_DEADLINE_MAX_MS: 헤더로 지정할 수 있는 최대 기한 (기본 60000)
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+DEADLINE_HEADER = 'X-Request-Deadline-Ms'
+
+# 기본 기한 (프론트엔드 axios 타임아웃 10초보다 짧게) 및 헤더 지정 상한 (ms)
+DEFAULT_DEADLINE_MS = float(os.getenv('REQUEST_DEADLINE_MS', '8000'))
+MAX_DEADLINE_MS = float(os.getenv('REQUEST_DEADLINE_MAX_MS', '60000'))
+
+_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """요청 기한 초과"""
+
+
+def set_deadline(timeout_ms: Optional[float]) -> Optional[float]:
+    """현재 컨텍스트의 기한을 지금부터 timeout_ms 후로 설정 (None 또는 0 이하면 해제)"""
+    deadline = time.monotonic() + timeout_ms / 1000 if timeout_ms and timeout_ms > 0 else None
+    _deadline.set(deadline)
+    return deadline
+
+
+def remaining() -> Optional[float]:
+    """남은 시간(초), 기한이 없으면 None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def bounded_timeout(timeout: float) -> float:
+    """업스트림 요청 타임아웃을 남은 기한 이내로 제한
+
+    Raises:
+        DeadlineExceeded: 이미 기한이 지난 경우
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("요청 기한이 지났습니다.")
+    return min(timeout, left)
+
+
+def request_deadline(default_ms: float = DEFAULT_DEADLINE_MS):
+    """엔드포인트 의존성: 헤더 또는 엔드포인트 기본값으로 요청 기한 설정
+
+    비동기 의존성은 엔드포인트와 같은 태스크에서 실행되므로 설정한 기한이
+    엔드포인트 및 run_in_threadpool로 넘긴 작업까지 전달됩니다.
+
+    사용 예:
+        @app.post("/calculate-nutrition", dependencies=[Depends(request_deadline())])
+    """
+    async def dependency(deadline_ms: Optional[float] = Header(None, alias=DEADLINE_HEADER)):
+        if deadline_ms is not None and deadline_ms <= 0:
+            raise HTTPException(status_code=400, detail=f"{DEADLINE_HEADER}는 0보다 커야 합니다.")
+        set_deadline(min(deadline_ms, MAX_DEADLINE_MS) if deadline_ms is not None else default_ms)
+
+    return dependency
@@ -0,0 +1,162 @@
+"""
+샘플링 CPU 프로파일러
+
+별도 스레드가 일정 간격으로 대상 스레드의 호출 스택(sys._current_frames)을 수집하고,
+flamegraph.pl / speedscope에서 바로 읽을 수 있는 collapsed stack 형식
+(`프레임;프레임;프레임 샘플수`)으로 출력합니다.
+
+PROFILING_ENABLED=true일 때만 main.py에서 미들웨어와 디버그 엔드포인트가 동작하며,
+비활성화 시 미들웨어가 등록되지 않으므로 요청 처리에 추가 비용이 없습니다.
+
+환경변수:
+    PROFILING_ENABLED: 프로파일링 활성화 여부 (기본 false)
+    PROFILING_TOKEN: 관리자 토큰 (X-Profile-Token 헤더와 일치해야 함, 미설정 시 거부, /jobs에도 사용)
+    PROFILING_INTERVAL_MS: 샘플링 간격 ms (기본 5)
+    PROFILING_MAX_SECONDS: /debug/profile 최대 수집 시간 (기본 60)
+    PROFILE_DIR: 요청 프로파일 저장 경로 (기본 profiles)
+"""
+
+import os
+import sys
+import time
+import uuid
+import hmac
+import logging
+import threading
+from collections import Counter
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 소스 경로 (요청 프로파일에서 유휴 스택 제외용)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _frame_label(code) -> str:
+    """스택 프레임 표기 (collapsed 형식 구분자 ';' 제거)"""
+    filename = code.co_filename
+    if filename.startswith(PROJECT_ROOT):
+        filename = os.path.relpath(filename, PROJECT_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(';', ',')
+
+
+def _is_project_file(filename: str) -> bool:
+    return filename.startswith(PROJECT_ROOT) and 'site-packages' not in filename
+
+
+class StackSampler:
+    """주기적 스택 샘플링 프로파일러
+
+    Args:
+        thread_ids: 수집 대상 스레드 (None이면 샘플러 외 전체 스레드)
+        project_only: 프로젝트 코드가 포함된 스택만 수집 (유휴 대기 스택 제외)
+        interval: 샘플링 간격(초)
+    """
+
+    def __init__(self, thread_ids: Optional[Iterable[int]] = None, project_only: bool = False, interval: float = 0.005):
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.project_only = project_only
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.sample_count = 0
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._waiting_thread: Optional[int] = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> 'StackSampler':
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+        return self
+
+    def run_for(self, seconds: float) -> 'StackSampler':
+        """지정 시간 동안 수집 (대기 중인 호출 스레드는 제외)"""
+        self._waiting_thread = threading.get_ident()
+        self.start()
+        self._stop.wait(seconds)
+        return self.stop()
+
+    def _run(self):
+        excluded = {threading.get_ident(), self._waiting_thread}
+        while not self._stop.wait(self.interval):
+            self.sample_count += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in excluded or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                self._record(frame)
+
+    def _record(self, frame):
+        labels = []
+        in_project = False
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == __file__:
+                frame = frame.f_back
+                continue
+            in_project = in_project or _is_project_file(code.co_filename)
+            labels.append(_frame_label(code))
+            frame = frame.f_back
+
+        if labels and (in_project or not self.project_only):
+            self.stacks[';'.join(reversed(labels))] += 1
+
+    def collapsed(self) -> str:
+        """collapsed stack 형식 출력 (샘플 수 내림차순)"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfilingSettings:
+    """프로파일링 설정 (환경변수)"""
+
+    def __init__(self):
+        self.enabled = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+        self.token = os.getenv('PROFILING_TOKEN', '')
+        self.interval = float(os.getenv('PROFILING_INTERVAL_MS', '5')) / 1000.0
+        self.max_seconds = float(os.getenv('PROFILING_MAX_SECONDS', '60'))
+        self.profile_dir = os.getenv('PROFILE_DIR', 'profiles')
+
+        if self.enabled and not self.token:
+            logger.warning("PROFILING_TOKEN이 설정되지 않아 프로파일링 요청이 모두 거부됩니다.")
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+        """프로파일링 요청 권한 확인 (프로파일링 활성화 + 관리자 토큰 일치)"""
+        return self.enabled and self.is_admin(token)
+
+    def is_admin(self, token: Optional[str]) -> bool:
+        """관리자 토큰 확인 (비ASCII 문자가 포함된 토큰도 바이트로 비교, 토큰 미설정 시 거부)"""
+        if not (self.token and token):
+            return False
+        return hmac.compare_digest(token.encode('utf-8'), self.token.encode('utf-8'))
+
+    def save(self, sampler: StackSampler, label: str) -> str:
+        """요청 프로파일을 파일로 저장하고 프로파일 ID 반환"""
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self.profile_dir, exist_ok=True)
+        path = os.path.join(self.profile_dir, f"{profile_id}.folded")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(sampler.collapsed())
+        logger.info(f"요청 프로파일 저장: {label} → {path} ({sampler.sample_count}회 샘플링)")
+        return profile_id
+
+    def load(self, profile_id: str) -> Optional[str]:
+        """저장된 프로파일 조회"""
+        if not profile_id.replace('-', '').isalnum():
+            return None
+        path = os.path.join(self.profile_dir, f"{profile_id}.folded")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+
+profiling = ProfilingSettings()
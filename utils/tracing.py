@@ -0,0 +1,240 @@
+"""
+요청 추적(트레이싱) 유틸리티
+
+TRACING_ENABLED=true일 때만 스팬을 기록하며, 비활성화 시 no-op 스팬을 반환합니다.
+기본 구현은 OpenTelemetry 스팬과 같은 형식(trace_id, span_id, parent_id,
+attributes, status, events)을 콘솔 또는 JSON Lines 파일로 내보내고,
+TRACE_BACKEND=opentelemetry이며 opentelemetry-sdk가 설치된 경우 해당 SDK를 사용합니다.
+
+환경변수:
+    TRACING_ENABLED: 트레이싱 활성화 여부 (기본 false)
+    TRACE_BACKEND: builtin 또는 opentelemetry (기본 builtin)
+    TRACE_EXPORTER: console 또는 file (기본 console)
+    TRACE_FILE: file 익스포터 출력 경로 (기본 traces.jsonl)
+    TRACE_SAMPLE_RATIO: 루트 스팬 샘플링 비율 0-1 (기본 1.0)
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _NoopSpan:
+    """기록하지 않는 스팬 (트레이싱 비활성화 또는 샘플링 제외)"""
+
+    recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        pass
+
+    def record_exception(self, exc: BaseException):
+        pass
+
+    def set_error(self, description: str):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """기본 트레이서 스팬"""
+
+    recording = True
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Optional[Dict[str, Any]]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = '%016x' % random.getrandbits(64)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status = 'UNSET'
+        self.status_description: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.events.append({'name': name, 'timestamp': time.time_ns(), 'attributes': attributes or {}})
+
+    def record_exception(self, exc: BaseException):
+        self.add_event('exception', {
+            'exception.type': type(exc).__name__,
+            'exception.message': str(exc)
+        })
+        self.set_error(str(exc))
+
+    def set_error(self, description: str):
+        self.status = 'ERROR'
+        self.status_description = description
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'context': {'trace_id': self.trace_id, 'span_id': self.span_id},
+            'parent_id': self.parent_id,
+            'start_time': self.start_ns,
+            'end_time': self.end_ns,
+            'duration_ms': round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            'attributes': self.attributes,
+            'status': {'status_code': self.status, 'description': self.status_description},
+            'events': self.events
+        }
+
+
+class ConsoleSpanExporter:
+    """스팬을 표준 에러로 출력"""
+
+    def export(self, span: Span):
+        sys.stderr.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + '\n')
+
+
+class FileSpanExporter:
+    """스팬을 JSON Lines 파일에 추가"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class _OtelSpanAdapter:
+    """opentelemetry 스팬을 기본 스팬 인터페이스로 감싼 어댑터"""
+
+    recording = True
+
+    def __init__(self, span):
+        self._span = span
+
+    def set_attribute(self, key: str, value: Any):
+        self._span.set_attribute(key, value)
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        self._span.set_attributes(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self._span.add_event(name, attributes or {})
+
+    def record_exception(self, exc: BaseException):
+        self._span.record_exception(exc)
+        self.set_error(str(exc))
+
+    def set_error(self, description: str):
+        from opentelemetry.trace import Status, StatusCode
+        self._span.set_status(Status(StatusCode.ERROR, description))
+
+
+class Tracer:
+    """스팬 생성기"""
+
+    def __init__(self):
+        self.enabled = os.getenv('TRACING_ENABLED', 'false').lower() == 'true'
+        self.sample_ratio = float(os.getenv('TRACE_SAMPLE_RATIO', '1.0'))
+        self._current: ContextVar[Optional[Any]] = ContextVar('current_span', default=None)
+        self._exporter = None
+        self._otel_tracer = None
+
+        if not self.enabled:
+            return
+
+        exporter_name = os.getenv('TRACE_EXPORTER', 'console').lower()
+        trace_file = os.getenv('TRACE_FILE', 'traces.jsonl')
+
+        if os.getenv('TRACE_BACKEND', 'builtin').lower() == 'opentelemetry':
+            self._otel_tracer = self._setup_opentelemetry(exporter_name, trace_file)
+
+        if self._otel_tracer is None:
+            self._exporter = FileSpanExporter(trace_file) if exporter_name == 'file' else ConsoleSpanExporter()
+
+        logger.info(f"트레이싱 활성화: exporter={exporter_name}, sample_ratio={self.sample_ratio}")
+
+    def _setup_opentelemetry(self, exporter_name: str, trace_file: str):
+        """opentelemetry-sdk 설정 (미설치 시 None)"""
+        try:
+            from opentelemetry import trace
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import SimpleSpanProcessor, ConsoleSpanExporter as OtelConsoleExporter
+            from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+        except ImportError:
+            logger.warning("opentelemetry-sdk가 설치되지 않아 기본 트레이서를 사용합니다.")
+            return None
+
+        provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(self.sample_ratio)))
+        out = open(trace_file, 'a', encoding='utf-8') if exporter_name == 'file' else sys.stderr
+        provider.add_span_processor(SimpleSpanProcessor(OtelConsoleExporter(out=out)))
+        trace.set_tracer_provider(provider)
+        return trace.get_tracer('nutrition-calculator')
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """현재 컨텍스트의 하위 스팬 생성
+
+        예외 발생 시 스팬에 기록하고 다시 발생시킵니다.
+        """
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+
+        if self._otel_tracer is not None:
+            with self._otel_tracer.start_as_current_span(name, attributes=attributes) as otel_span:
+                yield _OtelSpanAdapter(otel_span)
+            return
+
+        parent = self._current.get()
+        if parent is NOOP_SPAN or (parent is None and random.random() >= self.sample_ratio):
+            # 샘플링 제외된 트레이스는 하위 스팬도 기록하지 않음
+            token = self._current.set(NOOP_SPAN)
+            try:
+                yield NOOP_SPAN
+            finally:
+                self._current.reset(token)
+            return
+
+        trace_id = parent.trace_id if parent else '%032x' % random.getrandbits(128)
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            self._current.reset(token)
+            try:
+                self._exporter.export(span)
+            except Exception as e:
+                logger.error(f"스팬 내보내기 실패: {e}")
+
+    def current_span(self):
+        """현재 스팬 (없으면 no-op 스팬)"""
+        return self._current.get() or NOOP_SPAN
+
+
+tracer = Tracer()
@@ -0,0 +1,193 @@
+"""
+요청 트래픽 기록 미들웨어
+
+TRAFFIC_RECORD_ENABLED=true일 때 요청 스트림(메소드, 경로, 라우트, 요청 본문, 상태 코드,
+처리 시간, 기록 시작 기준 도착 시각)을 gzip JSON Lines 파일에 기록합니다.
+기록은 일정 간격마다 완결된 gzip 멤버로 이어 붙이므로, 프로세스가 비정상 종료되어도
+마지막 멤버 이전까지는 그대로 읽을 수 있습니다.
+헤더, 클라이언트 주소는 저장하지 않으며 민감한 쿼리 파라미터는 값을 제거합니다.
+기록 파일은 tools/replay_traffic.py로 재생할 수 있습니다.
+
+환경변수:
+    TRAFFIC_RECORD_ENABLED: 기록 여부 (기본 false)
+    TRAFFIC_RECORD_FILE: 기록 파일 경로 (기본 traffic.jsonl.gz)
+    TRAFFIC_RECORD_SAMPLE_RATIO: 기록할 요청 비율 0-1 (기본 1.0)
+    TRAFFIC_RECORD_MAX_BODY: 기록할 최대 요청 본문 크기 bytes (기본 65536)
+    TRAFFIC_RECORD_FLUSH_SECONDS: gzip 멤버를 마무리해 파일에 쓰는 간격 (기본 1.0)
+"""
+
+import os
+import gzip
+import json
+import time
+import queue
+import atexit
+import random
+import logging
+import threading
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+# 기록하지 않는 경로 접두어 (문서, 헬스체크, 디버그)
+EXCLUDED_PREFIXES = ('/docs', '/redoc', '/openapi.json', '/health', '/debug')
+
+# 값을 제거할 쿼리 파라미터
+REDACTED_PARAMS = {'servicekey', 'token', 'key', 'password'}
+
+# 쓰기 스레드가 gzip 멤버 하나에 담는 최대 기록 수
+FLUSH_BATCH = 200
+
+
+def anonymise_query(query: str) -> str:
+    """민감한 쿼리 파라미터 값 제거"""
+    if not query:
+        return ''
+    pairs = [
+        (key, '' if key.lower() in REDACTED_PARAMS else value)
+        for key, value in parse_qsl(query, keep_blank_values=True)
+    ]
+    return urlencode(pairs)
+
+
+class TrafficRecorder:
+    """기록 파일 쓰기 (요청 처리 경로는 큐에 넣기만 하고 별도 스레드가 압축/기록)"""
+
+    def __init__(self, path: str, sample_ratio: float = 1.0, max_body: int = 65536, flush_interval: float = 1.0):
+        self.path = path
+        self.sample_ratio = sample_ratio
+        self.max_body = max_body
+        self.flush_interval = flush_interval
+        self.started_at = time.time()
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=10000)
+        self._thread = threading.Thread(target=self._run, name='traffic-recorder', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(f"트래픽 기록 시작: {path} (sample_ratio={sample_ratio})")
+
+    def should_record(self, path: str) -> bool:
+        if path.startswith(EXCLUDED_PREFIXES):
+            return False
+        return self.sample_ratio >= 1.0 or random.random() < self.sample_ratio
+
+    def record(self, entry: Dict[str, Any]):
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        """큐의 기록을 모아 flush_interval 또는 FLUSH_BATCH마다 완결된 gzip 멤버로 추가"""
+        with open(self.path, 'ab') as f:
+            lines = []
+            flush_at = None
+            while True:
+                timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+                try:
+                    entry = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = False
+                if entry is None:
+                    self._write_member(f, lines)
+                    return
+                if entry is not False:
+                    lines.append(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+                    if flush_at is None:
+                        flush_at = time.monotonic() + self.flush_interval
+                if entry is False or len(lines) >= FLUSH_BATCH:
+                    self._write_member(f, lines)
+                    lines = []
+                    flush_at = None
+
+    @staticmethod
+    def _write_member(f, lines):
+        if not lines:
+            return
+        f.write(gzip.compress(''.join(lines).encode('utf-8'), mtime=0))
+        f.flush()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        if self.dropped:
+            logger.warning(f"트래픽 기록 큐 초과로 {self.dropped}건을 기록하지 못했습니다.")
+
+
+class TrafficRecordingMiddleware:
+    """요청 본문과 응답 상태/처리 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app, recorder: TrafficRecorder):
+        self.app = app
+        self.recorder = recorder
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self.recorder.should_record(scope['path']):
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.time()
+        start = time.perf_counter()
+        body = bytearray()
+        status = {'code': None}
+        recorder = self.recorder
+
+        async def recording_receive():
+            message = await receive()
+            if message['type'] == 'http.request' and len(body) <= recorder.max_body:
+                body.extend(message.get('body', b''))
+            return message
+
+        async def recording_send(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, recording_receive, recording_send)
+        finally:
+            recorder.record({
+                't': round(arrived - recorder.started_at, 4),
+                'm': scope['method'],
+                'p': scope['path'],
+                'q': anonymise_query(scope.get('query_string', b'').decode('latin-1')),
+                'r': _route_template(scope),
+                'b': _decode_body(bytes(body), recorder.max_body),
+                's': status['code'] or 500,
+                'd': round((time.perf_counter() - start) * 1000, 3)
+            })
+
+
+def _route_template(scope) -> Optional[str]:
+    """라우팅된 엔드포인트의 경로 템플릿 (예: /calculate-nutrition/{food_name}/{weight})"""
+    endpoint = scope.get('endpoint')
+    if endpoint is None:
+        return None
+    for route in getattr(scope.get('app'), 'routes', []):
+        if getattr(route, 'endpoint', None) is endpoint:
+            return route.path
+    return None
+
+
+def _decode_body(body: bytes, max_body: int) -> Any:
+    """요청 본문을 JSON 값으로 저장 (JSON이 아니거나 너무 크면 None)"""
+    if not body or len(body) > max_body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def create_traffic_recorder() -> Optional[TrafficRecorder]:
+    """환경변수 설정에 따른 기록기 생성 (비활성화 시 None)"""
+    if os.getenv('TRAFFIC_RECORD_ENABLED', 'false').lower() != 'true':
+        return None
+    return TrafficRecorder(
+        os.getenv('TRAFFIC_RECORD_FILE', 'traffic.jsonl.gz'),
+        float(os.getenv('TRAFFIC_RECORD_SAMPLE_RATIO', '1.0')),
+        int(os.getenv('TRAFFIC_RECORD_MAX_BODY', '65536')),
+        float(os.getenv('TRAFFIC_RECORD_FLUSH_SECONDS', '1.0'))
+    )